@@ -77,6 +77,9 @@ def _try_start_ui():
 
 def auto_start_ui_handler(dummy):
     import bpy
+    from .space_config import region_cache
+    region_cache.invalidate()
+    
     wm = bpy.context.window_manager
     if wm.get("xwz_auto_start", False):
         if not bpy.app.timers.is_registered(_try_start_ui):
@@ -89,9 +92,9 @@ def register():
     from .text_input_op import register as txt_input_register
     from .img_op  import register as img_register
     from .panel   import register as panel_register
-    from .hit_op import register as hit_register
+    from .input_op import register as input_register
     
-    hit_register()
+    input_register()
     
     bpy.types.WindowManager.xwz_ui_conf_path = bpy.props.StringProperty(
         name        = "XWZ UI Config Path",
@@ -108,6 +111,12 @@ def register():
         description = "Automatically start XWZ UI on file load",
         default     = False
     )
+    bpy.types.WindowManager.xwz_image_budget_mb = bpy.props.IntProperty(
+        name        = "XWZ Image Budget (MB)",
+        description = "GPU memory for UI image textures; the least recently drawn ones are evicted beyond it",
+        default     = 256,
+        min         = 16
+    )
     
     render_register()
     txt_register()
@@ -126,14 +135,17 @@ def unregister():
     from .text_input_op import unregister as txt_input_unregister
     from .img_op  import unregister as img_unregister
     from .panel   import unregister as panel_unregister
-    from .hit_op import unregister as hit_unregister
+    from .input_op import unregister as input_unregister
     
-    hit_unregister()
+    input_unregister()
     
     if auto_start_ui_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(auto_start_ui_handler)
     if bpy.app.timers.is_registered(_try_start_ui):
         bpy.app.timers.unregister(_try_start_ui)
+    
+    from .space_config import cancel_redraw
+    cancel_redraw()
 
     try:
         from .render import _render_data, _modal_timer
@@ -151,6 +163,7 @@ def unregister():
     del bpy.types.WindowManager.xwz_ui_conf_path
     del bpy.types.WindowManager.xwz_debug_panel
     del bpy.types.WindowManager.xwz_auto_start
+    del bpy.types.WindowManager.xwz_image_budget_mb
 
     panel_unregister()
     img_unregister()
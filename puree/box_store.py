@@ -0,0 +1,298 @@
+# Created by XWZ
+# ◕‿◕ Distributed for free at:
+# https://github.com/nicolaiprodromov/puree
+# ╔═════════════════════════════════╗
+# ║  ██   ██  ██      ██  ████████  ║
+# ║   ██ ██   ██  ██  ██       ██   ║
+# ║    ███    ██  ██  ██     ██     ║
+# ║   ██ ██   ██  ██  ██   ██       ║
+# ║  ██   ██   ████████   ████████  ║
+# ╚═════════════════════════════════╝
+import itertools
+import numpy as np
+
+# Same bits as HitDetector.NODE_*
+PASSIVE    = 1
+DISPLAY    = 2
+OVERFLOW   = 4
+SCROLLABLE = 8
+
+CLIPPING_OVERFLOW = ('HIDDEN', 'SCROLL', 'AUTO')
+SCROLLING_OVERFLOW = ('SCROLL', 'AUTO')
+
+NO_CLIP     = (-np.inf, -np.inf, np.inf, np.inf)
+HIDDEN_CLIP = (0.0, 0.0, 0.0, 0.0)
+
+# Shared by every store, so a version never repeats across stores
+_versions = itertools.count(1)
+
+class BoxStore():
+    """Columnar layout boxes, one (x, y, width, height) row per container.
+
+    Rows follow the pre-order walk of the container tree, which is the same
+    order the native flattener emits, so a container's `_index` addresses its
+    row in every consumer without any id lookups. `parent`, `flags` and
+    `radius` carry the rest of what hit testing needs; `shown` is False for
+    rows in a `display: none` subtree.
+
+    Scrolling never touches the layout. Containers with `overflow: scroll`
+    (or `auto`) own a vertical offset in `scroll`, clamped to
+    `scroll_limit`. `offset` is the translation the offsets of all
+    ancestors apply to a row, `scrolled` the boxes with it applied and
+    `clip` the (min x, min y, max x, max y) rectangle the clipping
+    ancestors leave visible. A container's descendants are the contiguous
+    rows up to `subtree_end`, so a scroll step only rewrites that slice and
+    records it in `scroll_dirty` for the renderer.
+
+    Content that is not laid out (a virtual list's rows) is described by
+    `origin`, where the laid-out children sit in the scrolled content, and
+    `extent`, the content height below the first child (-1 measures the
+    children).
+
+    `version` changes whenever anything `placement` reads may have, so
+    draw code can keep what it derived from a placement until then.
+    """
+    def __init__(self):
+        self.containers   = []
+        self.index        = {}
+        self.relative     = np.zeros((0, 4), dtype=np.float32)
+        self.absolute     = np.zeros((0, 4), dtype=np.float32)
+        self.parent       = np.zeros(0, dtype=np.int32)
+        self.flags        = np.zeros(0, dtype=np.int32)
+        self.radius       = np.zeros(0, dtype=np.float32)
+        self.depth        = np.zeros(0, dtype=np.int32)
+        self.subtree_end  = np.zeros(0, dtype=np.int32)
+        self.clips        = np.zeros(0, dtype=bool)
+        self.scroll       = np.zeros((0, 2), dtype=np.float32)
+        self.scroll_limit = np.zeros(0, dtype=np.float32)
+        self.origin       = np.zeros((0, 2), dtype=np.float32)
+        self.extent       = np.zeros(0, dtype=np.float32)
+        self.offset       = np.zeros((0, 2), dtype=np.float32)
+        self.scrolled     = np.zeros((0, 4), dtype=np.float32)
+        self.clip         = np.zeros((0, 4), dtype=np.float32)
+        self.shown        = np.zeros(0, dtype=bool)
+        self.scroll_dirty = None
+        self.version      = next(_versions)
+
+    def __len__(self):
+        return len(self.containers)
+
+    def allocate(self, root):
+        self.containers = []
+        self.index      = {}
+        self.version    = next(_versions)
+        parents         = []
+        depths          = []
+
+        stack = [(root, -1, 0)]
+        while stack:
+            container, parent_index, depth = stack.pop()
+            container._index = len(self.containers)
+            self.containers.append(container)
+            parents.append(parent_index)
+            depths.append(depth)
+            self.index.setdefault(container.id, container._index)
+            stack.extend((child, container._index, depth + 1) for child in reversed(container.children))
+
+        count = len(self.containers)
+        if self.relative.shape[0] != count:
+            self.relative = np.zeros((count, 4), dtype=np.float32)
+            self.absolute = np.zeros((count, 4), dtype=np.float32)
+            self.flags    = np.zeros(count, dtype=np.int32)
+            self.radius   = np.zeros(count, dtype=np.float32)
+            self.clips    = np.zeros(count, dtype=bool)
+            self.scroll   = np.zeros((count, 2), dtype=np.float32)
+            self.origin   = np.zeros((count, 2), dtype=np.float32)
+            self.offset   = np.zeros((count, 2), dtype=np.float32)
+            self.scrolled = np.zeros((count, 4), dtype=np.float32)
+            self.clip     = np.zeros((count, 4), dtype=np.float32)
+            self.shown    = np.zeros(count, dtype=bool)
+        else:
+            self.relative.fill(0.0)
+            self.absolute.fill(0.0)
+            self.flags.fill(0)
+            self.radius.fill(0.0)
+            self.clips.fill(False)
+            self.scroll.fill(0.0)
+            self.origin.fill(0.0)
+            self.offset.fill(0.0)
+            self.scrolled.fill(0.0)
+            self.clip.fill(0.0)
+            self.shown.fill(False)
+        self.parent       = np.array(parents, dtype=np.int32)
+        self.depth        = np.array(depths, dtype=np.int32)
+        self.scroll_limit = np.full(count, -1.0, dtype=np.float32)
+        self.extent       = np.full(count, -1.0, dtype=np.float32)
+
+        # Pre-order: a subtree ends where the last descendant's subtree ends.
+        subtree_end = np.arange(1, count + 1, dtype=np.int32)
+        for index in range(count - 1, 0, -1):
+            parent_index = parents[index]
+            if subtree_end[index] > subtree_end[parent_index]:
+                subtree_end[parent_index] = subtree_end[index]
+        self.subtree_end = subtree_end
+
+    def write(self, index, rel_box, abs_box):
+        self.relative[index] = (rel_box.x, rel_box.y, rel_box.width, rel_box.height)
+        self.absolute[index] = (abs_box.x, abs_box.y, abs_box.width, abs_box.height)
+
+    def update_attributes(self):
+        # Handlers and styles can change after layout (scripts attach scroll
+        # handlers, toggle display), so this is refreshed before hit testing
+        # picks the columns up.
+        for container in self.containers:
+            style = container._style
+            flags = PASSIVE if container.passive else 0
+            if getattr(style.display, 'name', style.display) != 'NONE':
+                flags |= DISPLAY
+            overflow = getattr(style.overflow, 'name', style.overflow)
+            if overflow not in CLIPPING_OVERFLOW:
+                flags |= OVERFLOW
+            if container.scroll or overflow in SCROLLING_OVERFLOW:
+                flags |= SCROLLABLE
+            self.flags[container._index]  = flags
+            self.radius[container._index] = style.border_radius
+            # Pre-order, so the parent's row is already final
+            parent_index = self.parent[container._index]
+            self.shown[container._index] = bool(flags & DISPLAY) and (parent_index < 0 or self.shown[parent_index])
+        self.version = next(_versions)
+
+    def update_scroll(self):
+        """Refresh scroll limits and offsets after a layout pass.
+
+        The limit of a scroll container is how far its lowest child (or its
+        `extent`) reaches past its bottom edge; containers that do not scroll
+        get -1, which the hit detector treats as unclamped.
+        """
+        self.scroll_limit.fill(-1.0)
+        for container in self.containers:
+            overflow = getattr(container._style.overflow, 'name', container._style.overflow)
+            index = container._index
+            self.clips[index] = overflow in CLIPPING_OVERFLOW
+            if overflow not in SCROLLING_OVERFLOW:
+                self.scroll[index] = 0.0
+                continue
+            self._update_limit(index)
+        self._propagate(0, len(self.containers))
+    
+    def _update_limit(self, index):
+        start, end = index + 1, self.subtree_end[index]
+        children = np.flatnonzero(self.parent[start:end] == index) + start
+        limit = 0.0
+        if len(children):
+            box = self.absolute[index]
+            if self.extent[index] >= 0.0:
+                bottom = self.absolute[children[0], 1] + self.extent[index]
+            else:
+                bottom = (self.absolute[children, 1] + self.absolute[children, 3]).max()
+            limit = max(0.0, float(bottom - (box[1] + box[3])))
+        self.scroll_limit[index] = limit
+        self.scroll[index, 1] = min(max(self.scroll[index, 1], 0.0), limit)
+        self.containers[index]._scroll_value = float(self.scroll[index, 1])
+
+    def scroll_to(self, index, value):
+        """Set the vertical offset of one scroll container, moving only its
+        descendants' rows. Returns False when nothing moved."""
+        limit = self.scroll_limit[index]
+        if limit < 0.0:
+            return False
+        value = min(max(float(value), 0.0), float(limit))
+        if value == self.scroll[index, 1]:
+            return False
+        self.scroll[index, 1] = value
+        self.containers[index]._scroll_value = value
+        self._propagate(index + 1, int(self.subtree_end[index]))
+        return True
+
+    def set_content(self, index, origin, extent):
+        """Place a container's laid-out children at `origin` in a content
+        `extent` pixels tall; applied by the next `update_scroll`, or by
+        `apply_content` without a layout pass."""
+        self.origin[index, 1] = origin
+        self.extent[index]    = extent
+    
+    def apply_content(self, index):
+        """Refresh the scroll limit of a scroll container after `set_content`
+        and move its descendants' rows to the new origin."""
+        if self.scroll_limit[index] < 0.0:
+            return
+        self._update_limit(index)
+        self._propagate(index + 1, int(self.subtree_end[index]))
+
+    def take_scroll_dirty(self):
+        dirty, self.scroll_dirty = self.scroll_dirty, None
+        return dirty
+
+    def _propagate(self, start, end):
+        if start >= end:
+            return
+        rows  = np.arange(start, end)
+        depth = self.depth[start:end]
+        # Parents sit one level up, so walking the slice level by level
+        # always reads finished parent rows.
+        for level in range(int(depth.min()), int(depth.max()) + 1):
+            level_rows = rows[depth == level]
+            parents = self.parent[level_rows]
+            roots = level_rows[parents < 0]
+            self.offset[roots] = 0.0
+            self.clip[roots] = NO_CLIP
+            level_rows, parents = level_rows[parents >= 0], parents[parents >= 0]
+            self.offset[level_rows] = self.offset[parents] + self.scroll[parents] - self.origin[parents]
+            clip = self.clip[parents]
+            clipping = self.clips[parents]
+            if clipping.any():
+                parent_boxes = self.scrolled[parents[clipping]]
+                clip[clipping, 0] = np.maximum(clip[clipping, 0], parent_boxes[:, 0])
+                clip[clipping, 1] = np.maximum(clip[clipping, 1], parent_boxes[:, 1])
+                clip[clipping, 2] = np.minimum(clip[clipping, 2], parent_boxes[:, 0] + parent_boxes[:, 2])
+                clip[clipping, 3] = np.minimum(clip[clipping, 3], parent_boxes[:, 1] + parent_boxes[:, 3])
+            self.clip[level_rows] = clip
+            level_rows = np.concatenate((roots, level_rows))
+            self.scrolled[level_rows, :2] = self.absolute[level_rows, :2] - self.offset[level_rows]
+            self.scrolled[level_rows, 2:] = self.absolute[level_rows, 2:]
+
+        self.version = next(_versions)
+        if self.scroll_dirty is None:
+            self.scroll_dirty = (start, end)
+        else:
+            self.scroll_dirty = (min(start, self.scroll_dirty[0]), max(end, self.scroll_dirty[1]))
+
+    def placement(self, container_id, mask):
+        """Where a container's text or image content draws after scrolling.
+
+        Returns (offset x, offset y, mask, clip): the translation scrolling
+        applies to the content, the (x, y, width, height) mask moved by it,
+        and the (min x, min y, max x, max y) rectangle the content may draw
+        into, or None when nothing clips it. The rectangle is empty when the
+        container or an ancestor has `display: none`.
+        """
+        has_mask = bool(mask) and mask[2] > 0 and mask[3] > 0
+        index = self.index.get(container_id)
+        if index is None or index >= len(self.offset):
+            offset_x = offset_y = 0.0
+            clip = NO_CLIP
+        elif self.hidden(index):
+            return 0.0, 0.0, mask, HIDDEN_CLIP
+        else:
+            offset_x, offset_y = (float(v) for v in self.offset[index])
+            clip = tuple(float(v) for v in self.clip[index])
+        if has_mask:
+            mask = [mask[0] - offset_x, mask[1] - offset_y, mask[2], mask[3]]
+            clip = (
+                max(clip[0], mask[0]),
+                max(clip[1], mask[1]),
+                min(clip[2], mask[0] + mask[2]),
+                min(clip[3], mask[1] + mask[3]),
+            )
+        if clip == NO_CLIP:
+            clip = None
+        return offset_x, offset_y, mask, clip
+
+    def hidden(self, index):
+        return not self.shown[index]
+
+    def get(self, container_id, absolute=True):
+        index = self.index.get(container_id)
+        if index is None:
+            return None
+        return self.absolute[index] if absolute else self.relative[index]
@@ -11,7 +11,22 @@
 from __future__ import annotations
 from typing import Optional, List
 
+_CONTAINER_ATTRS = frozenset((
+    'id', 'parent', 'children', 'style', '_style', 'data', 'img', 'text', 'font', 'virtual',
+    'layer', 'passive', 'click', 'toggle', 'scroll', 'hover', 'hoverout',
+    '_toggle_value', '_toggled', '_clicked', '_hovered',
+    '_prev_toggled', '_prev_clicked', '_prev_hovered', '_scroll_value', '_dirty', '_layout_node', '_index'
+))
+
 class Container(): 
+    __slots__ = (
+        'id', 'parent', 'children', '_style', 'data', 'img', 'text', 'font', 'virtual',
+        'layer', 'passive', 'click', 'toggle', 'scroll', 'hover', 'hoverout',
+        '_toggle_value', '_toggled', '_clicked', '_hovered',
+        '_prev_toggled', '_prev_clicked', '_prev_hovered', '_scroll_value',
+        '_dirty', '_layout_node', '_index', '__dict__'
+    )
+
     def __init__(self): 
         self.id       : str                       = ""
         self.parent   : Optional[Container]       = []
@@ -22,6 +37,8 @@ class Container():
         self.img   : Optional[str] = ""
         self.text  : Optional[str] = ""
         self.font  : Optional[str] = ""
+        
+        self.virtual : Optional[str] = ""
 
         self.layer   : int   = 0
         self.passive : bool  = False
@@ -43,9 +60,28 @@ class Container():
         
         self._dirty        : bool  = False
         self._layout_node  : Optional[object] = None
+        self._index        : int   = -1
+    
+    @property
+    def style(self):
+        style = self._style
+        if getattr(style, '_shared', False):
+            style = self.own_style()
+        return style
+    
+    @style.setter
+    def style(self, value):
+        object.__setattr__(self, '_style', value)
+    
+    def own_style(self):
+        style = self._style
+        if getattr(style, '_shared', False):
+            style = style.copy()
+            object.__setattr__(self, '_style', style)
+        return style
     
     def __getattr__(self, name):
-        if name in ('children', 'style', '__dict__'):
+        if name in ('children', 'style', '_style', '__dict__'):
             raise AttributeError(f"'Container' object has no attribute '{name}'")
         
         try:
@@ -57,7 +93,7 @@ class Container():
             pass
         
         try:
-            style = object.__getattribute__(self, 'style')
+            style = object.__getattribute__(self, '_style')
             if style and hasattr(style, name):
                 return getattr(style, name)
         except AttributeError:
@@ -66,20 +102,13 @@ class Container():
         raise AttributeError(f"'Container' object has no attribute or child named '{name}'")
     
     def __setattr__(self, name, value):
-        container_attrs = {
-            'id', 'parent', 'children', 'style', 'data', 'img', 'text', 'font',
-            'layer', 'passive', 'click', 'toggle', 'scroll', 'hover', 'hoverout',
-            '_toggle_value', '_toggled', '_clicked', '_hovered',
-            '_prev_toggled', '_prev_clicked', '_prev_hovered', '_scroll_value', '_dirty', '_layout_node'
-        }
-        
-        if name in container_attrs:
+        if name in _CONTAINER_ATTRS:
             object.__setattr__(self, name, value)
         else:
             try:
-                style = object.__getattribute__(self, 'style')
+                style = object.__getattribute__(self, '_style')
                 if style and hasattr(style, name):
-                    setattr(style, name, value)
+                    setattr(self.own_style(), name, value)
                 else:
                     object.__setattr__(self, name, value)
             except AttributeError:
@@ -0,0 +1,111 @@
+# Created by XWZ
+# ◕‿◕ Distributed for free at:
+# https://github.com/nicolaiprodromov/puree
+# ╔═════════════════════════════════╗
+# ║  ██   ██  ██      ██  ████████  ║
+# ║   ██ ██   ██  ██  ██       ██   ║
+# ║    ███    ██  ██  ██     ██     ║
+# ║   ██ ██   ██  ██  ██   ██       ║
+# ║  ██   ██   ████████   ████████  ║
+# ╚═════════════════════════════════╝
+import os
+import yaml
+
+from .style import Style
+from ..native_bindings import CSSParser, SCSSCompiler
+
+class ComponentRegistry():
+    """Index of the component directory for a single parse.
+
+    Component files are located once, YAML templates are loaded once per
+    component and SCSS is compiled once per (component, params) pair without
+    a namespace; instances only rename the cached styles into their own
+    namespace.
+    """
+    def __init__(self, component_dir, parse_style_prop):
+        self.component_dir    = component_dir
+        self.parse_style_prop = parse_style_prop
+        self._paths           = None
+        self._templates       = {}
+        self._styles          = {}
+
+    @property
+    def paths(self):
+        if self._paths is None:
+            self._paths = self._scan()
+        return self._paths
+
+    def _scan(self):
+        paths = {}
+        for root, dirs, files in os.walk(self.component_dir):
+            for filename in files:
+                if not filename.endswith('.yaml'):
+                    continue
+                name = filename[:-len('.yaml')]
+                if name in paths:
+                    continue
+                scss_path = os.path.join(root, f"{name}.scss")
+                paths[name] = (
+                    os.path.join(root, filename),
+                    scss_path if os.path.exists(scss_path) else None
+                )
+        return paths
+
+    def __contains__(self, name):
+        return name in self.paths
+
+    def get_template(self, name):
+        if name not in self._templates:
+            yaml_path, _ = self.paths[name]
+            with open(yaml_path, 'r') as f:
+                self._templates[name] = yaml.safe_load(f)[name]
+        return self._templates[name]
+
+    def get_styles(self, name, namespace, params):
+        _, scss_path = self.paths[name]
+        if scss_path is None:
+            return {}
+
+        cache_key = (name, tuple(sorted((key, str(value)) for key, value in params.items())))
+        templates = self._styles.get(cache_key)
+        if templates is None:
+            compiled_css = SCSSCompiler().compile_file(
+                scss_path,
+                param_overrides=params,
+                component_name=name
+            )
+            templates = {}
+            for selector, declarations in CSSParser().parse(compiled_css).items():
+                style_obj = Style()
+                for prop, value in declarations.items():
+                    attr_name, attr_value = self.parse_style_prop(prop, value)
+                    setattr(style_obj, attr_name, attr_value)
+                templates[selector] = style_obj
+            self._styles[cache_key] = templates
+
+        styles = {}
+        for selector, template in templates.items():
+            namespaced_selector = namespace_selector(selector, namespace, name)
+            style_obj = template.copy()
+            style_obj.id = namespaced_selector
+            styles[namespaced_selector] = style_obj
+        return styles
+
+def namespace_selector(selector, namespace, component_base_name):
+    # Same renaming rules as the native SCSS compiler applies when it is
+    # given a namespace, so cached styles match per-instance compilation.
+    namespaced_selectors = []
+    for part in selector.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        selector_clean = part.lstrip('.')
+        if selector_clean == component_base_name:
+            namespaced_selectors.append(namespace)
+        elif selector_clean.startswith(f"{component_base_name}_"):
+            namespaced_selectors.append(selector_clean.replace(component_base_name, namespace, 1))
+        elif not selector_clean.startswith(namespace):
+            namespaced_selectors.append(f"{namespace}_{selector_clean}")
+        else:
+            namespaced_selectors.append(selector_clean)
+    return ", ".join(namespaced_selectors)
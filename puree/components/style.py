@@ -12,8 +12,29 @@ from __future__ import annotations
 from typing import Optional, List
 
 class Style(): 
+    # Known properties live in slots; anything else a stylesheet sets
+    # (padding, margin_top, gap, ...) falls back to the instance dict.
+    __slots__ = (
+        'id', '_shared', 'width', 'height',
+        'color', 'color_1', 'color_gradient_rot',
+        'hover_color', 'hover_color_1', 'hover_color_gradient_rot',
+        'click_color', 'click_color_1', 'click_color_gradient_rot',
+        'text_x', 'text_y', 'text_scale', 'text_color', 'text_color_1', 'text_color_gradient_rot',
+        'text_align_h', 'text_align_v', 'img_align_h', 'img_align_v', 'img_opacity',
+        'border_radius', 'border_width', 'border_color', 'border_color_1', 'border_color_gradient_rot',
+        'box_shadow_color', 'box_shadow_offset', 'box_shadow_blur',
+        'display', 'overflow', 'scrollbar_width', 'position',
+        'align_items', 'justify_items', 'align_self', 'justify_self', 'align_content', 'justify_content',
+        'size', 'min_size', 'max_size', 'aspect_ratio',
+        'flex_wrap', 'flex_direction', 'flex_grow', 'flex_shrink', 'flex_basis',
+        'grid_auto_flow', 'grid_template_rows', 'grid_template_columns',
+        'grid_auto_rows', 'grid_auto_columns', 'grid_row', 'grid_column',
+        '__dict__'
+    )
+
     def __init__(self): 
         self.id: str = ""
+        self._shared: bool = False
 
         self.width  : float = 0.0
         self.height : float = 0.0
@@ -84,3 +105,17 @@ class Style():
         self.grid_row             : str            = 'AUTO'
         self.grid_column          : str            = 'AUTO'
 
+    def copy(self):
+        style_copy = Style.__new__(Style)
+        for attr_name in _STYLE_SLOTS:
+            try:
+                attr_value = getattr(self, attr_name)
+            except AttributeError:
+                continue
+            setattr(style_copy, attr_name, attr_value.copy() if isinstance(attr_value, list) else attr_value)
+        for attr_name, attr_value in self.__dict__.items():
+            setattr(style_copy, attr_name, attr_value.copy() if isinstance(attr_value, list) else attr_value)
+        style_copy._shared = False
+        return style_copy
+
+_STYLE_SLOTS = tuple(name for name in Style.__slots__ if name != '__dict__')
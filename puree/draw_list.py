@@ -0,0 +1,59 @@
+# Created by XWZ
+# ◕‿◕ Distributed for free at:
+# https://github.com/nicolaiprodromov/puree
+# ╔═════════════════════════════════╗
+# ║  ██   ██  ██      ██  ████████  ║
+# ║   ██ ██   ██  ██  ██       ██   ║
+# ║    ███    ██  ██  ██     ██     ║
+# ║   ██ ██   ██  ██  ██   ██       ║
+# ║  ██   ██   ████████   ████████  ║
+# ╚═════════════════════════════════╝
+
+class DrawList():
+    """The instances of one draw handler that are visible, with their draw
+    records.
+
+    Rebuilt only when the content placement, the region size, the number
+    of instances or `generation` changes; instances bump `generation`
+    through `touch` whenever something their record depends on changes.
+    Instances whose record builder returns None (hidden subtrees, clipped
+    away or outside the region) are dropped here, so the draw handler
+    never reaches blf or gpu for them.
+    """
+    def __init__(self):
+        self.generation = 0
+        self.entries    = []
+        self._key       = None
+
+    def touch(self):
+        self.generation += 1
+
+    def get(self, instances, region_size, build):
+        from .parser_op import content_version
+        key = (content_version(), region_size, len(instances), self.generation)
+        if key != self._key:
+            self._key = key
+            entries = []
+            for instance in instances:
+                record = build(instance, region_size)
+                if record is not None:
+                    entries.append((instance, record))
+            self.entries = entries
+        return self.entries
+
+def culled(bounds, clip, region_size):
+    """True when nothing of `bounds` shows through `clip` and the region.
+
+    Both rectangles are (min x, min y, max x, max y) from the top left of
+    the region; `clip` may be None.
+    """
+    xmin = max(bounds[0], 0.0)
+    ymin = max(bounds[1], 0.0)
+    xmax = min(bounds[2], region_size[0])
+    ymax = min(bounds[3], region_size[1])
+    if clip is not None:
+        xmin = max(xmin, clip[0])
+        ymin = max(ymin, clip[1])
+        xmax = min(xmax, clip[2])
+        ymax = min(ymax, clip[3])
+    return xmin >= xmax or ymin >= ymax
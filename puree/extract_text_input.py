@@ -28,18 +28,18 @@ class TextInputExtractor:
                 'container_id': container.id,
                 'placeholder': placeholder,
                 'font': container.font if container.font != '' else self.ui.theme.default_font,
-                'x_pos': int(self.json_data[self.flat_index]['position'][0] + container.style.text_x),
-                'y_pos': int(self.json_data[self.flat_index]['position'][1] + container.style.text_y),
-                'text_scale': int(container.style.text_scale),
-                'text_color': container.style.text_color,
-                'text_color_1': container.style.text_color_1,
-                'text_color_gradient_rot': container.style.text_color_gradient_rot,
+                'x_pos': int(self.json_data[self.flat_index]['position'][0] + container._style.text_x),
+                'y_pos': int(self.json_data[self.flat_index]['position'][1] + container._style.text_y),
+                'text_scale': int(container._style.text_scale),
+                'text_color': container._style.text_color,
+                'text_color_1': container._style.text_color_1,
+                'text_color_gradient_rot': container._style.text_color_gradient_rot,
                 'mask_x': int(self.json_data[self.flat_index]['position'][0]),
                 'mask_y': int(self.json_data[self.flat_index]['position'][1]),
                 'mask_width': int(self.json_data[self.flat_index]['size'][0]),
                 'mask_height': int(self.json_data[self.flat_index]['size'][1]),
-                'align_h': container.style.text_align_h,
-                'align_v': container.style.text_align_v
+                'align_h': container._style.text_align_h,
+                'align_v': container._style.text_align_v
             }
         
         self.flat_index += 1
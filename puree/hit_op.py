@@ -9,165 +9,186 @@
 # ║  ██   ██   ████████   ████████  ║
 # ╚═════════════════════════════════╝
 import bpy
+import numpy as np
 from . import parser_op
 from .scroll_op import scroll_state
 from .mouse_op import mouse_state
 from .native_bindings import HitDetector
 
-hit_modal_running = False
-_container_data = []
-_native_detector = None
+hit_detection_running = False
+_container_data       = []
+_native_detector      = None
+_needs_update         = False
 
-class XWZ_OT_hit_detect(bpy.types.Operator):
-    bl_idname  = "xwz.hit_detect"
-    bl_label   = "Detect interactions in UI (Performance-optimized)"
-    bl_options = {'REGISTER'}
+# Pixels a scroll container moves per wheel notch
+SCROLL_STEP = 40.0
+
+def reload_containers(container_data, layout_only=False):
+    """Point hit detection at a freshly flattened container list.
+
+    The detector keeps hover, click, toggle and scroll state across reloads
+    of the same tree, so nothing has to be copied between the old and new
+    container dicts. Geometry is read from the UI's box store when it covers
+    the same containers; `layout_only` skips the attribute refresh when only
+    the boxes can have changed.
+    """
+    global _container_data, _needs_update
+    _container_data = container_data
+    _needs_update   = True
+    if _native_detector is None or not container_data:
+        return
+    
+    ui = parser_op.XWZ_UI
+    box_store = ui.box_store if ui is not None else None
+    if box_store is None or len(box_store) != len(container_data):
+        _native_detector.load_containers(container_data)
+    else:
+        # Hit testing runs on the scrolled boxes, so descendants of a scroll
+        # container are found where they are drawn.
+        if not (layout_only and _native_detector.update_positions(box_store.scrolled)):
+            box_store.update_attributes()
+            _native_detector.load_geometry(box_store.scrolled, box_store.parent, box_store.flags, box_store.radius)
+        _native_detector.set_scroll_limits(box_store.scroll_limit)
+        sync_scroll_offsets(box_store)
+
+def sync_scroll_offsets(box_store):
+    """Carry the detector's scroll values over to a relaid-out box store."""
+    moved = False
+    for index in np.flatnonzero(box_store.scroll_limit >= 0.0):
+        moved |= box_store.scroll_to(int(index), _native_detector.get_state(int(index))[1])
+    if moved:
+        _native_detector.update_positions(box_store.scrolled)
+
+def sync_box_store(box_store, attributes=False):
+    """Hand box store changes made without a layout pass (a virtual list
+    rebinding its rows) to the detector; `attributes` also reloads flags."""
+    global _needs_update
+    if _native_detector is None or len(box_store) != len(_container_data):
+        return
+    if attributes:
+        _native_detector.load_geometry(box_store.scrolled, box_store.parent, box_store.flags, box_store.radius)
+    else:
+        _native_detector.update_positions(box_store.scrolled)
+    _native_detector.set_scroll_limits(box_store.scroll_limit)
+    _needs_update = True
+
+def get_state(container_index):
+    """(flags, scroll_value) of a container as tracked by the detector."""
+    if _native_detector is None:
+        return 0, 0.0
+    return _native_detector.get_state(container_index)
+
+def start_hit_detection():
+    global hit_detection_running, _native_detector
     
-    def invoke(self, context, event):
-        global hit_modal_running, _container_data, _native_detector
-        
-        if _native_detector is None:
-            _native_detector = HitDetector()
-        
-        hit_modal_running = True
-        context.window_manager.modal_handler_add(self)
-        
-        _container_data = parser_op._container_json_data
-        
-        if _container_data:
-            _native_detector.load_containers(_container_data)
-        
-        return {'RUNNING_MODAL'}
+    if _native_detector is None:
+        _native_detector = HitDetector()
     
-    def sync_container_data(self):
-        global _container_data, _native_detector
-        if parser_op._container_json_data:
-            _container_data = parser_op._container_json_data
-            if _native_detector:
-                _native_detector.load_containers(_container_data)
+    hit_detection_running = True
+    reload_containers(parser_op._container_json_data)
+
+def stop_hit_detection():
+    global hit_detection_running
+    hit_detection_running = False
+
+def needs_update():
+    """True when the containers changed since the last hit test."""
+    return _needs_update
+
+def run_hit_test(mouse_x, mouse_y):
+    """Hit test one pointer position and dispatch the resulting changes.
+
+    Coordinates are region pixels with the origin at the top left. Called by
+    the input dispatcher at most once per frame for pointer motion, and
+    right away for clicks.
+    """
+    global _needs_update
     
-    def modal(self, context, event):
-        global hit_modal_running
-        
-        if not hit_modal_running:
-            return {'FINISHED'}
-        
-        if not self._is_mouse_in_viewport():
-            return {'PASS_THROUGH'}
-        
-        try:
-            mouse_x, mouse_y = self._get_mouse_pos()
-        except:
-            return {'PASS_THROUGH'}
-        
-        if not _native_detector:
-            return {'PASS_THROUGH'}
-        
-        _native_detector.update_mouse(
-            mouse_x,
-            mouse_y,
-            mouse_state.is_clicked,
-            float(scroll_state.scroll_delta)
-        )
-        
-        results = _native_detector.detect_hits()
-        
-        if results is not None:
-            self.apply_hit_results(results)
-        
-        for _container in _container_data:
-            _container['_prev_hovered'] = _container['_hovered']
-            _container['_prev_clicked'] = _container['_clicked']
-            _container['_prev_toggled'] = _container['_toggled']
-        
-        scroll_state._prev_scroll_value = scroll_state.scroll_value
-        
-        return {'PASS_THROUGH'}
+    if not (hit_detection_running and _native_detector):
+        return
     
-    def apply_hit_results(self, results):
-        results_by_id = {r['container_id']: r for r in results}
-        
-        for container in _container_data:
-            container_id = container['id']
-            
-            if container_id in results_by_id:
-                result = results_by_id[container_id]
-                
-                container['_hovered'] = result['is_hovered']
-                
-                if result['hover_changed']:
-                    if result['is_hovered'] and not container['_prev_hovered']:
-                        for hover_handler in container['hover']:
-                            hover_handler(container)
-                    elif not result['is_hovered'] and container['_prev_hovered']:
-                        for hoverout_handler in container['hoverout']:
-                            hoverout_handler(container)
-                
-                container['_clicked'] = result['is_clicked']
-                
-                if result['click_changed'] and result['is_clicked'] and not container['_prev_clicked']:
-                    from . import text_input_op
-                    
-                    text_input_clicked = False
-                    for input_instance in text_input_op._text_input_instances:
-                        if input_instance.container_id == container_id:
-                            bpy.ops.xwz.focus_text_input(instance_id=input_instance.id)
-                            text_input_clicked = True
-                            break
-                    
-                    if not text_input_clicked:
-                        for input_instance in text_input_op._text_input_instances:
-                            if input_instance.is_focused:
-                                bpy.ops.xwz.blur_text_input(instance_id=input_instance.id)
-                    
-                    for click_handler in container['click']:
-                        click_handler(container)
-                    
-                    container['_toggled'] = True
-                    if container['_toggled'] and not container['_prev_toggled']:
-                        container['_toggle_value'] = not container['_toggle_value']
-                        for toggle_handler in container['toggle']:
-                            toggle_handler(container)
-                else:
-                    container['_toggled'] = False
+    _native_detector.update_mouse(
+        mouse_x,
+        mouse_y,
+        mouse_state.is_clicked,
+        float(scroll_state.scroll_value - scroll_state._prev_scroll_value) * SCROLL_STEP
+    )
     
-    def _is_mouse_in_viewport(self):
-        try:
-            mouse_x, mouse_y = self._get_mouse_pos()
-            width, height = self._get_viewport_size()
-            return 0 <= mouse_x <= width and 0 <= mouse_y <= height
-        except:
-            return False
+    changes = _native_detector.detect_hit_changes()
     
-    def _get_viewport_size(self):
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for region in area.regions:
-                    if region.type == 'WINDOW':
-                        return region.width, region.height
-        return 1920, 1080
+    scroll_state._prev_scroll_value = scroll_state.scroll_value
+    _needs_update = False
     
-    def _get_mouse_pos(self):
-        width, height = self._get_viewport_size()
-        ndc_x = mouse_state.mouse_pos[0]
-        ndc_y = mouse_state.mouse_pos[1]
-        screen_x = (ndc_x + 1.0) * 0.5 * width
-        screen_y = (ndc_y + 1.0) * 0.5 * height
-        return screen_x, screen_y
-class XWZ_OT_hit_stop(bpy.types.Operator):
-    bl_idname = "xwz.hit_stop"
-    bl_label = "Stop Hit Detection"
-    bl_options = {'REGISTER'}
+    if changes is not None:
+        apply_hit_changes(changes)
+
+def apply_hit_changes(changes):
+    global _needs_update
+    
+    ui = parser_op.XWZ_UI
+    box_store = ui.box_store if ui is not None else None
+    if box_store is not None and len(box_store) != len(_container_data):
+        box_store = None
+    scrolled = False
+    
+    for index, flags in changes:
+        if index >= len(_container_data):
+            continue
+        container = _container_data[index]
+
+        # Handlers receive the container dict, so mirror the detector's
+        # state into it before they run.
+        is_hovered = bool(flags & HitDetector.HOVERED)
+        is_clicked = bool(flags & HitDetector.CLICKED)
+        container['_prev_hovered'] = is_hovered != bool(flags & HitDetector.HOVER_CHANGED)
+        container['_prev_clicked'] = is_clicked != bool(flags & HitDetector.CLICK_CHANGED)
+        container['_prev_toggled'] = container['_toggled']
+        container['_hovered']      = is_hovered
+        container['_clicked']      = is_clicked
+        container['_toggled']      = bool(flags & HitDetector.TOGGLED)
+        container['_toggle_value'] = bool(flags & HitDetector.TOGGLE_VALUE)
+
+        if flags & HitDetector.HOVER_CHANGED:
+            if is_hovered:
+                for hover_handler in container['hover']:
+                    hover_handler(container)
+            else:
+                for hoverout_handler in container['hoverout']:
+                    hoverout_handler(container)
+
+        if flags & HitDetector.CLICK_CHANGED and is_clicked:
+            from . import text_input_op
+
+            container_id = container['id']
+            text_input_clicked = False
+            for input_instance in text_input_op._text_input_instances:
+                if input_instance.container_id == container_id:
+                    bpy.ops.xwz.focus_text_input(instance_id=input_instance.id)
+                    text_input_clicked = True
+                    break
+
+            if not text_input_clicked:
+                for input_instance in text_input_op._text_input_instances:
+                    if input_instance.is_focused:
+                        bpy.ops.xwz.blur_text_input(instance_id=input_instance.id)
+
+            for click_handler in container['click']:
+                click_handler(container)
+
+        if flags & HitDetector.TOGGLED:
+            for toggle_handler in container['toggle']:
+                toggle_handler(container)
+
+        if flags & HitDetector.SCROLLED:
+            scroll_value = _native_detector.get_state(index)[1]
+            container['_scroll_value'] = scroll_value
+            if box_store is not None:
+                scrolled |= box_store.scroll_to(index, scroll_value)
+            for scroll_handler in container['scroll']:
+                scroll_handler(container)
     
-    def execute(self, context):
-        global hit_modal_running
-        hit_modal_running = False
-        return {'FINISHED'}
-
-def register():
-    bpy.utils.register_class(XWZ_OT_hit_detect)
-    bpy.utils.register_class(XWZ_OT_hit_stop)
-
-def unregister():
-    bpy.utils.unregister_class(XWZ_OT_hit_stop)
-    bpy.utils.unregister_class(XWZ_OT_hit_detect)
+    # Only the scrolled subtrees moved; the detector picks up their new
+    # boxes and the pointer is tested again against them next frame.
+    if scrolled:
+        _native_detector.update_positions(box_store.scrolled)
+        _needs_update = True
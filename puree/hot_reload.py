@@ -273,18 +273,7 @@ def trigger_ui_reload():
         if not (render._render_data and render._render_data.running):
             return False
         
-        new_data = parser_op._container_json_data
-        old_data = hit_op._container_data
-        
-        if old_data and len(old_data) == len(new_data):
-            for i in range(len(new_data)):
-                runtime_keys = ['_hovered', '_prev_hovered', '_clicked', '_prev_clicked', 
-                              '_toggled', '_prev_toggled', '_toggle_value', '_scroll_value']
-                for key in runtime_keys:
-                    if key in old_data[i]:
-                        new_data[i][key] = old_data[i][key]
-        
-        hit_op._container_data = new_data
+        hit_op.reload_containers(parser_op._container_json_data)
         
         from . import text_op
         for text_instance in text_op._text_instances:
@@ -11,13 +11,54 @@
 import os
 import bpy
 import gpu
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from gpu_extras.batch import batch_for_shader
 from mathutils import Matrix
+from .draw_list import DrawList, culled
+from .png_decode import decode_png, decode_png_variant, mip_level
+from .space_config import get_target_region_size, request_redraw, add_draw_handler, remove_draw_handler
 
 _image_instances = []
 _draw_handle = None
+_draw_list = DrawList()
+
+# Used when the window manager property is not registered
+IMAGE_BUDGET_MB = 256
+
+# Frames a size of an image is kept undrawn while another size is in use
+VARIANT_FRAMES = 120
+
+# Full-size decodes kept on the worker to reduce new sizes from
+SOURCE_CACHE_MB = 64
+
+# Premultiplied fill drawn while an image loads
+PLACEHOLDER_COLOR = (0.08, 0.08, 0.08, 0.15)
 
 class ImageManager:
+    """Images from the addon's `assets/` directory, loaded on first use.
+
+    Registering only lists the files. The first `get_texture` for an image
+    starts loading it and returns None until the texture exists, so the
+    caller draws a placeholder meanwhile. PNGs are decoded by `decode_png`
+    on a worker thread and only uploaded on the main thread, in
+    `process_uploads` from the draw handler; other formats, and PNGs the
+    decoder rejects, go through `bpy.data.images` in the `_poll` timer,
+    which also removes evicted Blender images, so the draw handler never
+    changes `bpy.data`.
+
+    Decoded PNGs are uploaded at the power-of-two reduction (`mip_level`)
+    closest to the size they are drawn at, so textures are keyed by
+    (name, level) and an image drawn at several sizes holds one texture
+    per size; sizes that stop being drawn are dropped after
+    `VARIANT_FRAMES`. New sizes are reduced from the full-size decode the
+    worker keeps for recently decoded images, up to `SOURCE_CACHE_MB`,
+    rather than from the file. Blender-loaded images stay at full size. Textures are
+    kept in least-recently-drawn order and evicted once they exceed the
+    budget in `WindowManager.xwz_image_budget_mb`, in `end_frame` after
+    the frame's draws have marked what is on screen.
+    """
     _instance = None
     
     def __new__(cls):
@@ -29,54 +70,273 @@ class ImageManager:
     def __init__(self):
         if not self._initialized:
             self.images = {}
-            self.textures = {}
-            self._load_images()
+            self.textures = OrderedDict()
+            self.texture_bytes = {}
+            self.bpy_images = {}
+            self.dimensions = {}
+            self._full_size = set()
+            self._pending = set()
+            self._decoded = queue.Queue()
+            self._executor = None
+            self._sources = {}
+            self._blender_loads = []
+            self._released = []
+            self._drawn = {}
+            self._frame = 0
+            self._poll_timer = self._poll
+            self._scan_images()
             self._initialized = True
     
-    def _load_images(self):
+    def _scan_images(self):
         from . import get_addon_root
         addon_assets_path = os.path.join(get_addon_root(), "assets")
         if os.path.exists(addon_assets_path):
             for image_file in os.listdir(addon_assets_path):
                 if image_file.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tga', '.webp')):
-                    image_path = os.path.join(addon_assets_path, image_file)
-                    try:
-                        if image_file not in bpy.data.images:
-                            bpy_image = bpy.data.images.load(image_path)
-                        else:
-                            bpy_image = bpy.data.images[image_file]
-                        
-                        bpy_image.alpha_mode = 'PREMUL'
-                        
-                        texture = gpu.texture.from_image(bpy_image)
-                        image_name = os.path.splitext(image_file)[0]
-                        self.images[image_name] = image_path
-                        self.textures[image_name] = texture
-                    except Exception as e:
-                        print(f"Failed to load image {image_file}: {e}")
-        
-    def get_texture(self, image_name):
-        return self.textures.get(image_name, None)
+                    image_name = os.path.splitext(image_file)[0]
+                    self.images[image_name] = os.path.join(addon_assets_path, image_file)
+    
+    def get_texture(self, image_name, display_size=None):
+        """The texture of `image_name` sized for `display_size`, marked as
+        drawn; another size of the image, or None, while that one loads."""
+        if image_name not in self.images:
+            return None
+        key = (image_name, self._level(image_name, display_size))
+        texture = self.textures.get(key)
+        if texture is not None:
+            self.textures.move_to_end(key)
+            self._drawn[key] = self._frame
+            return texture
+        if key in self._pending:
+            return self._stand_in(image_name)
+        
+        image_path = self.images[image_name]
+        if image_path.lower().endswith('.png'):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="puree_images")
+            self._pending.add(key)
+            # Until the source size is known the worker picks the level
+            if display_size is not None:
+                display_size = tuple(display_size)
+            future = self._executor.submit(self._decode_variant, image_name, image_path, display_size, key[1])
+            future.add_done_callback(lambda future, key=key: self._decoded.put((key, future)))
+            self._start_polling()
+            return self._stand_in(image_name)
+        return self._queue_blender_load(image_name)
+    
+    def _decode_variant(self, image_name, image_path, display_size, level):
+        # Only ever runs on the single worker, so `_sources` needs no lock
+        sources = self._sources
+        source = sources.pop(image_name, None)
+        if source is None:
+            source = decode_png(image_path)
+        sources[image_name] = source
+        total = sum(pixels.nbytes for _, _, pixels in sources.values())
+        while total > SOURCE_CACHE_MB * 1024 * 1024 and len(sources) > 1:
+            total -= sources.pop(next(iter(sources)))[2].nbytes
+        return decode_png_variant(image_path, display_size, level, source)
+    
+    def _queue_blender_load(self, image_name):
+        self._full_size.add(image_name)
+        self._pending.add((image_name, 0))
+        self._blender_loads.append(image_name)
+        self._start_polling()
+        return self._stand_in(image_name)
+    
+    def _start_polling(self):
+        # Timers are matched by identity, so the bound method is kept
+        if not bpy.app.timers.is_registered(self._poll_timer):
+            bpy.app.timers.register(self._poll_timer, first_interval=0.05)
+    
+    def _level(self, image_name, display_size):
+        if image_name in self._full_size:
+            return 0
+        source_size = self.dimensions.get(image_name)
+        if source_size is None:
+            return None
+        return mip_level(source_size, display_size)
+    
+    def _stand_in(self, image_name):
+        for key in reversed(self.textures):
+            if key[0] == image_name:
+                self._drawn[key] = self._frame
+                return self.textures[key]
+        return None
+    
+    def peek_texture(self, image_name):
+        """The most recently drawn texture of `image_name`, without loading it."""
+        for key in reversed(self.textures):
+            if key[0] == image_name:
+                return self.textures[key]
+        return None
+    
+    def process_uploads(self):
+        """Upload finished decodes; needs the GPU context of a draw handler.
+        Returns True when a texture was added."""
+        self._frame += 1
+        uploaded = False
+        while True:
+            try:
+                key, future = self._decoded.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.discard(key)
+            image_name = key[0]
+            if image_name not in self.images:
+                continue
+            try:
+                level, source_size, width, height, pixels = future.result()
+            except Exception as e:
+                # Formats the decoder does not handle still load through Blender
+                if not isinstance(e, ValueError):
+                    print(f"Failed to decode image {image_name}: {e}")
+                self._queue_blender_load(image_name)
+                continue
+            self.dimensions[image_name] = source_size
+            try:
+                buffer = gpu.types.Buffer('FLOAT', width * height * 4, pixels.ravel())
+                # sRGB storage, like the textures `gpu.texture.from_image` gives
+                # 8 bit sRGB images, so both paths sample linear color
+                texture = gpu.types.GPUTexture((width, height), format='SRGB8_A8', data=buffer)
+            except Exception as e:
+                print(f"Failed to upload image {image_name}: {e}")
+                continue
+            self._add_texture((image_name, level), texture, width * height * 4)
+            uploaded = True
+        return uploaded
+    
+    def end_frame(self):
+        """Evict over budget and drop unused sizes once this frame's draws
+        have marked the textures on screen."""
+        self._evict(self._budget())
+        self._drop_unused_variants()
+    
+    def _poll(self):
+        if ImageManager._instance is not self:
+            return None
+        # Outside of drawing, so bpy.data.images may change here; releases
+        # go first so an image evicted and requested again is reloaded
+        while self._released:
+            self._remove_image_file(self._released.pop())
+        loaded = False
+        while self._blender_loads:
+            image_name = self._blender_loads.pop(0)
+            self._pending.discard((image_name, 0))
+            if image_name in self.images:
+                loaded = self._load_with_blender(image_name) is not None or loaded
+        if loaded or not self._decoded.empty():
+            request_redraw()
+        return 0.05 if self._pending else None
+    
+    def _load_with_blender(self, image_name):
+        image_path = self.images[image_name]
+        image_file = os.path.basename(image_path)
+        try:
+            if image_file not in bpy.data.images:
+                bpy_image = bpy.data.images.load(image_path)
+            else:
+                bpy_image = bpy.data.images[image_file]
+            
+            bpy_image.alpha_mode = 'PREMUL'
+            
+            texture = gpu.texture.from_image(bpy_image)
+        except Exception as e:
+            print(f"Failed to load image {image_file}: {e}")
+            # Not retried every draw; a rescan lists it again
+            self.images.pop(image_name, None)
+            return None
+        self.bpy_images[image_name] = image_file
+        self.dimensions[image_name] = tuple(bpy_image.size)
+        self._full_size.add(image_name)
+        self._add_texture((image_name, 0), texture, bpy_image.size[0] * bpy_image.size[1] * 4)
+        return texture
+    
+    def _add_texture(self, key, texture, size):
+        self.textures[key] = texture
+        self.texture_bytes[key] = size
+        self._drawn[key] = self._frame
+        _draw_list.touch()
+    
+    def _budget(self):
+        try:
+            return bpy.context.window_manager.xwz_image_budget_mb * 1024 * 1024
+        except Exception:
+            return IMAGE_BUDGET_MB * 1024 * 1024
+    
+    def _evict(self, budget):
+        # Textures drawn this frame stay even over budget; evicting them
+        # would only reload them on the next frame
+        total = sum(self.texture_bytes.values())
+        for key in list(self.textures):
+            if total <= budget or len(self.textures) <= 1:
+                break
+            if self._drawn.get(key) == self._frame:
+                continue
+            total -= self.texture_bytes[key]
+            self._remove_texture(key)
+    
+    def _drop_unused_variants(self):
+        # A size of an image goes once it has not been drawn for a while
+        # and another size of the same image has been drawn since
+        latest = {}
+        for key in self.textures:
+            latest[key[0]] = max(latest.get(key[0], -1), self._drawn.get(key, -1))
+        for key in list(self.textures):
+            drawn = self._drawn.get(key, -1)
+            if drawn < latest[key[0]] and self._frame - drawn > VARIANT_FRAMES:
+                self._remove_texture(key)
+    
+    def _remove_texture(self, key):
+        del self.textures[key]
+        del self.texture_bytes[key]
+        self._drawn.pop(key, None)
+        image_file = self.bpy_images.pop(key[0], None)
+        if image_file is not None:
+            self._released.append(image_file)
+            self._start_polling()
+    
+    def _remove_bpy_image(self, image_name):
+        image_file = self.bpy_images.pop(image_name, None)
+        if image_file is not None:
+            self._remove_image_file(image_file)
+    
+    def _remove_image_file(self, image_file):
+        try:
+            if image_file in bpy.data.images:
+                bpy.data.images.remove(bpy.data.images[image_file])
+        except Exception as e:
+            print(f"Failed to remove image {image_file}: {e}")
     
     def get_available_images(self):
         return list(self.images.keys())
     
+    def get_memory_usage(self):
+        return sum(self.texture_bytes.values())
+    
     def unload_images(self):
-        for image_name, image_path in self.images.items():
-            try:
-                image_file = os.path.basename(image_path)
-                if image_file in bpy.data.images:
-                    bpy.data.images.remove(bpy.data.images[image_file])
-            except Exception as e:
-                print(f"Failed to remove image {image_name}: {e}")
-        
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        for image_name in list(self.bpy_images):
+            self._remove_bpy_image(image_name)
+        while self._released:
+            self._remove_image_file(self._released.pop())
+        
+        self._blender_loads.clear()
+        self._sources = {}
+        self._pending.clear()
+        self._decoded = queue.Queue()
         self.textures.clear()
+        self.texture_bytes.clear()
+        self._drawn.clear()
+        self.dimensions.clear()
+        self._full_size.clear()
         self.images.clear()
     
     def reload_images(self):
         """Reload all images - used when addon is re-enabled without Blender restart"""
         self.unload_images()
-        self._load_images()
+        self._scan_images()
     
     @classmethod
     def reset_instance(cls):
@@ -127,12 +387,28 @@ def get_image_shader_with_opacity():
     
     return _image_shader_with_opacity
 
+_placeholder_shader = None
+_placeholder_batch = None
+
+def get_placeholder_batch():
+    """Shader and unit quad for images that are still loading"""
+    global _placeholder_shader, _placeholder_batch
+    
+    if _placeholder_batch is None:
+        _placeholder_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+        _placeholder_batch = batch_for_shader(
+            _placeholder_shader, 'TRIS',
+            {"pos": [(0, 0), (1, 0), (1, 1), (0, 1)]},
+            indices=[(0, 1, 2), (0, 2, 3)]
+        )
+    
+    return _placeholder_shader, _placeholder_batch
+
 class ImageInstance:
     def __init__(self, container_id, image_name=None, pos=[50, 50], size=[100, 100], mask=None, aspect_ratio=True, align_h='LEFT', align_v='TOP', opacity=1.0):
         self.id           = len(_image_instances)
         self.container_id = container_id
         self.image_name   = image_name
-        self.texture      = image_manager.get_texture(self.image_name) if self.image_name else None
         self.position     = pos
         self.size         = size
         self.mask         = mask
@@ -142,10 +418,17 @@ class ImageInstance:
         self.opacity      = max(0.0, min(1.0, opacity))  # Clamp between 0 and 1
         self.shader       = get_image_shader_with_opacity()  # Use shared shader
         self.batch        = None
+        _draw_list.touch()
         self._create_batch()
     
+    @property
+    def texture(self):
+        if not self.image_name or image_manager is None:
+            return None
+        return image_manager.get_texture(self.image_name, self.get_display_size())
+    
     def _create_batch(self):
-        if self.texture:
+        if self.batch is None:
             vertices = [
                 (0, 0), (1, 0), (1, 1), (0, 1)
             ]
@@ -160,11 +443,11 @@ class ImageInstance:
             )
     
     def get_display_size(self):
-        if not self.aspect_ratio or not self.texture:
+        source_size = image_manager.dimensions.get(self.image_name) if image_manager else None
+        if not self.aspect_ratio or not source_size:
             return self.size
         
-        tex_width = self.texture.width
-        tex_height = self.texture.height
+        tex_width, tex_height = source_size
         
         if tex_width == 0 or tex_height == 0:
             return self.size
@@ -185,8 +468,6 @@ class ImageInstance:
     def update_image(self, new_image_name):
         if new_image_name in image_manager.get_available_images():
             self.image_name = new_image_name
-            self.texture = image_manager.get_texture(new_image_name)
-            self._create_batch()
             self._trigger_redraw()
     
     def update_size(self, new_size):
@@ -212,8 +493,6 @@ class ImageInstance:
     def update_all(self, image_name=None, size=None, pos=None, mask=None, aspect_ratio=None, align_h=None, align_v=None, opacity=None):
         if image_name is not None and image_name in image_manager.get_available_images():
             self.image_name = image_name
-            self.texture = image_manager.get_texture(image_name)
-            self._create_batch()
         if size is not None:
             self.size = [max(1, min(2000, size[0])), max(1, min(2000, size[1]))]
         if pos is not None:
@@ -231,87 +510,107 @@ class ImageInstance:
         self._trigger_redraw()
     
     def _trigger_redraw(self):
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
-
-def draw_all_images():
-    viewport_height = 0
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            for region in area.regions:
-                if region.type == 'WINDOW':
-                    viewport_height = region.height
-                    break
-            break
-    
-    gpu.state.blend_set('ALPHA_PREMULT')
+        _draw_list.touch()
+        request_redraw()
     
-    for instance in _image_instances:
-        if not instance.texture or not instance.batch:
-            continue
+    def draw_record(self, region_size):
+        """(model matrix, scissor, display size) in region coordinates, or
+        None when nothing shows."""
+        from .parser_op import content_placement
+        if image_manager is None or self.image_name not in image_manager.images:
+            return None
         
-        if instance.mask and instance.mask[2] > 0 and instance.mask[3] > 0:
-            xmin = instance.mask[0]
-            ymin = viewport_height - instance.mask[1] - instance.mask[3]
-            xmax = instance.mask[0] + instance.mask[2]
-            ymax = viewport_height - instance.mask[1]
-            gpu.state.scissor_test_set(True)
-            gpu.state.scissor_set(int(xmin), int(ymin), int(xmax - xmin), int(ymax - ymin))
+        offset_x, offset_y, mask, clip = content_placement(self.container_id, self.mask)
+        if clip is not None and (clip[0] >= clip[2] or clip[1] >= clip[3]):
+            return None
         
-        display_size = instance.get_display_size()
+        display_size = self.get_display_size()
         
-        x_pos = instance.position[0]
-        y_pos = instance.position[1]
+        x_pos = self.position[0] - offset_x
+        y_pos = self.position[1] - offset_y
         
-        if instance.mask and instance.mask[2] > 0 and instance.mask[3] > 0:
-            container_width = instance.mask[2]
-            container_height = instance.mask[3]
+        if mask and mask[2] > 0 and mask[3] > 0:
+            container_width = mask[2]
+            container_height = mask[3]
             
-            if instance.align_h == 'LEFT':
-                x_pos = instance.mask[0]
-            elif instance.align_h == 'CENTER':
-                x_pos = instance.mask[0] + (container_width - display_size[0]) / 2
-            elif instance.align_h == 'RIGHT':
-                x_pos = instance.mask[0] + container_width - display_size[0]
+            if self.align_h == 'LEFT':
+                x_pos = mask[0]
+            elif self.align_h == 'CENTER':
+                x_pos = mask[0] + (container_width - display_size[0]) / 2
+            elif self.align_h == 'RIGHT':
+                x_pos = mask[0] + container_width - display_size[0]
             
-            if instance.align_v == 'TOP':
-                y_pos = instance.mask[1]
-            elif instance.align_v == 'CENTER':
-                y_pos = instance.mask[1] + (container_height - display_size[1]) / 2
-            elif instance.align_v == 'BOTTOM':
-                y_pos = instance.mask[1] + container_height - display_size[1]
+            if self.align_v == 'TOP':
+                y_pos = mask[1]
+            elif self.align_v == 'CENTER':
+                y_pos = mask[1] + (container_height - display_size[1]) / 2
+            elif self.align_v == 'BOTTOM':
+                y_pos = mask[1] + container_height - display_size[1]
+        
+        if culled((x_pos, y_pos, x_pos + display_size[0], y_pos + display_size[1]), clip, region_size):
+            return None
+        
+        viewport_height = region_size[1]
+        scissor = None
+        if clip is not None:
+            xmin = clip[0]
+            ymin = viewport_height - clip[3]
+            xmax = clip[2]
+            ymax = viewport_height - clip[1]
+            scissor = (int(xmin), int(ymin), int(xmax - xmin), int(ymax - ymin))
         
         flipped_y = viewport_height - y_pos - display_size[1]
         
         scale_matrix = Matrix.Diagonal((display_size[0], display_size[1], 1.0, 1.0))
         translation_matrix = Matrix.Translation((x_pos, flipped_y, 0))
+        return translation_matrix @ scale_matrix, scissor, display_size
+
+def draw_all_images():
+    if image_manager is None:
+        return
+    image_manager.process_uploads()
+    
+    region_size = get_target_region_size()
+    projection = gpu.matrix.get_projection_matrix()
+    
+    gpu.state.blend_set('ALPHA_PREMULT')
+    
+    for instance, record in _draw_list.get(_image_instances, region_size, ImageInstance.draw_record):
+        model, scissor, display_size = record
+        texture = image_manager.get_texture(instance.image_name, display_size)
         
-        matrix = gpu.matrix.get_projection_matrix()
-        matrix = matrix @ translation_matrix @ scale_matrix
-        
-        instance.shader.bind()
-        instance.shader.uniform_sampler("image", instance.texture)
-        instance.shader.uniform_float("opacity", instance.opacity)
+        if scissor is not None:
+            gpu.state.scissor_test_set(True)
+            gpu.state.scissor_set(*scissor)
         
         gpu.matrix.push_projection()
-        gpu.matrix.load_projection_matrix(matrix)
+        gpu.matrix.load_projection_matrix(projection @ model)
         
-        instance.batch.draw(instance.shader)
+        if texture is not None:
+            instance.shader.bind()
+            instance.shader.uniform_sampler("image", texture)
+            instance.shader.uniform_float("opacity", instance.opacity)
+            instance.batch.draw(instance.shader)
+        else:
+            shader, batch = get_placeholder_batch()
+            shader.bind()
+            shader.uniform_float("color", [c * instance.opacity for c in PLACEHOLDER_COLOR])
+            batch.draw(shader)
         
         gpu.matrix.pop_projection()
         
-        if instance.mask and instance.mask[2] > 0 and instance.mask[3] > 0:
+        if scissor is not None:
             gpu.state.scissor_test_set(False)
     
     gpu.state.blend_set('NONE')
+    image_manager.end_frame()
 
 class DrawImageOP(bpy.types.Operator):
     bl_idname = "xwz.draw_image"
     bl_label = "Add Image Instance"
     
     def get_image_items(self, context):
-        image_manager._load_images()
+        image_manager._scan_images()
         items = [(name, name, "") for name in image_manager.get_available_images()]
         return items if items else [("none", "None", "")]
     
@@ -362,8 +661,7 @@ class DrawImageOP(bpy.types.Operator):
         _image_instances.append(new_instance)
         
         if _draw_handle is None:
-            _draw_handle = bpy.types.SpaceView3D.draw_handler_add(
-                draw_all_images, (), 'WINDOW', 'POST_PIXEL')
+            _draw_handle = add_draw_handler(draw_all_images)
         
         context.area.tag_redraw()
         self.report({'INFO'}, f"Added image instance #{new_instance.id} with image {self.image_name}")
@@ -388,7 +686,7 @@ class RemoveImageOP(bpy.types.Operator):
             return {'CANCELLED'}
         
         if not _image_instances and _draw_handle is not None:
-            bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
+            remove_draw_handler(_draw_handle)
             _draw_handle = None
         
         context.area.tag_redraw()
@@ -404,7 +702,7 @@ class ClearImageOP(bpy.types.Operator):
         _image_instances.clear()
         
         if _draw_handle is not None:
-            bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
+            remove_draw_handler(_draw_handle)
             _draw_handle = None
         
         context.area.tag_redraw()
@@ -415,7 +713,7 @@ class UpdateImageOP(bpy.types.Operator):
     bl_label = "Update Image Instance"
     
     def get_image_items(self, context):
-        image_manager._load_images()
+        image_manager._scan_images()
         # Add a "no change" option at the beginning
         items = [("__NOCHANGE__", "No Change", "Don't change the image")]
         items.extend([(name, name, "") for name in image_manager.get_available_images()])
@@ -537,17 +835,19 @@ def register():
     bpy.utils.register_class(UpdateImageOP)
 
 def unregister():
-    global _draw_handle, _image_instances, image_manager, _image_shader_with_opacity
+    global _draw_handle, _image_instances, image_manager, _image_shader_with_opacity, _placeholder_shader, _placeholder_batch
     
     # Force clear all image instances
     _image_instances.clear()
     
     if _draw_handle is not None:
-        bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
+        remove_draw_handler(_draw_handle)
         _draw_handle = None
     
-    # Clear the cached shader
+    # Clear the cached shaders
     _image_shader_with_opacity = None
+    _placeholder_shader = None
+    _placeholder_batch = None
     
     # Unload images and reset the singleton
     ImageManager.reset_instance()
@@ -0,0 +1,203 @@
+# Created by XWZ
+# ◕‿◕ Distributed for free at:
+# https://github.com/nicolaiprodromov/puree
+# ╔═════════════════════════════════╗
+# ║  ██   ██  ██      ██  ████████  ║
+# ║   ██ ██   ██  ██  ██       ██   ║
+# ║    ███    ██  ██  ██     ██     ║
+# ║   ██ ██   ██  ██  ██   ██       ║
+# ║  ██   ██   ████████   ████████  ║
+# ╚═════════════════════════════════╝
+import bpy
+import math
+import time
+
+from . import hit_op
+from . import text_input_op
+from .scroll_op import scroll_state
+from .mouse_op import mouse_state
+
+SCROLL_SPEED = 10
+CLICK_DELAY  = 1.0
+
+_running_dispatcher = None
+
+class XWZ_OT_input_dispatch(bpy.types.Operator):
+    """Single modal handler for all UI input.
+
+    Every window event is normalized once against the region the operator
+    was launched in, then routed: pointer motion is coalesced and hit tested
+    at most once per frame (on the next TIMER tick), clicks are hit tested
+    right away, wheel and trackpad input feed the scroll state, and all other
+    events go to the focused text input.
+    """
+    bl_idname  = "xwz.input_dispatch"
+    bl_label   = "Dispatch UI input"
+    bl_options = {'REGISTER'}
+    
+    def invoke(self, context, event):
+        global _running_dispatcher
+        
+        from .space_config import get_target_space
+        self.space_type       = get_target_space() or 'VIEW_3D'
+        self.should_stop      = False
+        self.start_time       = time.time()
+        self.click_enabled    = False
+        self.mouse_x          = 0
+        self.mouse_y          = 0
+        self.inside           = False
+        self.pending_move     = False
+        self.trackpad_y_accum = 0
+        self.scroll_offset    = scroll_state.scroll_value
+        
+        mouse_state.is_clicked = False
+        hit_op.start_hit_detection()
+        
+        self._routes = {
+            'MOUSEMOVE'     : self.on_mouse_move,
+            'LEFTMOUSE'     : self.on_left_mouse,
+            'WHEELUPMOUSE'  : self.on_wheel,
+            'WHEELDOWNMOUSE': self.on_wheel,
+            'TRACKPADPAN'   : self.on_trackpad,
+            'TIMER'         : self.on_frame,
+        }
+        
+        _running_dispatcher = self
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        global _running_dispatcher
+        
+        if self.should_stop:
+            if _running_dispatcher is self:
+                _running_dispatcher = None
+            return {'CANCELLED'}
+        
+        region = context.region
+        area   = context.area
+        if not (region and area and area.type == self.space_type):
+            return {'PASS_THROUGH'}
+        
+        self.width   = region.width
+        self.height  = region.height
+        self.mouse_x = event.mouse_region_x
+        self.mouse_y = event.mouse_region_y
+        self.inside  = 0 <= self.mouse_x <= self.width and 0 <= self.mouse_y <= self.height
+        
+        route = self._routes.get(event.type)
+        if route is not None:
+            route(event)
+            return {'PASS_THROUGH'}
+        
+        if text_input_op._active_input_id is not None:
+            return text_input_op.handle_keyboard_event(context, event)
+        
+        return {'PASS_THROUGH'}
+    
+    def on_mouse_move(self, event):
+        self.pending_move = True
+    
+    def on_left_mouse(self, event):
+        if not self.click_enabled:
+            self.click_enabled = time.time() - self.start_time >= CLICK_DELAY
+            if not self.click_enabled:
+                return
+        
+        if event.value == 'PRESS':
+            clicked = True
+        elif event.value == 'RELEASE':
+            clicked = False
+        else:
+            return
+        
+        # A press and its release can land in the same frame, so clicks are
+        # hit tested immediately instead of waiting for the frame tick.
+        self.flush_mouse()
+        mouse_state.update_click(clicked)
+        self.hit_test()
+    
+    def on_wheel(self, event):
+        if event.value != 'PRESS' or not self.inside:
+            return
+        self.scroll(-1 if event.type == 'WHEELUPMOUSE' else 1)
+    
+    def on_trackpad(self, event):
+        if not self.inside:
+            return
+        self.trackpad_y_accum += event.mouse_y - event.mouse_prev_y
+        
+        sensitivity = max(1, 100 - SCROLL_SPEED)
+        if abs(self.trackpad_y_accum) > sensitivity:
+            scroll_delta = math.floor(self.trackpad_y_accum / sensitivity)
+            self.trackpad_y_accum -= scroll_delta * sensitivity
+            self.scroll(scroll_delta)
+    
+    def scroll(self, scroll_delta):
+        self.scroll_offset += scroll_delta
+        scroll_state.update(scroll_delta, self.scroll_offset)
+    
+    def on_frame(self, event):
+        if not self.click_enabled:
+            self.click_enabled = time.time() - self.start_time >= CLICK_DELAY
+        
+        scrolled = scroll_state.scroll_value != scroll_state._prev_scroll_value
+        if self.pending_move or scrolled or hit_op.needs_update():
+            self.flush_mouse()
+            self.hit_test()
+    
+    def flush_mouse(self):
+        if not self.pending_move:
+            return
+        self.pending_move = False
+        raw_x = self.mouse_x / self.width
+        raw_y = self.mouse_y / self.height
+        mouse_state.update_mouse([raw_x * 2.0 - 1.0, (1.0 - raw_y) * 2.0 - 1.0])
+    
+    def hit_test(self):
+        if self.inside:
+            hit_op.run_hit_test(self.mouse_x, self.height - self.mouse_y)
+
+class XWZ_OT_input_dispatch_launch(bpy.types.Operator):
+    bl_idname  = "xwz.input_dispatch_launch"
+    bl_label   = "Input Context Fix"
+    bl_options = {'INTERNAL'}
+    
+    def execute(self, context):
+        context_dict = {
+            "area"          : context.area,
+            "region"        : context.region,
+            "space_data"    : context.space_data,
+            "screen"        : context.screen,
+            "scene"         : context.scene,
+            "window"        : context.window,
+            "window_manager": context.window_manager,
+        }
+        
+        try:
+            with context.temp_override(**context_dict):
+                bpy.ops.xwz.input_dispatch('INVOKE_DEFAULT')
+        except Exception as e:
+            print(f"Error invoking input dispatcher: {e}")
+        return {'FINISHED'}
+
+def stop_input_dispatch():
+    global _running_dispatcher
+    if _running_dispatcher:
+        _running_dispatcher.should_stop = True
+        _running_dispatcher = None
+    hit_op.stop_hit_detection()
+
+classes = [
+    XWZ_OT_input_dispatch,
+    XWZ_OT_input_dispatch_launch,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    stop_input_dispatch()
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -10,7 +10,7 @@
 # ╚═════════════════════════════════╝
 import os
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 native_binaries_dir = os.path.join(current_dir, 'native_binaries')
@@ -30,6 +30,15 @@ finally:
 
 
 class HitDetector:
+    HOVERED       = puree_rust_core.HitDetector.HOVERED
+    CLICKED       = puree_rust_core.HitDetector.CLICKED
+    HOVER_CHANGED = puree_rust_core.HitDetector.HOVER_CHANGED
+    CLICK_CHANGED = puree_rust_core.HitDetector.CLICK_CHANGED
+    CHILDREN_HIT  = puree_rust_core.HitDetector.CHILDREN_HIT
+    TOGGLED       = puree_rust_core.HitDetector.TOGGLED
+    TOGGLE_VALUE  = puree_rust_core.HitDetector.TOGGLE_VALUE
+    SCROLLED      = puree_rust_core.HitDetector.SCROLLED
+    
     def __init__(self):
         self._detector = puree_rust_core.HitDetector()
     
@@ -41,12 +50,45 @@ class HitDetector:
             print(f"❌ Error loading containers: {e}")
             return False
     
+    def load_geometry(self, boxes, parents, flags, radius) -> bool:
+        try:
+            self._detector.load_geometry(boxes, parents, flags, radius)
+            return True
+        except Exception as e:
+            print(f"❌ Error loading container geometry: {e}")
+            return False
+    
+    def update_positions(self, boxes) -> bool:
+        try:
+            self._detector.update_positions(boxes)
+            return True
+        except Exception as e:
+            print(f"❌ Error updating container positions: {e}")
+            return False
+    
+    def set_scroll_limits(self, limits) -> bool:
+        try:
+            self._detector.set_scroll_limits(limits)
+            return True
+        except Exception as e:
+            print(f"❌ Error setting scroll limits: {e}")
+            return False
+    
     def update_mouse(self, x: float, y: float, clicked: bool, scroll_delta: float = 0.0):
         self._detector.update_mouse(x, y, clicked, scroll_delta)
     
     def detect_hits(self) -> List[Dict[str, Any]]:
         return self._detector.detect_hits()
     
+    def detect_hit_changes(self) -> List[Tuple[int, int]]:
+        return self._detector.detect_hit_changes()
+    
+    def state_view(self) -> bytes:
+        return self._detector.state_view()
+    
+    def get_state(self, container_index: int) -> Tuple[int, float]:
+        return self._detector.get_state(container_index)
+    
     def detect_hover(self, container_index: int) -> bool:
         return self._detector.detect_hover(container_index)
     
@@ -128,8 +170,8 @@ class ContainerProcessor:
     def __init__(self):
         self._processor = puree_rust_core.ContainerProcessor()
     
-    def flatten_tree(self, root: Dict[str, Any], node_flat_abs: Dict[str, Any]) -> List[Dict[str, Any]]:
-        return self._processor.flatten_tree(root, node_flat_abs)
+    def flatten_tree(self, root: Dict[str, Any], boxes: Any) -> List[Dict[str, Any]]:
+        return self._processor.flatten_tree(root, boxes)
     
     def update_positions_bulk(
         self,
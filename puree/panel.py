@@ -166,6 +166,16 @@ def register_dynamic_panel():
                 col.label(text=f"Texture: {render._render_data.texture_size[0]}x{render._render_data.texture_size[1]}")
                 col.label(text=f"FPS: {render._render_data.compute_fps:.1f}")
                 
+                from .text_op import text_metrics, font_manager
+                text_stats = text_metrics.stats()
+                col.label(text=f"Text cache: {text_stats['hit_rate'] * 100.0:.1f}% hits, {text_stats['entries']} entries")
+                col.label(text=f"Text draw: {text_stats['draw_ms']:.2f} ms, {text_stats['saved_ms']:.1f} ms saved")
+                if font_manager is not None:
+                    col.label(text=f"Fonts: {len(font_manager.get_loaded_fonts())} of {len(font_manager.get_available_fonts())} loaded")
+                from .img_op import image_manager
+                if image_manager is not None:
+                    col.label(text=f"Images: {len(image_manager.textures)} loaded, {image_manager.get_memory_usage() / (1024 * 1024):.1f} / {context.window_manager.xwz_image_budget_mb} MB")
+                
                 box = layout.box()
                 col = box.column(align=True)
                 col.label(text="Container Hierarchy:", icon='OUTLINER')
@@ -10,6 +10,7 @@
 # ╚═════════════════════════════════╝
 import os
 import re
+import time
 import yaml
 
 from stretchable import Node
@@ -24,13 +25,15 @@ from stretchable.style.geometry.length import LengthPointsPercent
 
 from .components.container import Container
 from .components.style import Style
+from .components.registry import ComponentRegistry
 from .native_bindings import ContainerProcessor, CSSParser, SCSSCompiler, ColorProcessor
-
-node_flat = {}
-node_flat_abs = {}
+from .box_store import BoxStore
+from . import snapshot
 
 color_processor = ColorProcessor()
 
+_PARAM_PATTERN = re.compile(r'\{\{(\w+)\s*,\s*["\']([^"\']*?)["\']\}\}')
+
 class Settings():
     def __init__(self):
         self.scroll_speed = 0
@@ -61,14 +64,77 @@ class UI():
         self.abs_json_data  = []
         self.root_node      = None
         self.canvas_size    = canvas_size
+        self.box_store      = BoxStore()
+        self.from_snapshot  = False
+        self._default_style = None
+        self._id_index      = {}
+        self.virtual_lists  = {}
+
+        start_time = time.perf_counter()
+        self.load_styled_tree(path, base_dir)
+        self.materialize_virtual_lists(canvas_size)
+        self.create_node_tree(canvas_size)
+        self.flatten_node_tree()
+        self.load_time = time.perf_counter() - start_time
+
+    def load_styled_tree(self, path, base_dir):
+        snapshot_key = None
+        if path is not None and base_dir is not None:
+            try:
+                snapshot_key = snapshot.compute_snapshot_key(path, base_dir)
+                self.from_snapshot = snapshot.load_snapshot(self, path, base_dir, snapshot_key)
+            except Exception as e:
+                print(f"UI snapshot lookup failed, parsing from source: {e}")
+                snapshot_key = None
+
+        if self.from_snapshot:
+            return
 
         self.parse_toml(path, base_dir)
         self.parse_css()
-        self.create_node_tree(canvas_size)
-        self.flatten_node_tree()
+
+        if snapshot_key is not None:
+            snapshot.save_snapshot(self, path, base_dir, snapshot_key)
+
+    def materialize_virtual_lists(self, canvas_size):
+        # Runs after the snapshot is taken, so cached trees keep only the
+        # template row and the pool follows the current canvas.
+        from .virtual_list import VirtualList, find_virtual_containers
+        self.virtual_lists = {}
+        for container in find_virtual_containers(self.theme.root):
+            virtual_list = VirtualList.materialize(container, canvas_size[1])
+            if virtual_list is not None:
+                self.virtual_lists[container.id] = virtual_list
+
+    def get_virtual_list(self, target_id):
+        container = self.get_by_id(target_id)
+        return self.virtual_lists.get(container.id) if container is not None else None
 
     def get_by_id(self, target_id):
-        return self.theme.root.get_by_id(target_id)
+        return self._id_index.get(target_id)
+
+    def rebuild_id_index(self):
+        # Every container is registered under its full id and under each
+        # suffix following an underscore; the first pre-order match wins,
+        # the same container Container.get_by_id's suffix search returns.
+        id_index = {}
+        for container in self.box_store.containers:
+            container_id = container.id
+            id_index.setdefault(container_id, container)
+            separator = container_id.find('_')
+            while separator != -1:
+                id_index.setdefault(container_id[separator + 1:], container)
+                separator = container_id.find('_', separator + 1)
+        self._id_index = id_index
+
+    def default_style(self):
+        if self._default_style is None:
+            style = Style()
+            style.width   = "100%"
+            style.height  = "100%"
+            style._shared = True
+            self._default_style = style
+        return self._default_style
 
     def load_conf_file(self, path):
         with open(path, 'r') as f:
@@ -140,11 +206,57 @@ class UI():
             self.theme.default_font = theme[self.theme_index]['default_font']
             self.theme.components = theme[self.theme_index]['components']
 
+        def substitute_params(value, params):
+            if not isinstance(value, str):
+                return value
+            
+            def replace_param(match):
+                param_name = match.group(1)
+                default_value = match.group(2)
+                return str(params.get(param_name, default_value))
+            
+            return _PARAM_PATTERN.sub(replace_param, value)
+        
+        def namespace_style(value, component_base_name, component_root):
+            if value == component_base_name:
+                return component_root.id
+            if value.startswith(component_base_name + '_'):
+                return value.replace(component_base_name, component_root.id, 1)
+            return value
+        
+        def load_component_with_namespace(comp_data, parent, component_base_name, params, component_root=None):
+            component_root = component_root or parent
+            for attr_name, attr_value in comp_data.items():
+                if isinstance(attr_value, dict):
+                    namespaced_child = Container()
+                    namespaced_child.id = f"{parent.id}_{attr_name}"
+                    namespaced_child.parent = parent
+                    parent.children.append(namespaced_child)
+                    
+                    for child_attr_name, child_attr_value in attr_value.items():
+                        if not isinstance(child_attr_value, dict):
+                            if hasattr(namespaced_child, child_attr_name):
+                                substituted_value = substitute_params(child_attr_value, params)
+                                if child_attr_name == 'style' and isinstance(substituted_value, str):
+                                    substituted_value = namespace_style(substituted_value, component_base_name, component_root)
+                                setattr(namespaced_child, child_attr_name.replace('-', '_'), substituted_value)
+                    
+                    load_component_with_namespace(attr_value, namespaced_child, component_base_name, params, component_root)
+                else:
+                    if hasattr(parent, attr_name):
+                        substituted_value = substitute_params(attr_value, params)
+                        if attr_name == 'style' and isinstance(substituted_value, str):
+                            substituted_value = namespace_style(substituted_value, component_base_name, component_root)
+                        setattr(parent, attr_name.replace('-', '_'), substituted_value)
+
+        def is_component_ref(value):
+            return isinstance(value, str) and value.startswith('[') and value.endswith(']')
+
         def load_container(container_data, parent_container):
             for attr_name, attr_value in container_data.items():
 
                 if isinstance(attr_value, dict):
-                    has_component_data = 'data' in attr_value and isinstance(attr_value['data'], str) and attr_value['data'].startswith('[') and attr_value['data'].endswith(']')
+                    has_component_data = is_component_ref(attr_value.get('data'))
                     
                     child_container = Container()
                     if parent_container.id == "root":
@@ -160,95 +272,36 @@ class UI():
                                 if not (child_attr_name == 'data' and has_component_data):
                                     setattr(child_container, child_attr_name.replace('-', '_'), child_attr_value)
                     
-                    if has_component_data:
+                    if is_component_ref(child_container.virtual):
+                        # Virtual lists hold one instance of their row
+                        # component; the pool is cloned from it after
+                        # styles are applied.
+                        component_key = child_container.virtual[1:-1]
+                        row_container = Container()
+                        row_container.id = f"{child_container.id}_row0"
+                        row_container.parent = child_container
+                        child_container.children.append(row_container)
+                        if component_key in component_registry:
+                            component_data = component_registry.get_template(component_key)
+                            component_styles = component_registry.get_styles(component_key, row_container.id, {})
+                            self.theme.styles.__dict__.update(component_styles)
+                            load_component_with_namespace(component_data, row_container, component_key, {})
+                        else:
+                            print(f"Warning: Row component '{component_key}' of virtual list '{child_container.id}' not found")
+                    elif has_component_data:
                         component_ref = attr_value['data']
-                        component_dir = os.path.join(base_dir, self.theme.components)
-                        component_loaded = False
+                        component_key = component_ref[1:-1]
                         
                         component_params = {}
                         for param_name, param_value in attr_value.items():
                             if not isinstance(param_value, dict) and param_name != 'data':
                                 component_params[param_name] = param_value
                         
-                        for root, dirs, files in os.walk(component_dir):
-                            for filename in files:
-                                if filename.endswith('.yaml') and f'[{filename.replace(".yaml", "")}]' == component_ref:
-                                    file_path = os.path.join(root, filename)
-                                    component_base_name = filename.replace('.yaml', '')
-                                    scss_file_path = os.path.join(root, f"{component_base_name}.scss")
-                                    
-                                    with open(file_path, 'r') as f:
-                                        component_data = yaml.safe_load(f)
-                                        component_key = component_ref.replace("[",'').replace("]",'')
-                                        
-                                        if os.path.exists(scss_file_path):
-                                            scss_compiler = SCSSCompiler()
-                                            namespace = child_container.id
-                                            compiled_css = scss_compiler.compile_file(
-                                                scss_file_path,
-                                                namespace=namespace,
-                                                param_overrides=component_params,
-                                                component_name=component_base_name
-                                            )
-                                            
-                                            css_parser = CSSParser()
-                                            component_styles = css_parser.parse(compiled_css)
-                                            for selector, declarations in component_styles.items():
-                                                style_obj = Style()
-                                                style_obj.id = selector
-                                                for prop, value in declarations.items():
-                                                    attr_name_parsed, attr_value_parsed = self.parse_container_props_from_style(prop, value)
-                                                    setattr(style_obj, attr_name_parsed, attr_value_parsed)
-                                                self.theme.styles.__dict__[selector] = style_obj
-                                        
-                                        def substitute_params(value, params):
-                                            if not isinstance(value, str):
-                                                return value
-                                            
-                                            pattern = r'\{\{(\w+)\s*,\s*["\']([^"\']*?)["\']\}\}'
-                                            
-                                            def replace_param(match):
-                                                param_name = match.group(1)
-                                                default_value = match.group(2)
-                                                return str(params.get(param_name, default_value))
-                                            
-                                            return re.sub(pattern, replace_param, value)
-                                        
-                                        def load_component_with_namespace(comp_data, parent, namespace_prefix, params):
-                                            for attr_name, attr_value in comp_data.items():
-                                                if isinstance(attr_value, dict):
-                                                    namespaced_child = Container()
-                                                    namespaced_child.id = f"{parent.id}_{attr_name}"
-                                                    namespaced_child.parent = parent
-                                                    parent.children.append(namespaced_child)
-                                                    
-                                                    for child_attr_name, child_attr_value in attr_value.items():
-                                                        if not isinstance(child_attr_value, dict):
-                                                            if hasattr(namespaced_child, child_attr_name):
-                                                                substituted_value = substitute_params(child_attr_value, params)
-                                                                if child_attr_name == 'style' and isinstance(substituted_value, str):
-                                                                    if substituted_value == component_base_name:
-                                                                        substituted_value = child_container.id
-                                                                    elif substituted_value.startswith(component_base_name + '_'):
-                                                                        substituted_value = substituted_value.replace(component_base_name, child_container.id, 1)
-                                                                setattr(namespaced_child, child_attr_name.replace('-', '_'), substituted_value)
-                                                    
-                                                    load_component_with_namespace(attr_value, namespaced_child, namespaced_child.id, params)
-                                                else:
-                                                    if hasattr(parent, attr_name):
-                                                        substituted_value = substitute_params(attr_value, params)
-                                                        if attr_name == 'style' and isinstance(substituted_value, str):
-                                                            if substituted_value == component_base_name:
-                                                                substituted_value = child_container.id
-                                                            elif substituted_value.startswith(component_base_name + '_'):
-                                                                substituted_value = substituted_value.replace(component_base_name, child_container.id, 1)
-                                                        setattr(parent, attr_name.replace('-', '_'), substituted_value)
-                                        
-                                        load_component_with_namespace(component_data[component_key], child_container, attr_name, component_params)
-                                        component_loaded = True
-                                    break
-                            if component_loaded:
-                                break
+                        if component_key in component_registry:
+                            component_data = component_registry.get_template(component_key)
+                            component_styles = component_registry.get_styles(component_key, child_container.id, component_params)
+                            self.theme.styles.__dict__.update(component_styles)
+                            load_component_with_namespace(component_data, child_container, component_key, component_params)
                     else:
                         load_container(attr_value, child_container)
 
@@ -257,6 +310,11 @@ class UI():
                         setattr(parent_container, attr_name.replace('-', '_'), attr_value)
 
 
+        component_registry = ComponentRegistry(
+            os.path.join(base_dir, self.theme.components),
+            self.parse_container_props_from_style
+        )
+
         self.theme.root.id = "root"
         load_container(root, self.theme.root)
 
@@ -358,67 +416,20 @@ class UI():
                 setattr(style_obj, attr_name, attr_value)
             self.theme.styles.__dict__[selector_clean] = style_obj
         def apply_styles_to_containers(container):
-            if hasattr(container, 'style') and container.style:
-                style_name = container.style
-                if isinstance(style_name, str):
-                    if hasattr(self.theme.styles, style_name):
-                        original_style = getattr(self.theme.styles, style_name)
-                        style_copy = Style()
-                        style_copy.id = original_style.id
-                        for attr_name in dir(original_style):
-                            if not attr_name.startswith('_'):
-                                try:
-                                    attr_value = getattr(original_style, attr_name)
-                                    if not callable(attr_value):
-                                        if isinstance(attr_value, list):
-                                            setattr(style_copy, attr_name, attr_value.copy())
-                                        else:
-                                            setattr(style_copy, attr_name, attr_value)
-                                except AttributeError:
-                                    pass
-                        container.style = style_copy
-                    else:
-                        print(f"Warning: Style '{style_name}' not found, using default")
-                        default_style = Style()
-                        setattr(default_style, 'width', "100%")
-                        setattr(default_style, 'height', "100%")
-                        container.style = default_style
+            style_name = container._style
+            if style_name and isinstance(style_name, str):
+                if hasattr(self.theme.styles, style_name):
+                    shared_style = getattr(self.theme.styles, style_name)
+                    shared_style._shared = True
+                    container.style = shared_style
+                else:
+                    print(f"Warning: Style '{style_name}' not found, using default")
+                    container.style = self.default_style()
             for child in container.children:
                 apply_styles_to_containers(child)
         apply_styles_to_containers(self.theme.root)
 
     def create_node_tree(self, canvas_size=(800, 600)):
-        def get_all_nodes(container, node):
-            border_box     = node.get_box(Edge.BORDER, relative=True)
-            border_box_abs = node.get_box(Edge.BORDER, relative=False)
-            content_box    = node.get_box(Edge.CONTENT, relative=True)
-            content_box_abs = node.get_box(Edge.CONTENT, relative=False)
-            padding_box    = node.get_box(Edge.PADDING, relative=True)
-            margin_box     = node.get_box(Edge.MARGIN, relative=True)
-            margin_box_abs = node.get_box(Edge.MARGIN, relative=False)
-            
-            edge_used, edge_used_abs = border_box, border_box_abs
-
-            node_flat[container.id] = {
-                'x'      : edge_used.x,
-                'y'      : edge_used.y,
-                'width'  : edge_used.width,
-                'height' : edge_used.height
-            }
-
-            node_flat_abs[container.id] = {
-                'x'      : edge_used_abs.x,
-                'y'      : edge_used_abs.y,
-                'width'  : edge_used_abs.width,
-                'height' : edge_used_abs.height
-            }
-            
-            container._layout_node = node
-            
-            for i, _container in enumerate(container.children):
-                get_all_nodes(_container, node[i])
-
-            return
         def parse_css_value(value_str):
             value_str = str(value_str).lower()
             if 'px' in value_str and 'calc(' not in value_str:
@@ -430,16 +441,16 @@ class UI():
             return LengthPointsPercent.from_any(0 * PT)
         def parse_padding_values(container):
             top = right = bottom = left = LengthPointsPercent.from_any(0 * PT)
-            if hasattr(container.style, 'padding_top'):
-                top = parse_css_value(container.style.padding_top)
-            if hasattr(container.style, 'padding_right'):
-                right = parse_css_value(container.style.padding_right)
-            if hasattr(container.style, 'padding_bottom'):
-                bottom = parse_css_value(container.style.padding_bottom)
-            if hasattr(container.style, 'padding_left'):
-                left = parse_css_value(container.style.padding_left)
-            if hasattr(container.style, 'padding') and isinstance(container.style.padding, str):
-                padding_str = container.style.padding.strip().lower()
+            if hasattr(container._style, 'padding_top'):
+                top = parse_css_value(container._style.padding_top)
+            if hasattr(container._style, 'padding_right'):
+                right = parse_css_value(container._style.padding_right)
+            if hasattr(container._style, 'padding_bottom'):
+                bottom = parse_css_value(container._style.padding_bottom)
+            if hasattr(container._style, 'padding_left'):
+                left = parse_css_value(container._style.padding_left)
+            if hasattr(container._style, 'padding') and isinstance(container._style.padding, str):
+                padding_str = container._style.padding.strip().lower()
                 if 'calc(' not in padding_str:
                     values = padding_str.split()
                     if len(values) == 1:
@@ -463,16 +474,16 @@ class UI():
             return RectPointsPercent.from_any([top, right, bottom, left])
         def parse_margin_values(container):
             top = right = bottom = left = LengthPointsPercent.from_any(0 * PT)
-            if hasattr(container.style, 'margin_top'):
-                top = parse_css_value(container.style.margin_top)
-            if hasattr(container.style, 'margin_right'):
-                right = parse_css_value(container.style.margin_right)
-            if hasattr(container.style, 'margin_bottom'):
-                bottom = parse_css_value(container.style.margin_bottom)
-            if hasattr(container.style, 'margin_left'):
-                left = parse_css_value(container.style.margin_left)
-            if hasattr(container.style, 'margin') and isinstance(container.style.margin, str):
-                margin_str = container.style.margin.strip().lower()
+            if hasattr(container._style, 'margin_top'):
+                top = parse_css_value(container._style.margin_top)
+            if hasattr(container._style, 'margin_right'):
+                right = parse_css_value(container._style.margin_right)
+            if hasattr(container._style, 'margin_bottom'):
+                bottom = parse_css_value(container._style.margin_bottom)
+            if hasattr(container._style, 'margin_left'):
+                left = parse_css_value(container._style.margin_left)
+            if hasattr(container._style, 'margin') and isinstance(container._style.margin, str):
+                margin_str = container._style.margin.strip().lower()
                 if 'calc(' not in margin_str:
                     values = margin_str.split()
                     
@@ -498,8 +509,8 @@ class UI():
         def parse_border_values(container):
             width_top = width_right = width_bottom = width_left = LengthPointsPercent.from_any(0 * PT)
             
-            if hasattr(container.style, 'border_width') and isinstance(container.style.border_width, str):
-                border_width_str = container.style.border_width.strip().lower()
+            if hasattr(container._style, 'border_width') and isinstance(container._style.border_width, str):
+                border_width_str = container._style.border_width.strip().lower()
                 if 'calc(' not in border_width_str:
                     # Split on whitespace - this handles multiple spaces correctly
                     values = border_width_str.split()
@@ -523,8 +534,8 @@ class UI():
                         width_bottom = parse_css_value(values[2])
                         width_left = parse_css_value(values[3])
             
-            if hasattr(container.style, 'border') and isinstance(container.style.border, str):
-                border_str = container.style.border.strip().lower()
+            if hasattr(container._style, 'border') and isinstance(container._style.border, str):
+                border_str = container._style.border.strip().lower()
                 if 'calc(' not in border_str:
                     # Split on whitespace - this handles multiple spaces correctly
                     parts = border_str.split()
@@ -533,32 +544,29 @@ class UI():
                             val = parse_css_value(part)
                             width_top = width_right = width_bottom = width_left = val
                         elif part.startswith('#') or part in ['red', 'blue', 'green', 'black', 'white', 'transparent']:
-                            setattr(container.style, 'border_color_css', part)
+                            setattr(container._style, 'border_color_css', part)
             
-            if hasattr(container.style, 'border_color') and isinstance(container.style.border_color, str):
-                setattr(container.style, 'border_color_css', container.style.border_color.lower())
+            if hasattr(container._style, 'border_color') and isinstance(container._style.border_color, str):
+                setattr(container._style, 'border_color_css', container._style.border_color.lower())
                         
             return RectPointsPercent.from_any([width_top, width_right, width_bottom, width_left])
         def create_node(container):
-            if not hasattr(container, 'style') or container.style is None or isinstance(container.style, str):
-                default_style = Style()
-                setattr(default_style, 'width', "100%")
-                setattr(default_style, 'height', "100%")
-                container.style = default_style
+            if container._style is None or isinstance(container._style, str):
+                container.style = self.default_style()
             
-            disp_str     = container.style.display.lower()
-            pos_str      = container.style.position.lower()
+            disp_str     = container._style.display.lower()
+            pos_str      = container._style.position.lower()
             position_val = Position.RELATIVE
             display_val  = Display.FLEX
 
-            width_val    = container.style.width
-            height_val   = container.style.height
+            width_val    = container._style.width
+            height_val   = container._style.height
             width_pct    = 0
             height_pct   = 0
             
-            flex_dir_str        = container.style.flex_direction.lower().replace('-', '_')
-            align_str           = container.style.align_items.lower().replace('-', '_')
-            justify_str         = container.style.justify_content.lower().replace('-', '_')
+            flex_dir_str        = container._style.flex_direction.lower().replace('-', '_')
+            align_str           = container._style.align_items.lower().replace('-', '_')
+            justify_str         = container._style.justify_content.lower().replace('-', '_')
             flex_direction_val  = FlexDirection.ROW
             align_items_val     = AlignItems.START
             justify_content_val = JustifyContent.START
@@ -640,6 +648,7 @@ class UI():
                 margin          = margin_val,
                 border          = border_val,
             )
+            container._layout_node = node
             
             for child in container.children:
                 child_node = create_node(child)
@@ -650,41 +659,28 @@ class UI():
         self.root_node = create_node(self.theme.root)
         self.root_node.compute_layout(canvas_size)
         self.canvas_size = canvas_size
-        get_all_nodes(self.theme.root, self.root_node)
+        self.box_store.allocate(self.theme.root)
+        self.rebuild_id_index()
+        for virtual_list in self.virtual_lists.values():
+            virtual_list.attach(self.box_store)
+        self.update_box_store()
+
+    def update_box_store(self):
+        box_store = self.box_store
+        for container in box_store.containers:
+            node = container._layout_node
+            box_store.write(
+                container._index,
+                node.get_box(Edge.BORDER, relative=True),
+                node.get_box(Edge.BORDER, relative=False)
+            )
+        box_store.update_attributes()
+        box_store.update_scroll()
 
     def recompute_layout(self, canvas_size):
-        global node_flat, node_flat_abs
-        
-        node_flat.clear()
-        node_flat_abs.clear()
-        
         self.root_node.compute_layout(canvas_size)
         self.canvas_size = canvas_size
-        
-        def get_all_nodes(container, node):
-            border_box     = node.get_box(Edge.BORDER, relative=True)
-            border_box_abs = node.get_box(Edge.BORDER, relative=False)
-            
-            edge_used, edge_used_abs = border_box, border_box_abs
-
-            node_flat[container.id] = {
-                'x'      : edge_used.x,
-                'y'      : edge_used.y,
-                'width'  : edge_used.width,
-                'height' : edge_used.height
-            }
-
-            node_flat_abs[container.id] = {
-                'x'      : edge_used_abs.x,
-                'y'      : edge_used_abs.y,
-                'width'  : edge_used_abs.width,
-                'height' : edge_used_abs.height
-            }
-            
-            for i, _container in enumerate(container.children):
-                get_all_nodes(_container, node[i])
-        
-        get_all_nodes(self.theme.root, self.root_node)
+        self.update_box_store()
         
         self.json_data = []
         self.abs_json_data = []
@@ -697,8 +693,8 @@ class UI():
         
         container_dict = self._container_to_dict(self.theme.root)
         
-        self.json_data = container_processor.flatten_tree(container_dict, node_flat)
-        self.abs_json_data = container_processor.flatten_tree(container_dict, node_flat_abs)
+        self.json_data = container_processor.flatten_tree(container_dict, self.box_store.relative)
+        self.abs_json_data = container_processor.flatten_tree(container_dict, self.box_store.absolute)
     
     def _container_to_dict(self, container):
         def ensure_string(val):
@@ -709,39 +705,39 @@ class UI():
             else:
                 return str(val)
         
-        display_str = ensure_string(container.style.display)
-        overflow_str = ensure_string(container.style.overflow)
+        display_str = ensure_string(container._style.display)
+        overflow_str = ensure_string(container._style.overflow)
         
         container_dict = {
             'id': container.id,
             'style': {
-                'id': container.style.id if hasattr(container.style, 'id') else '',
+                'id': container._style.id if hasattr(container._style, 'id') else '',
                 'display': display_str,
                 'overflow': overflow_str,
-                'color': list(container.style.color),
-                'color_1': list(container.style.color_1),
-                'color_gradient_rot': float(container.style.color_gradient_rot),
-                'hover_color': list(container.style.hover_color),
-                'hover_color_1': list(container.style.hover_color_1),
-                'hover_color_gradient_rot': float(container.style.hover_color_gradient_rot),
-                'click_color': list(container.style.click_color),
-                'click_color_1': list(container.style.click_color_1),
-                'click_color_gradient_rot': float(container.style.click_color_gradient_rot),
-                'border_color': list(container.style.border_color),
-                'border_color_1': list(container.style.border_color_1),
-                'border_color_gradient_rot': float(container.style.border_color_gradient_rot),
-                'border_radius': float(container.style.border_radius),
-                'border_width': float(container.style.border_width),
-                'text_color': list(container.style.text_color),
-                'text_color_1': list(container.style.text_color_1),
-                'text_color_gradient_rot': float(container.style.text_color_gradient_rot),
-                'text_scale': float(container.style.text_scale),
-                'text_x': float(container.style.text_x),
-                'text_y': float(container.style.text_y),
-                'box_shadow_color': list(container.style.box_shadow_color),
-                'box_shadow_offset': list(container.style.box_shadow_offset),
-                'box_shadow_blur': float(container.style.box_shadow_blur),
-                'aspect_ratio': bool(container.style.aspect_ratio),
+                'color': list(container._style.color),
+                'color_1': list(container._style.color_1),
+                'color_gradient_rot': float(container._style.color_gradient_rot),
+                'hover_color': list(container._style.hover_color),
+                'hover_color_1': list(container._style.hover_color_1),
+                'hover_color_gradient_rot': float(container._style.hover_color_gradient_rot),
+                'click_color': list(container._style.click_color),
+                'click_color_1': list(container._style.click_color_1),
+                'click_color_gradient_rot': float(container._style.click_color_gradient_rot),
+                'border_color': list(container._style.border_color),
+                'border_color_1': list(container._style.border_color_1),
+                'border_color_gradient_rot': float(container._style.border_color_gradient_rot),
+                'border_radius': float(container._style.border_radius),
+                'border_width': float(container._style.border_width),
+                'text_color': list(container._style.text_color),
+                'text_color_1': list(container._style.text_color_1),
+                'text_color_gradient_rot': float(container._style.text_color_gradient_rot),
+                'text_scale': float(container._style.text_scale),
+                'text_x': float(container._style.text_x),
+                'text_y': float(container._style.text_y),
+                'box_shadow_color': list(container._style.box_shadow_color),
+                'box_shadow_offset': list(container._style.box_shadow_offset),
+                'box_shadow_blur': float(container._style.box_shadow_blur),
+                'aspect_ratio': bool(container._style.aspect_ratio),
             },
             'data': str(container.data),
             'img': str(container.img),
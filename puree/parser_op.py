@@ -15,6 +15,7 @@ from .compiler  import Compiler
 from .extract_images import ImageExtractor
 from .extract_text   import TextExtractor
 from .extract_text_input import TextInputExtractor
+from .box_store      import BoxStore
 
 XWZ_UI                = None
 text_blocks           = {}
@@ -22,6 +23,7 @@ text_input_blocks     = {}
 image_blocks          = {}
 image_blocks_relative = {}
 _container_json_data  = []
+_empty_box_store      = BoxStore()
 
 class XWZ_OT_ui_parser(bpy.types.Operator): 
     bl_idname = "xwz.parse_app_ui"
@@ -44,7 +46,7 @@ class XWZ_OT_ui_parser(bpy.types.Operator):
                 print(f" ├─ Image              : {child.img}")
                 print(f" ├─ Aspect Ratio       : {child.aspect_ratio}")
                 print(f" ├─ Overflow           : {child.overflow}")
-                print(f" ├─ Style              : {child.style}")
+                print(f" ├─ Style              : {child._style}")
                 print(' ├────────────────────────────────────────────')
                 print(f" ├─ Parent ID          : [ {child.parent.id if child.parent else 'None'} ]")
                 print(f" ├─ Number of Children : {len(child.children)}")
@@ -98,19 +100,15 @@ class XWZ_OT_ui_parser(bpy.types.Operator):
     
     def execute(self, context):
         # get viewport size
-        region_size = (800, 600)
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for region in area.regions:
-                    if region.type == 'WINDOW':
-                        region_size = (region.width, region.height)
-                        break
-                break
+        from .space_config import get_target_region_size
+        region_size = get_target_region_size(default=(800, 600))
         global XWZ_UI, text_blocks, text_input_blocks, image_blocks, image_blocks_relative
         from . import get_addon_root
         addon_dir  = get_addon_root()
 
         self.ui              = UI(os.path.join(addon_dir, self.conf_path), addon_dir, canvas_size=region_size)
+        load_source          = "snapshot" if self.ui.from_snapshot else "source"
+        print(f"UI loaded from {load_source} in {self.ui.load_time * 1000.0:.1f} ms")
         self.compiler        = Compiler(self.ui)
         self.ui              = self.compiler.compile()
         
@@ -125,7 +123,21 @@ class XWZ_OT_ui_parser(bpy.types.Operator):
 
         XWZ_UI = self.ui  # Store UI instance globally for layout recomputation
         self.dump_ui_struct()
+        self.update_fonts()
         return {'FINISHED'}
+    
+    def update_fonts(self):
+        from . import text_op, text_input_op
+        if text_op.font_manager is None:
+            return
+        # Fonts of live instances stay until they are updated to the new UI
+        used = {self.ui.theme.default_font}
+        used.update(block['font'] for block in text_blocks.values())
+        used.update(block['font'] for block in text_input_blocks.values())
+        used.update(instance.font_name for instance in text_op._text_instances)
+        used.update(instance.font_name for instance in text_input_op._text_input_instances)
+        text_op.font_manager.release_unused(used)
+        text_op.font_manager.preload(self.ui.theme.default_font)
 
 def recompute_layout(canvas_size):
     global XWZ_UI, _container_json_data, text_blocks, text_input_blocks, image_blocks, image_blocks_relative
@@ -163,25 +175,8 @@ def sync_dirty_containers():
             container._layout_node.mark_dirty()
     
     if XWZ_UI.root_node and len(dirty_nodes) > 0:
-        from .parser import node_flat_abs
-        from stretchable import Edge
-        
         XWZ_UI.root_node.compute_layout(XWZ_UI.canvas_size)
-        
-        def update_layout_data(container, node):
-            border_box_abs = node.get_box(Edge.BORDER, relative=False)
-            
-            node_flat_abs[container.id] = {
-                'x': border_box_abs.x,
-                'y': border_box_abs.y,
-                'width': border_box_abs.width,
-                'height': border_box_abs.height
-            }
-            
-            for i, child_container in enumerate(container.children):
-                update_layout_data(child_container, node[i])
-        
-        update_layout_data(XWZ_UI.theme.root, XWZ_UI.root_node)
+        XWZ_UI.update_box_store()
     
     XWZ_UI.abs_json_data = []
     XWZ_UI.flatten_node_tree()
@@ -200,6 +195,17 @@ def sync_dirty_containers():
     
     return True
 
+def content_placement(container_id, mask):
+    """Scroll translation, mask and clip rect for a container's text or
+    image content; see `BoxStore.placement`."""
+    box_store = XWZ_UI.box_store if XWZ_UI is not None else _empty_box_store
+    return box_store.placement(container_id, mask)
+
+def content_version():
+    """Changes whenever `content_placement` may return something new."""
+    box_store = XWZ_UI.box_store if XWZ_UI is not None else _empty_box_store
+    return box_store.version
+
 def collect_dirty_containers(container):
     dirty = []
     if hasattr(container, '_dirty') and container._dirty:
@@ -0,0 +1,217 @@
+# Created by XWZ
+# ◕‿◕ Distributed for free at:
+# https://github.com/nicolaiprodromov/puree
+# ╔═════════════════════════════════╗
+# ║  ██   ██  ██      ██  ████████  ║
+# ║   ██ ██   ██  ██  ██       ██   ║
+# ║    ███    ██  ██  ██     ██     ║
+# ║   ██ ██   ██  ██  ██   ██       ║
+# ║  ██   ██   ████████   ████████  ║
+# ╚═════════════════════════════════╝
+import struct
+import zlib
+import numpy as np
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Average and Paeth rows are unfiltered byte by byte in Python, holding
+# the GIL; images with more of them than this go to Blender's loader
+SEQUENTIAL_FILTER_LIMIT = 64 * 1024
+
+# Channels per color type: gray, RGB, palette, gray + alpha, RGBA
+_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+def decode_png(path):
+    """Decode a non-interlaced 8 or 16 bit PNG with zlib and NumPy.
+
+    Returns (width, height, pixels), pixels being a float32 (height,
+    width, 4) array of linear premultiplied RGBA in 0..1 with the bottom
+    row first, the layout `gpu.types.GPUTexture` expects. Color samples
+    are taken as sRGB, as Blender's loader does by default, and
+    linearized before alpha is applied. Raises ValueError
+    for files this decoder does not handle, so callers can fall back to
+    Blender's loader.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:8] != PNG_SIGNATURE:
+        raise ValueError(f"{path} is not a PNG file")
+
+    header  = None
+    palette = None
+    alpha   = None
+    idat    = []
+    pos = 8
+    while pos + 8 <= len(data):
+        length, kind = struct.unpack('>I4s', data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b'IHDR':
+            header = struct.unpack('>IIBBBBB', body)
+        elif kind == b'PLTE':
+            palette = np.frombuffer(body, dtype=np.uint8).reshape(-1, 3)
+        elif kind == b'tRNS':
+            alpha = body
+        elif kind == b'IDAT':
+            idat.append(body)
+        elif kind == b'IEND':
+            break
+    if header is None:
+        raise ValueError(f"{path} has no IHDR chunk")
+
+    width, height, depth, color_type, _, _, interlace = header
+    if interlace or color_type not in _CHANNELS or depth not in (8, 16):
+        raise ValueError(f"{path}: unsupported PNG (color type {color_type}, depth {depth}, interlace {interlace})")
+    if color_type == 3 and (depth != 8 or palette is None):
+        raise ValueError(f"{path}: unsupported palette PNG")
+
+    channels = _CHANNELS[color_type]
+    bpp      = channels * depth // 8
+    stride   = width * bpp
+    raw = zlib.decompress(b''.join(idat))
+    if len(raw) < height * (stride + 1):
+        raise ValueError(f"{path}: truncated image data")
+    filters = np.frombuffer(raw, dtype=np.uint8, count=height * (stride + 1))[::stride + 1]
+    if np.count_nonzero((filters == 3) | (filters == 4)) * stride > SEQUENTIAL_FILTER_LIMIT:
+        raise ValueError(f"{path}: too many Average/Paeth rows to decode off the main thread")
+    rows = _unfilter(raw, height, stride, bpp)
+
+    if depth == 16:
+        samples = rows.reshape(height, width * channels, 2)
+        samples = (samples[..., 0].astype(np.uint16) << 8) | samples[..., 1]
+        values  = samples.astype(np.float32) / 65535.0
+    else:
+        samples = rows
+        values  = rows.astype(np.float32) / 255.0
+    samples = samples.reshape(height, width, channels)
+    values  = values.reshape(height, width, channels)
+
+    pixels = np.ones((height, width, 4), dtype=np.float32)
+    if color_type == 3:
+        indices = rows.reshape(height, width)
+        pixels[..., :3] = palette[indices] / 255.0
+        if alpha is not None:
+            table = np.full(256, 255, dtype=np.uint8)
+            table[:len(alpha)] = np.frombuffer(alpha, dtype=np.uint8)
+            pixels[..., 3] = table[indices] / 255.0
+    elif color_type in (0, 4):
+        pixels[..., :3] = values[..., :1]
+        if color_type == 4:
+            pixels[..., 3] = values[..., 1]
+    else:
+        pixels[..., :channels] = values
+
+    # Gray and RGB images get tRNS as one big-endian sample per channel;
+    # pixels matching it exactly are fully transparent
+    if color_type in (0, 2) and alpha is not None:
+        if len(alpha) < 2 * channels:
+            raise ValueError(f"{path}: malformed tRNS chunk")
+        key = np.frombuffer(alpha, dtype='>u2', count=channels)
+        pixels[(samples == key).all(axis=2), 3] = 0.0
+
+    pixels[..., :3] = srgb_to_linear(pixels[..., :3])
+    pixels[..., :3] *= pixels[..., 3:]
+    return width, height, np.ascontiguousarray(pixels[::-1])
+
+def _unfilter(raw, height, stride, bpp):
+    rows  = np.zeros((height, stride), dtype=np.uint8)
+    prior = np.zeros(stride, dtype=np.uint8)
+    for y in range(height):
+        start = y * (stride + 1)
+        kind  = raw[start]
+        line  = np.frombuffer(raw, dtype=np.uint8, count=stride, offset=start + 1)
+        if kind == 0:
+            row = line.copy()
+        elif kind == 1:
+            # Each byte adds the one bpp to its left: a running sum per channel
+            row = np.cumsum(line.reshape(-1, bpp), axis=0, dtype=np.uint8).reshape(-1)
+        elif kind == 2:
+            row = line + prior
+        elif kind in (3, 4):
+            row = _unfilter_sequential(kind, line, prior, bpp)
+        else:
+            raise ValueError(f"unknown PNG filter type {kind}")
+        rows[y] = row
+        prior = rows[y]
+    return rows
+
+def _unfilter_sequential(kind, line, prior, bpp):
+    # Average and Paeth depend on the byte just decoded, so they run per byte
+    out  = bytearray(line.tobytes())
+    up   = prior.tobytes()
+    size = len(out)
+    if kind == 3:
+        for i in range(size):
+            left = out[i - bpp] if i >= bpp else 0
+            out[i] = (out[i] + ((left + up[i]) >> 1)) & 0xFF
+    else:
+        for i in range(size):
+            if i >= bpp:
+                a = out[i - bpp]
+                c = up[i - bpp]
+            else:
+                a = c = 0
+            b  = up[i]
+            p  = a + b - c
+            pa = abs(p - a)
+            pb = abs(p - b)
+            pc = abs(p - c)
+            if pa <= pb and pa <= pc:
+                pred = a
+            elif pb <= pc:
+                pred = b
+            else:
+                pred = c
+            out[i] = (out[i] + pred) & 0xFF
+    return np.frombuffer(bytes(out), dtype=np.uint8)
+
+def srgb_to_linear(values):
+    return np.where(values <= 0.04045, values / 12.92, ((values + 0.055) / 1.055) ** 2.4).astype(np.float32)
+
+def linear_to_srgb(values):
+    values = np.clip(values, 0.0, 1.0)
+    return np.where(values <= 0.0031308, values * 12.92, 1.055 * values ** (1.0 / 2.4) - 0.055).astype(np.float32)
+
+def mip_level(source_size, display_size):
+    """How many times `source_size` can be halved and still cover
+    `display_size` in both directions."""
+    if not display_size or display_size[0] <= 0 or display_size[1] <= 0:
+        return 0
+    scale = min(source_size[0] / display_size[0], source_size[1] / display_size[1])
+    level = 0
+    while scale >= 2.0 and min(source_size) >> (level + 1) >= 1:
+        scale /= 2.0
+        level += 1
+    return level
+
+def downsample(pixels, levels):
+    """Halve a (height, width, 4) linear premultiplied image `levels`
+    times with a 2x2 box filter; odd edges repeat their last row or
+    column."""
+    for _ in range(levels):
+        height, width = pixels.shape[:2]
+        if height > 1:
+            if height % 2:
+                pixels = np.concatenate((pixels, pixels[-1:]), axis=0)
+            pixels = (pixels[0::2] + pixels[1::2]) * 0.5
+        if width > 1:
+            if width % 2:
+                pixels = np.concatenate((pixels, pixels[:, -1:]), axis=1)
+            pixels = (pixels[:, 0::2] + pixels[:, 1::2]) * 0.5
+    return np.ascontiguousarray(pixels, dtype=np.float32)
+
+def decode_png_variant(path, display_size=None, level=None, source=None):
+    """Decode a PNG at the mip level for `display_size`, or at `level`.
+
+    Returns (level, source size, width, height, pixels) like `decode_png`,
+    except that the premultiplied color is sRGB encoded again after
+    filtering, for an 'SRGB8_A8' texture that decodes it on sampling.
+    `source` is an earlier `decode_png` result of the file to reduce
+    instead of decoding it again; it is left unchanged.
+    """
+    width, height, pixels = source if source is not None else decode_png(path)
+    if level is None:
+        level = mip_level((width, height), display_size)
+    pixels = downsample(pixels, level) if level else pixels.copy()
+    pixels[..., :3] = linear_to_srgb(pixels[..., :3])
+    return level, (width, height), pixels.shape[1], pixels.shape[0], pixels
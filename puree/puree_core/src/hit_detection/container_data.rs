@@ -9,6 +9,8 @@
 // ║  ██   ██   ████████   ████████  ║
 // ╚═════════════════════════════════╝
 use pyo3::prelude::*;
+use pyo3::buffer::{PyBuffer, ReadOnlyCell};
+use pyo3::exceptions::PyValueError;
 use pyo3::types::{PyDict, PyList};
 use std::collections::HashMap;
 use crate::types::Container;
@@ -38,13 +40,17 @@ impl ContainerProcessor {
         }
     }
     
-    pub fn flatten_tree(&mut self, py: Python, root_container: &PyDict, node_flat_abs: &PyDict) -> PyResult<PyObject> {
+    pub fn flatten_tree(&mut self, py: Python, root_container: &PyDict, boxes: PyBuffer<f32>) -> PyResult<PyObject> {
         self.containers.clear();
         self.id_to_index.clear();
         
+        let boxes = boxes.as_slice(py).ok_or_else(|| {
+            PyValueError::new_err("box buffer must be a C-contiguous float32 array")
+        })?;
+        
         self.build_id_mapping(root_container)?;
         
-        self.flatten_recursive(py, root_container, node_flat_abs, -1)?;
+        self.flatten_recursive(py, root_container, boxes, -1)?;
         
         let result = PyList::empty(py);
         for container in &self.containers {
@@ -130,122 +136,122 @@ impl ContainerProcessor {
         Ok(())
     }
     
-    fn flatten_recursive(&mut self, py: Python, container_dict: &PyDict, node_flat_abs: &PyDict, parent_index: i32) -> PyResult<()> {
+    fn flatten_recursive(&mut self, py: Python, container_dict: &PyDict, boxes: &[ReadOnlyCell<f32>], parent_index: i32) -> PyResult<()> {
         let id = container_dict.get_item("id")?.unwrap().extract::<String>()?;
         
-        if let Some(node_item) = node_flat_abs.get_item(&id)? {
-            let node_dict: &PyDict = node_item.downcast()?;
-            
-            let x = node_dict.get_item("x")?.unwrap().extract::<f32>()?;
-            let y = node_dict.get_item("y")?.unwrap().extract::<f32>()?;
-            let width = node_dict.get_item("width")?.unwrap().extract::<f32>()?;
-            let height = node_dict.get_item("height")?.unwrap().extract::<f32>()?;
-            
-            let style_dict: &PyDict = container_dict.get_item("style")?.unwrap().downcast()?;
-            let style_id = style_dict.get_item("id")?.unwrap().extract::<String>()?;
-            
-            let display_str = style_dict.get_item("display")?.unwrap().extract::<String>()?;
-            let display = display_str != "NONE";
-            
-            let overflow_str = style_dict.get_item("overflow")?.unwrap().extract::<String>()?;
-            let overflow = overflow_str != "HIDDEN";
-            
-            let data = container_dict.get_item("data")?.unwrap().extract::<String>()?;
-            let img = container_dict.get_item("img")?.unwrap().extract::<String>()?;
-            let aspect_ratio = style_dict.get_item("aspect_ratio")?.unwrap().extract::<bool>()?;
-            let text = container_dict.get_item("text")?.unwrap().extract::<String>()?;
-            let font = container_dict.get_item("font")?.unwrap().extract::<String>()?;
-            let passive = container_dict.get_item("passive")?.unwrap().extract::<bool>()?;
-            
-            let click_handlers = container_dict.get_item("click")?.unwrap().to_object(py);
-            let toggle_handlers = container_dict.get_item("toggle")?.unwrap().to_object(py);
-            let scroll_handlers = container_dict.get_item("scroll")?.unwrap().to_object(py);
-            let scroll_value = container_dict.get_item("_scroll_value")?.unwrap().extract::<f32>()?;
-            let hover_handlers = container_dict.get_item("hover")?.unwrap().to_object(py);
-            let hoverout_handlers = container_dict.get_item("hoverout")?.unwrap().to_object(py);
-            
-            let children_indices = if let Some(children_item) = container_dict.get_item("children")? {
-                let children_list: &PyList = children_item.downcast()?;
-                let mut indices = Vec::new();
-                for child_item in children_list.iter() {
-                    let child_dict: &PyDict = child_item.downcast()?;
-                    let child_id = child_dict.get_item("id")?.unwrap().extract::<String>()?;
-                    if let Some(&child_index) = self.id_to_index.get(&child_id) {
-                        indices.push(child_index);
-                    }
-                }
-                indices
-            } else {
-                Vec::new()
-            };
-            
-            let container = Container {
-                id: id.clone(),
-                style_id: style_id,
-                display,
-                overflow,
-                data,
-                img,
-                aspect_ratio,
-                text,
-                font,
-                position: [x, y],
-                size: [width, height],
-                color: self.extract_color_array(style_dict, "color")?,
-                color_1: self.extract_color_array(style_dict, "color_1")?,
-                color_gradient_rot: style_dict.get_item("color_gradient_rot")?.unwrap().extract::<f32>()?,
-                hover_color: self.extract_color_array(style_dict, "hover_color")?,
-                hover_color_1: self.extract_color_array(style_dict, "hover_color_1")?,
-                hover_color_gradient_rot: style_dict.get_item("hover_color_gradient_rot")?.unwrap().extract::<f32>()?,
-                click_color: self.extract_color_array(style_dict, "click_color")?,
-                click_color_1: self.extract_color_array(style_dict, "click_color_1")?,
-                click_color_gradient_rot: style_dict.get_item("click_color_gradient_rot")?.unwrap().extract::<f32>()?,
-                border_color: self.extract_color_array(style_dict, "border_color")?,
-                border_color_1: self.extract_color_array(style_dict, "border_color_1")?,
-                border_color_gradient_rot: style_dict.get_item("border_color_gradient_rot")?.unwrap().extract::<f32>()?,
-                border_radius: style_dict.get_item("border_radius")?.unwrap().extract::<f32>()?,
-                border_width: style_dict.get_item("border_width")?.unwrap().extract::<f32>()?,
-                text_color: self.extract_color_array(style_dict, "text_color")?,
-                text_color_1: self.extract_color_array(style_dict, "text_color_1")?,
-                text_color_gradient_rot: style_dict.get_item("text_color_gradient_rot")?.unwrap().extract::<f32>()?,
-                text_scale: style_dict.get_item("text_scale")?.unwrap().extract::<f32>()?,
-                text_x: style_dict.get_item("text_x")?.unwrap().extract::<f32>()?,
-                text_y: style_dict.get_item("text_y")?.unwrap().extract::<f32>()?,
-                box_shadow_color: self.extract_color_array(style_dict, "box_shadow_color")?,
-                box_shadow_offset: self.extract_vec3_array(style_dict, "box_shadow_offset")?,
-                box_shadow_blur: style_dict.get_item("box_shadow_blur")?.unwrap().extract::<f32>()?,
-                parent: parent_index,
-                passive,
-                children: children_indices.clone(),
-                scroll_value,
-                hovered: false,
-                prev_hovered: false,
-                clicked: false,
-                prev_clicked: false,
-                toggled: false,
-                prev_toggled: false,
-                toggle_value: false,
-            };
-            
-            let container_with_handlers = ContainerWithHandlers {
-                container,
-                click_handlers,
-                toggle_handlers,
-                scroll_handlers,
-                hover_handlers,
-                hoverout_handlers,
-            };
-            
-            let current_index = self.containers.len() as i32;
-            self.containers.push(container_with_handlers);
-            
-            if let Some(children_item) = container_dict.get_item("children")? {
-                let children_list: &PyList = children_item.downcast()?;
-                for child_item in children_list.iter() {
-                    let child_dict: &PyDict = child_item.downcast()?;
-                    self.flatten_recursive(py, child_dict, node_flat_abs, current_index)?;
+        let base = self.containers.len() * 4;
+        let layout_box = boxes.get(base..base + 4).ok_or_else(|| {
+            PyValueError::new_err(format!("no layout box for container '{}'", id))
+        })?;
+        let x = layout_box[0].get();
+        let y = layout_box[1].get();
+        let width = layout_box[2].get();
+        let height = layout_box[3].get();
+        
+        let style_dict: &PyDict = container_dict.get_item("style")?.unwrap().downcast()?;
+        let style_id = style_dict.get_item("id")?.unwrap().extract::<String>()?;
+        
+        let display_str = style_dict.get_item("display")?.unwrap().extract::<String>()?;
+        let display = display_str != "NONE";
+        
+        let overflow_str = style_dict.get_item("overflow")?.unwrap().extract::<String>()?;
+        let overflow = !matches!(overflow_str.as_str(), "HIDDEN" | "SCROLL" | "AUTO");
+        
+        let data = container_dict.get_item("data")?.unwrap().extract::<String>()?;
+        let img = container_dict.get_item("img")?.unwrap().extract::<String>()?;
+        let aspect_ratio = style_dict.get_item("aspect_ratio")?.unwrap().extract::<bool>()?;
+        let text = container_dict.get_item("text")?.unwrap().extract::<String>()?;
+        let font = container_dict.get_item("font")?.unwrap().extract::<String>()?;
+        let passive = container_dict.get_item("passive")?.unwrap().extract::<bool>()?;
+        
+        let click_handlers = container_dict.get_item("click")?.unwrap().to_object(py);
+        let toggle_handlers = container_dict.get_item("toggle")?.unwrap().to_object(py);
+        let scroll_handlers = container_dict.get_item("scroll")?.unwrap().to_object(py);
+        let scroll_value = container_dict.get_item("_scroll_value")?.unwrap().extract::<f32>()?;
+        let hover_handlers = container_dict.get_item("hover")?.unwrap().to_object(py);
+        let hoverout_handlers = container_dict.get_item("hoverout")?.unwrap().to_object(py);
+        
+        let children_indices = if let Some(children_item) = container_dict.get_item("children")? {
+            let children_list: &PyList = children_item.downcast()?;
+            let mut indices = Vec::new();
+            for child_item in children_list.iter() {
+                let child_dict: &PyDict = child_item.downcast()?;
+                let child_id = child_dict.get_item("id")?.unwrap().extract::<String>()?;
+                if let Some(&child_index) = self.id_to_index.get(&child_id) {
+                    indices.push(child_index);
                 }
             }
+            indices
+        } else {
+            Vec::new()
+        };
+        
+        let container = Container {
+            id: id.clone(),
+            style_id: style_id,
+            display,
+            overflow,
+            data,
+            img,
+            aspect_ratio,
+            text,
+            font,
+            position: [x, y],
+            size: [width, height],
+            color: self.extract_color_array(style_dict, "color")?,
+            color_1: self.extract_color_array(style_dict, "color_1")?,
+            color_gradient_rot: style_dict.get_item("color_gradient_rot")?.unwrap().extract::<f32>()?,
+            hover_color: self.extract_color_array(style_dict, "hover_color")?,
+            hover_color_1: self.extract_color_array(style_dict, "hover_color_1")?,
+            hover_color_gradient_rot: style_dict.get_item("hover_color_gradient_rot")?.unwrap().extract::<f32>()?,
+            click_color: self.extract_color_array(style_dict, "click_color")?,
+            click_color_1: self.extract_color_array(style_dict, "click_color_1")?,
+            click_color_gradient_rot: style_dict.get_item("click_color_gradient_rot")?.unwrap().extract::<f32>()?,
+            border_color: self.extract_color_array(style_dict, "border_color")?,
+            border_color_1: self.extract_color_array(style_dict, "border_color_1")?,
+            border_color_gradient_rot: style_dict.get_item("border_color_gradient_rot")?.unwrap().extract::<f32>()?,
+            border_radius: style_dict.get_item("border_radius")?.unwrap().extract::<f32>()?,
+            border_width: style_dict.get_item("border_width")?.unwrap().extract::<f32>()?,
+            text_color: self.extract_color_array(style_dict, "text_color")?,
+            text_color_1: self.extract_color_array(style_dict, "text_color_1")?,
+            text_color_gradient_rot: style_dict.get_item("text_color_gradient_rot")?.unwrap().extract::<f32>()?,
+            text_scale: style_dict.get_item("text_scale")?.unwrap().extract::<f32>()?,
+            text_x: style_dict.get_item("text_x")?.unwrap().extract::<f32>()?,
+            text_y: style_dict.get_item("text_y")?.unwrap().extract::<f32>()?,
+            box_shadow_color: self.extract_color_array(style_dict, "box_shadow_color")?,
+            box_shadow_offset: self.extract_vec3_array(style_dict, "box_shadow_offset")?,
+            box_shadow_blur: style_dict.get_item("box_shadow_blur")?.unwrap().extract::<f32>()?,
+            parent: parent_index,
+            passive,
+            children: children_indices.clone(),
+            scroll_value,
+            hovered: false,
+            prev_hovered: false,
+            clicked: false,
+            prev_clicked: false,
+            toggled: false,
+            prev_toggled: false,
+            toggle_value: false,
+        };
+        
+        let container_with_handlers = ContainerWithHandlers {
+            container,
+            click_handlers,
+            toggle_handlers,
+            scroll_handlers,
+            hover_handlers,
+            hoverout_handlers,
+        };
+        
+        let current_index = self.containers.len() as i32;
+        self.containers.push(container_with_handlers);
+        
+        if let Some(children_item) = container_dict.get_item("children")? {
+            let children_list: &PyList = children_item.downcast()?;
+            for child_item in children_list.iter() {
+                let child_dict: &PyDict = child_item.downcast()?;
+                self.flatten_recursive(py, child_dict, boxes, current_index)?;
+            }
         }
         
         Ok(())
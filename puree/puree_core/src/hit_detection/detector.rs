@@ -9,45 +9,263 @@
 // ║  ██   ██   ████████   ████████  ║
 // ╚═════════════════════════════════╝
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
-use rayon::prelude::*;
-use crate::types::{Container, MouseState, HitTestResult};
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::PyValueError;
+use pyo3::types::{PyBytes, PyDict, PyList};
+use crate::types::{MouseState, HitTestResult};
+use super::spatial_grid::SpatialGrid;
+
+/// What hit testing needs to know about a container, plus its interaction
+/// state. The box lives in `HitDetector::boxes` under the same index.
+#[derive(Debug, Clone, Default)]
+struct HitNode {
+    parent: i32,
+    passive: bool,
+    display: bool,
+    overflow: bool,
+    scrollable: bool,
+    border_radius: f32,
+    hovered: bool,
+    prev_hovered: bool,
+    clicked: bool,
+    prev_clicked: bool,
+    toggled: bool,
+    prev_toggled: bool,
+    toggle_value: bool,
+    scroll_value: f32,
+}
+
+impl HitNode {
+    fn update_hover_state(&mut self, is_hovered: bool) {
+        self.prev_hovered = self.hovered;
+        self.hovered = is_hovered;
+    }
+    
+    fn update_click_state(&mut self, is_clicked: bool) {
+        self.prev_clicked = self.clicked;
+        self.clicked = is_clicked;
+    }
+    
+    fn carry_state(&mut self, old: &HitNode) {
+        self.hovered = old.hovered;
+        self.prev_hovered = old.prev_hovered;
+        self.clicked = old.clicked;
+        self.prev_clicked = old.prev_clicked;
+        self.toggled = old.toggled;
+        self.prev_toggled = old.prev_toggled;
+        self.toggle_value = old.toggle_value;
+        self.scroll_value = old.scroll_value;
+    }
+}
+
+fn box_contains(b: &[f32; 4], x: f32, y: f32) -> bool {
+    x >= b[0] && x <= b[0] + b[2] && y >= b[1] && y <= b[1] + b[3]
+}
+
+/// Signed distance to a rounded box, the same function as `containerSDF`
+/// in container.glsl; negative inside.
+fn rounded_box_sdf(b: &[f32; 4], border_radius: f32, x: f32, y: f32) -> f32 {
+    let half = [b[2] * 0.5, b[3] * 0.5];
+    let radius = border_radius.min(half[0].min(half[1]));
+    let dx = (x - b[0] - half[0]).abs() - half[0] + radius;
+    let dy = (y - b[1] - half[1]).abs() - half[1] + radius;
+    let outside = (dx.max(0.0) * dx.max(0.0) + dy.max(0.0) * dy.max(0.0)).sqrt();
+    outside + dx.max(dy).min(0.0) - radius
+}
+
+const NO_CLIP: [f32; 4] = [f32::MIN, f32::MIN, f32::MAX, f32::MAX];
 
 #[pyclass]
 pub struct HitDetector {
-    containers: Vec<Container>,
+    nodes: Vec<HitNode>,
+    boxes: Vec<[f32; 4]>,
+    // Only filled by load_containers; load_geometry addresses by index.
+    ids: Vec<String>,
+    subtree_end: Vec<usize>,
+    // Clip chain, precomputed per container: whether it and all ancestors
+    // are displayed, the intersection of the boxes of every ancestor that
+    // hides overflow as (min x, min y, max x, max y), and the nearest such
+    // ancestor with rounded corners (each links to its own, -1 ends).
+    visible: Vec<bool>,
+    clip_rect: Vec<[f32; 4]>,
+    rounded_clip: Vec<i32>,
+    // Maximum scroll value per container; negative means unclamped.
+    scroll_limits: Vec<f32>,
     mouse_state: MouseState,
+    grid: SpatialGrid,
+    candidates: Vec<u32>,
+    in_bounds: Vec<bool>,
+    children_hit: Vec<bool>,
+    touched_mark: Vec<bool>,
+    touched: Vec<usize>,
+    changes: Vec<(usize, u32)>,
+    // Containers with any hover/click/toggle state set; everything else is
+    // known to be idle, so a frame only has to revisit these plus the new hits.
+    active: Vec<usize>,
 }
 
 #[pymethods]
 impl HitDetector {
+    #[classattr]
+    const HOVERED: u32 = 1;
+    #[classattr]
+    const CLICKED: u32 = 2;
+    #[classattr]
+    const HOVER_CHANGED: u32 = 4;
+    #[classattr]
+    const CLICK_CHANGED: u32 = 8;
+    #[classattr]
+    const CHILDREN_HIT: u32 = 16;
+    #[classattr]
+    const TOGGLED: u32 = 32;
+    #[classattr]
+    const TOGGLE_VALUE: u32 = 64;
+    #[classattr]
+    const SCROLLED: u32 = 128;
+    
+    #[classattr]
+    const NODE_PASSIVE: i32 = 1;
+    #[classattr]
+    const NODE_DISPLAY: i32 = 2;
+    #[classattr]
+    const NODE_OVERFLOW: i32 = 4;
+    #[classattr]
+    const NODE_SCROLLABLE: i32 = 8;
+    
     #[new]
     pub fn new() -> Self {
         HitDetector {
-            containers: Vec::new(),
+            nodes: Vec::new(),
+            boxes: Vec::new(),
+            ids: Vec::new(),
+            subtree_end: Vec::new(),
+            visible: Vec::new(),
+            clip_rect: Vec::new(),
+            rounded_clip: Vec::new(),
+            scroll_limits: Vec::new(),
             mouse_state: MouseState {
                 x: 0.0,
                 y: 0.0,
                 clicked: false,
                 scroll_delta: 0.0,
             },
+            grid: SpatialGrid::new(),
+            candidates: Vec::new(),
+            in_bounds: Vec::new(),
+            children_hit: Vec::new(),
+            touched_mark: Vec::new(),
+            touched: Vec::new(),
+            changes: Vec::new(),
+            active: Vec::new(),
         }
     }
     
     /// Load container data from Python
+    ///
+    /// Only the keys hit testing uses are read. When the tree has the same
+    /// shape as the loaded one (same ids, parents and passive flags) the
+    /// interaction state is carried over and only moved boxes are re-binned.
     pub fn load_containers(&mut self, _py: Python, container_list: &PyList) -> PyResult<()> {
-        self.containers.clear();
+        let count = container_list.len();
+        let mut nodes = Vec::with_capacity(count);
+        let mut boxes = Vec::with_capacity(count);
+        let mut ids = Vec::with_capacity(count);
         
         for item in container_list.iter() {
-            let container_dict: &PyDict = item.downcast()?;
-            let container = self.parse_container(container_dict)?;
-            self.containers.push(container);
+            let dict: &PyDict = item.downcast()?;
+            let (position, size): ([f32; 2], [f32; 2]) = (
+                dict.get_item("position")?.unwrap().extract()?,
+                dict.get_item("size")?.unwrap().extract()?,
+            );
+            boxes.push([position[0], position[1], size[0], size[1]]);
+            ids.push(dict.get_item("id")?.unwrap().extract::<String>()?);
+            nodes.push(HitNode {
+                parent: dict.get_item("parent")?.unwrap().extract::<i32>()?,
+                passive: dict.get_item("passive")?.unwrap().extract::<bool>()?,
+                display: dict.get_item("display")?.unwrap().extract::<bool>()?,
+                overflow: dict.get_item("overflow")?.unwrap().extract::<bool>()?,
+                scrollable: match dict.get_item("scroll")? {
+                    Some(handlers) => handlers.len().unwrap_or(0) > 0,
+                    None => false,
+                },
+                border_radius: dict.get_item("border_radius")?.unwrap().extract::<f32>()?,
+                ..HitNode::default()
+            });
+        }
+        
+        self.install(nodes, boxes, ids);
+        Ok(())
+    }
+    
+    /// Load only the geometry hit testing needs, straight from buffers
+    ///
+    /// `boxes` holds (x, y, width, height) rows in pre-order, `parents` the
+    /// parent row of each container (-1 for the root), `flags` the NODE_*
+    /// bits and `radius` the border radius. Containers are addressed by row.
+    pub fn load_geometry(
+        &mut self,
+        py: Python,
+        boxes: PyBuffer<f32>,
+        parents: PyBuffer<i32>,
+        flags: PyBuffer<i32>,
+        radius: PyBuffer<f32>,
+    ) -> PyResult<()> {
+        let count = parents.item_count();
+        if boxes.item_count() != count * 4 || flags.item_count() != count || radius.item_count() != count {
+            return Err(PyValueError::new_err(
+                "geometry buffers must hold 4 box values and one parent, flag and radius per container"
+            ));
         }
         
+        let box_values = boxes.to_vec(py)?;
+        let parents = parents.to_vec(py)?;
+        let flags = flags.to_vec(py)?;
+        let radius = radius.to_vec(py)?;
+        
+        let boxes = box_values.chunks_exact(4).map(|b| [b[0], b[1], b[2], b[3]]).collect();
+        let nodes = (0..count).map(|i| HitNode {
+            parent: parents[i],
+            passive: flags[i] & Self::NODE_PASSIVE != 0,
+            display: flags[i] & Self::NODE_DISPLAY != 0,
+            overflow: flags[i] & Self::NODE_OVERFLOW != 0,
+            scrollable: flags[i] & Self::NODE_SCROLLABLE != 0,
+            border_radius: radius[i],
+            ..HitNode::default()
+        }).collect();
+        
+        self.install(nodes, boxes, Vec::new());
+        Ok(())
+    }
+    
+    /// Replace the boxes of the loaded containers after a relayout, keeping
+    /// structure and state; only boxes that moved are re-binned
+    pub fn update_positions(&mut self, py: Python, boxes: PyBuffer<f32>) -> PyResult<()> {
+        if boxes.item_count() != self.nodes.len() * 4 {
+            return Err(PyValueError::new_err("box buffer does not match the loaded containers"));
+        }
+        let box_values = boxes.to_vec(py)?;
+        let boxes: Vec<[f32; 4]> = box_values.chunks_exact(4).map(|b| [b[0], b[1], b[2], b[3]]).collect();
+        self.update_index(boxes);
         Ok(())
     }
     
-    /// Update mouse state
+    /// Set the scroll limit of every container (-1 leaves it unclamped) and
+    /// clamp scroll values that are now past their limit
+    pub fn set_scroll_limits(&mut self, py: Python, limits: PyBuffer<f32>) -> PyResult<()> {
+        if limits.item_count() != self.nodes.len() {
+            return Err(PyValueError::new_err("scroll limits do not match the loaded containers"));
+        }
+        self.scroll_limits = limits.to_vec(py)?;
+        for (node, &limit) in self.nodes.iter_mut().zip(self.scroll_limits.iter()) {
+            if limit >= 0.0 {
+                node.scroll_value = node.scroll_value.clamp(0.0, limit);
+            }
+        }
+        Ok(())
+    }
+    
+    /// Update mouse state; `scroll_delta` is the wheel movement since the
+    /// previous event and is consumed by the next detection pass
     pub fn update_mouse(&mut self, x: f32, y: f32, clicked: bool, scroll_delta: f32) {
         self.mouse_state.x = x;
         self.mouse_state.y = y;
@@ -57,11 +275,12 @@ impl HitDetector {
     
     /// Perform hit detection for all containers
     pub fn detect_hits(&mut self, py: Python) -> PyResult<PyObject> {
-        let results = self.process_hit_detection();
+        self.process_hit_detection();
         
         // Convert results to Python list
         let py_results = PyList::empty(py);
-        for result in results {
+        for index in 0..self.nodes.len() {
+            let result = self.hit_result(index);
             let result_dict = PyDict::new(py);
             result_dict.set_item("container_id", result.container_id)?;
             result_dict.set_item("is_hovered", result.is_hovered)?;
@@ -75,211 +294,350 @@ impl HitDetector {
         Ok(py_results.into())
     }
     
+    /// Perform hit detection and return only the containers whose hover,
+    /// click or toggle state changed or that received the scroll, as
+    /// (index, flags) tuples in tree order
+    pub fn detect_hit_changes(&mut self, py: Python) -> PyObject {
+        self.process_hit_detection();
+        self.changes.sort_unstable();
+        self.changes.to_object(py)
+    }
+    
+    /// Current state flags of every container, one byte each
+    pub fn state_view<'py>(&self, py: Python<'py>) -> &'py PyBytes {
+        let flags: Vec<u8> = (0..self.nodes.len())
+            .map(|index| self.state_flags(index) as u8)
+            .collect();
+        PyBytes::new(py, &flags)
+    }
+    
+    /// State flags and scroll value of a single container
+    pub fn get_state(&self, container_index: usize) -> (u32, f32) {
+        if container_index >= self.nodes.len() {
+            return (0, 0.0);
+        }
+        (self.state_flags(container_index), self.nodes[container_index].scroll_value)
+    }
+    
     /// Detect hover for specific container
     pub fn detect_hover(&self, container_index: usize) -> bool {
-        if container_index >= self.containers.len() {
+        if container_index >= self.nodes.len() {
             return false;
         }
         
-        let container = &self.containers[container_index];
-        if container.passive {
+        if self.nodes[container_index].passive {
             return false;
         }
         
-        container.contains_point(self.mouse_state.x, self.mouse_state.y)
+        self.hit_test(container_index, self.mouse_state.x, self.mouse_state.y)
     }
     
     /// Detect if any children are hovered
     pub fn any_children_hovered(&self, container_index: usize) -> bool {
-        if container_index >= self.containers.len() {
+        if container_index >= self.nodes.len() {
             return false;
         }
         
-        let container = &self.containers[container_index];
-        
-        for &child_index in &container.children {
-            if child_index < self.containers.len() {
-                let child = &self.containers[child_index];
-                if !child.passive && child.contains_point(self.mouse_state.x, self.mouse_state.y) {
-                    return true;
-                }
-            }
-        }
-        
-        false
+        // Pre-order: the children are the rows of the subtree that name this
+        // container as their parent.
+        (container_index + 1..self.subtree_end[container_index]).any(|child_index| {
+            let child = &self.nodes[child_index];
+            child.parent == container_index as i32
+                && !child.passive
+                && self.hit_test(child_index, self.mouse_state.x, self.mouse_state.y)
+        })
     }
 }
 
 impl HitDetector {
-    fn parse_container(&self, dict: &PyDict) -> PyResult<Container> {
-        let id = dict.get_item("id")?.unwrap().extract::<String>()?;
-        
-        let pos = dict.get_item("position")?.unwrap().downcast::<PyList>()?;
-        let position = [
-            pos.get_item(0)?.extract::<f32>()?,
-            pos.get_item(1)?.extract::<f32>()?,
-        ];
+    fn install(&mut self, mut nodes: Vec<HitNode>, boxes: Vec<[f32; 4]>, ids: Vec<String>) {
+        let same_structure = nodes.len() == self.nodes.len()
+            && (ids.is_empty() || self.ids.is_empty() || ids == self.ids)
+            && nodes.iter().zip(self.nodes.iter()).all(|(new, old)| {
+                new.parent == old.parent && new.passive == old.passive
+            });
         
-        let sz = dict.get_item("size")?.unwrap().downcast::<PyList>()?;
-        let size = [
-            sz.get_item(0)?.extract::<f32>()?,
-            sz.get_item(1)?.extract::<f32>()?,
-        ];
-        
-        let parent = dict.get_item("parent")?.unwrap().extract::<i32>()?;
-        let passive = dict.get_item("passive")?.unwrap().extract::<bool>()?;
-        let display = dict.get_item("display")?.unwrap().extract::<bool>()?;
-        let overflow = dict.get_item("overflow")?.unwrap().extract::<bool>()?;
-        
-        let children_list = dict.get_item("children")?.unwrap().downcast::<PyList>()?;
-        let mut children = Vec::new();
-        for child_item in children_list.iter() {
-            children.push(child_item.extract::<usize>()?);
+        if same_structure {
+            for (new, old) in nodes.iter_mut().zip(self.nodes.iter()) {
+                new.carry_state(old);
+            }
+            self.nodes = nodes;
+            self.ids = ids;
+            self.update_index(boxes);
+        } else {
+            self.nodes = nodes;
+            self.ids = ids;
+            self.boxes = boxes;
+            self.rebuild_index();
         }
         
-        // Extract color arrays
-        let color = self.extract_color_array(dict, "color")?;
-        let color_1 = self.extract_color_array(dict, "color_1")?;
-        let hover_color = self.extract_color_array(dict, "hover_color")?;
-        let hover_color_1 = self.extract_color_array(dict, "hover_color_1")?;
-        let click_color = self.extract_color_array(dict, "click_color")?;
-        let click_color_1 = self.extract_color_array(dict, "click_color_1")?;
-        let border_color = self.extract_color_array(dict, "border_color")?;
-        let border_color_1 = self.extract_color_array(dict, "border_color_1")?;
-        let text_color = self.extract_color_array(dict, "text_color")?;
-        let text_color_1 = self.extract_color_array(dict, "text_color_1")?;
-        let box_shadow_color = self.extract_color_array(dict, "box_shadow_color")?;
+        if !same_structure || self.scroll_limits.len() != self.nodes.len() {
+            self.scroll_limits = vec![-1.0; self.nodes.len()];
+        }
+    }
+    
+    fn rebuild_index(&mut self) {
+        let count = self.nodes.len();
+        let skip: Vec<bool> = self.nodes.iter().map(|node| node.passive).collect();
+        self.grid.rebuild(&self.boxes, &skip);
         
-        let box_shadow_offset_list = dict.get_item("box_shadow_offset")?.unwrap().downcast::<PyList>()?;
-        let box_shadow_offset = [
-            box_shadow_offset_list.get_item(0)?.extract::<f32>()?,
-            box_shadow_offset_list.get_item(1)?.extract::<f32>()?,
-            box_shadow_offset_list.get_item(2)?.extract::<f32>()?,
-        ];
+        self.subtree_end = (1..=count).collect();
+        for index in (0..count).rev() {
+            let parent = self.nodes[index].parent;
+            if parent >= 0 && (parent as usize) < index {
+                let end = self.subtree_end[index];
+                let parent_end = &mut self.subtree_end[parent as usize];
+                *parent_end = (*parent_end).max(end);
+            }
+        }
         
-        Ok(Container {
-            id,
-            style_id: dict.get_item("style")?.unwrap().extract::<String>()?,
-            position,
-            size,
-            parent,
-            children,
-            passive,
-            display,
-            overflow,
-            color,
-            color_1,
-            color_gradient_rot: dict.get_item("color_gradient_rot")?.unwrap().extract::<f32>()?,
-            hover_color,
-            hover_color_1,
-            hover_color_gradient_rot: dict.get_item("hover_color_gradient_rot")?.unwrap().extract::<f32>()?,
-            click_color,
-            click_color_1,
-            click_color_gradient_rot: dict.get_item("click_color_gradient_rot")?.unwrap().extract::<f32>()?,
-            border_color,
-            border_color_1,
-            border_color_gradient_rot: dict.get_item("border_color_gradient_rot")?.unwrap().extract::<f32>()?,
-            border_radius: dict.get_item("border_radius")?.unwrap().extract::<f32>()?,
-            border_width: dict.get_item("border_width")?.unwrap().extract::<f32>()?,
-            text: dict.get_item("text")?.unwrap().extract::<String>()?,
-            font: dict.get_item("font")?.unwrap().extract::<String>()?,
-            text_color,
-            text_color_1,
-            text_color_gradient_rot: dict.get_item("text_color_gradient_rot")?.unwrap().extract::<f32>()?,
-            text_scale: dict.get_item("text_scale")?.unwrap().extract::<f32>()?,
-            text_x: dict.get_item("text_x")?.unwrap().extract::<f32>()?,
-            text_y: dict.get_item("text_y")?.unwrap().extract::<f32>()?,
-            box_shadow_color,
-            box_shadow_offset,
-            box_shadow_blur: dict.get_item("box_shadow_blur")?.unwrap().extract::<f32>()?,
-            img: dict.get_item("img")?.unwrap().extract::<String>()?,
-            aspect_ratio: dict.get_item("aspect_ratio")?.unwrap().extract::<bool>()?,
-            data: dict.get_item("data")?.unwrap().extract::<String>()?,
-            scroll_value: dict.get_item("_scroll_value")?.unwrap().extract::<f32>()?,
-            hovered: dict.get_item("_hovered")?.unwrap().extract::<bool>()?,
-            prev_hovered: dict.get_item("_prev_hovered")?.unwrap().extract::<bool>()?,
-            clicked: dict.get_item("_clicked")?.unwrap().extract::<bool>()?,
-            prev_clicked: dict.get_item("_prev_clicked")?.unwrap().extract::<bool>()?,
-            toggled: dict.get_item("_toggled")?.unwrap().extract::<bool>()?,
-            prev_toggled: dict.get_item("_prev_toggled")?.unwrap().extract::<bool>()?,
-            toggle_value: dict.get_item("_toggle_value")?.unwrap().extract::<bool>()?,
-        })
+        self.in_bounds = vec![false; count];
+        self.children_hit = vec![false; count];
+        self.touched_mark = vec![false; count];
+        self.compute_clip_chain();
+        self.collect_active();
     }
     
-    fn extract_color_array(&self, dict: &PyDict, key: &str) -> PyResult<[f32; 4]> {
-        let color_list = dict.get_item(key)?.unwrap().downcast::<PyList>()?;
-        Ok([
-            color_list.get_item(0)?.extract::<f32>()?,
-            color_list.get_item(1)?.extract::<f32>()?,
-            color_list.get_item(2)?.extract::<f32>()?,
-            color_list.get_item(3)?.extract::<f32>()?,
-        ])
+    fn compute_clip_chain(&mut self) {
+        let count = self.nodes.len();
+        self.visible.clear();
+        self.clip_rect.clear();
+        self.rounded_clip.clear();
+        
+        // Parents precede their children in pre-order, so one forward pass
+        // sees every parent's chain complete.
+        for index in 0..count {
+            let node = &self.nodes[index];
+            let parent = node.parent;
+            if parent < 0 || parent as usize >= index {
+                self.visible.push(node.display);
+                self.clip_rect.push(NO_CLIP);
+                self.rounded_clip.push(-1);
+                continue;
+            }
+            
+            let p = parent as usize;
+            let parent_node = &self.nodes[p];
+            self.visible.push(node.display && self.visible[p]);
+            
+            if parent_node.overflow {
+                self.clip_rect.push(self.clip_rect[p]);
+                self.rounded_clip.push(self.rounded_clip[p]);
+            } else {
+                let b = &self.boxes[p];
+                let outer = &self.clip_rect[p];
+                self.clip_rect.push([
+                    outer[0].max(b[0]),
+                    outer[1].max(b[1]),
+                    outer[2].min(b[0] + b[2]),
+                    outer[3].min(b[1] + b[3]),
+                ]);
+                self.rounded_clip.push(if parent_node.border_radius > 0.0 { parent } else { self.rounded_clip[p] });
+            }
+        }
     }
     
-    fn process_hit_detection(&mut self) -> Vec<HitTestResult> {
-        let mut results = Vec::new();
+    /// Whether (x, y) lands on the container as the shader draws it: every
+    /// ancestor displayed, inside every overflow-hiding ancestor and inside
+    /// the container's own rounded box.
+    fn hit_test(&self, index: usize, x: f32, y: f32) -> bool {
+        if !self.visible[index] {
+            return false;
+        }
         
-        // Use parallel processing for large container lists
-        if self.containers.len() > 100 {
-            results = (0..self.containers.len())
-                .into_par_iter()
-                .map(|i| self.process_container_hit(i))
-                .collect();
-        } else {
-            for i in 0..self.containers.len() {
-                results.push(self.process_container_hit(i));
-            }
+        let clip = &self.clip_rect[index];
+        if x < clip[0] || y < clip[1] || x > clip[2] || y > clip[3] {
+            return false;
+        }
+        
+        let node = &self.nodes[index];
+        let b = &self.boxes[index];
+        if !box_contains(b, x, y) {
+            return false;
+        }
+        if node.border_radius > 0.0 && rounded_box_sdf(b, node.border_radius, x, y) > 0.0 {
+            return false;
         }
         
-        // Update container states
-        for (i, result) in results.iter().enumerate() {
-            if i < self.containers.len() {
-                self.containers[i].update_hover_state(result.is_hovered);
-                self.containers[i].update_click_state(result.is_clicked);
+        // The rectangle test covered every clipping ancestor's box; only
+        // the rounded corners are left to check.
+        let mut clip_index = self.rounded_clip[index];
+        while clip_index >= 0 {
+            let clip_node = &self.nodes[clip_index as usize];
+            if rounded_box_sdf(&self.boxes[clip_index as usize], clip_node.border_radius, x, y) > 0.0 {
+                return false;
             }
+            clip_index = self.rounded_clip[clip_index as usize];
+        }
+        true
+    }
+    
+    fn update_index(&mut self, boxes: Vec<[f32; 4]>) {
+        let moved: Vec<usize> = (0..boxes.len())
+            .filter(|&index| boxes[index] != self.boxes[index])
+            .collect();
+        self.boxes = boxes;
+        
+        // A resize moves nearly everything and can change the grid bounds;
+        // past half the tree a fresh build is both cheaper and tighter.
+        if moved.len() * 2 > self.nodes.len() {
+            self.rebuild_index();
+            return;
         }
         
-        results
+        for index in moved {
+            self.grid.update(index, &self.boxes[index]);
+        }
+        self.children_hit.iter_mut().for_each(|hit| *hit = false);
+        self.compute_clip_chain();
+        self.collect_active();
+    }
+    
+    fn collect_active(&mut self) {
+        self.active = self.nodes.iter().enumerate()
+            .filter(|(_, n)| n.hovered || n.prev_hovered || n.clicked || n.prev_clicked || n.toggled || n.prev_toggled)
+            .map(|(index, _)| index)
+            .collect();
     }
     
-    fn process_container_hit(&self, index: usize) -> HitTestResult {
-        if index >= self.containers.len() {
-            return HitTestResult {
-                container_id: String::new(),
-                is_hovered: false,
-                is_clicked: false,
-                hover_changed: false,
-                click_changed: false,
-                has_children_hit: false,
-            };
+    fn touch(&mut self, index: usize) {
+        if !self.touched_mark[index] {
+            self.touched_mark[index] = true;
+            self.touched.push(index);
         }
+    }
+    
+    fn process_hit_detection(&mut self) {
+        let x = self.mouse_state.x;
+        let y = self.mouse_state.y;
         
-        let container = &self.containers[index];
+        self.touched.clear();
+        let active = std::mem::take(&mut self.active);
+        for &index in &active {
+            self.children_hit[index] = false;
+            self.touch(index);
+        }
         
-        if container.passive || !container.display {
-            return HitTestResult {
-                container_id: container.id.clone(),
-                is_hovered: false,
-                is_clicked: false,
-                hover_changed: false,
-                click_changed: false,
-                has_children_hit: false,
-            };
+        let mut candidates = std::mem::take(&mut self.candidates);
+        self.grid.query(x, y, &mut candidates);
+        for &candidate in &candidates {
+            let index = candidate as usize;
+            if !self.hit_test(index, x, y) {
+                continue;
+            }
+            self.in_bounds[index] = true;
+            self.touch(index);
+            
+            let parent = self.nodes[index].parent;
+            if parent >= 0 && (parent as usize) < self.nodes.len() {
+                self.children_hit[parent as usize] = true;
+                self.touch(parent as usize);
+            }
         }
+        self.candidates = candidates;
         
-        let is_in_bounds = container.contains_point(self.mouse_state.x, self.mouse_state.y);
-        let has_children_hit = self.any_children_hovered(index);
+        let mut active = active;
+        active.clear();
+        self.changes.clear();
+        let mut topmost_hovered = None;
+        for i in 0..self.touched.len() {
+            let index = self.touched[i];
+            let node = &mut self.nodes[index];
+            let eligible = !node.passive && self.visible[index];
+            let has_children_hit = eligible && self.children_hit[index];
+            let is_hovered = eligible && self.in_bounds[index] && !has_children_hit;
+            let is_clicked = is_hovered && self.mouse_state.clicked;
+            let click_started = is_clicked && !node.clicked;
+            
+            node.update_hover_state(is_hovered);
+            node.update_click_state(is_clicked);
+            node.prev_toggled = node.toggled;
+            node.toggled = click_started;
+            if click_started {
+                node.toggle_value = !node.toggle_value;
+            }
+            self.children_hit[index] = has_children_hit;
+            self.in_bounds[index] = false;
+            self.touched_mark[index] = false;
+            
+            if is_hovered {
+                topmost_hovered = topmost_hovered.max(Some(index));
+            }
+            
+            let node = &self.nodes[index];
+            if is_hovered || is_clicked || node.prev_hovered || node.prev_clicked
+                || node.toggled || node.prev_toggled || has_children_hit {
+                active.push(index);
+            }
+            
+            let hover_changed = is_hovered != node.prev_hovered;
+            let click_changed = is_clicked != node.prev_clicked;
+            if hover_changed || click_changed || node.toggled != node.prev_toggled {
+                let mut flags = self.state_flags(index);
+                if hover_changed { flags |= Self::HOVER_CHANGED; }
+                if click_changed { flags |= Self::CLICK_CHANGED; }
+                self.changes.push((index, flags));
+            }
+        }
+        self.active = active;
         
-        let is_hovered = is_in_bounds && !has_children_hit;
-        let is_clicked = is_hovered && self.mouse_state.clicked;
+        let scroll_delta = std::mem::replace(&mut self.mouse_state.scroll_delta, 0.0);
+        if scroll_delta != 0.0 {
+            if let Some(target) = topmost_hovered.and_then(|index| self.scroll_target(index, scroll_delta)) {
+                let limit = self.scroll_limits[target];
+                let value = self.nodes[target].scroll_value + scroll_delta;
+                self.nodes[target].scroll_value = if limit >= 0.0 { value.clamp(0.0, limit) } else { value };
+                match self.changes.iter_mut().find(|(index, _)| *index == target) {
+                    Some((_, flags)) => *flags |= Self::SCROLLED,
+                    None => {
+                        let flags = self.state_flags(target) | Self::SCROLLED;
+                        self.changes.push((target, flags));
+                    }
+                }
+            }
+        }
+    }
+    
+    /// The hovered container itself or its nearest scrollable ancestor that
+    /// can still move towards `delta`; scrolling over a button scrolls the
+    /// list it sits in, and a nested list at its end hands over to the outer.
+    fn scroll_target(&self, index: usize, delta: f32) -> Option<usize> {
+        let mut current = index as i32;
+        while current >= 0 && (current as usize) < self.nodes.len() {
+            let node = &self.nodes[current as usize];
+            let limit = self.scroll_limits[current as usize];
+            let can_move = limit < 0.0
+                || (delta > 0.0 && node.scroll_value < limit)
+                || (delta < 0.0 && node.scroll_value > 0.0);
+            if node.scrollable && can_move {
+                return Some(current as usize);
+            }
+            current = self.nodes[current as usize].parent;
+        }
+        None
+    }
+    
+    fn state_flags(&self, index: usize) -> u32 {
+        let node = &self.nodes[index];
+        let mut flags = 0;
+        if node.hovered { flags |= Self::HOVERED; }
+        if node.clicked { flags |= Self::CLICKED; }
+        if self.children_hit[index] { flags |= Self::CHILDREN_HIT; }
+        if node.toggled { flags |= Self::TOGGLED; }
+        if node.toggle_value { flags |= Self::TOGGLE_VALUE; }
+        flags
+    }
+    
+    fn hit_result(&self, index: usize) -> HitTestResult {
+        let node = &self.nodes[index];
         
         HitTestResult {
-            container_id: container.id.clone(),
-            is_hovered,
-            is_clicked,
-            hover_changed: is_hovered != container.prev_hovered,
-            click_changed: is_clicked != container.prev_clicked,
-            has_children_hit,
+            container_id: self.ids.get(index).cloned().unwrap_or_else(|| index.to_string()),
+            is_hovered: node.hovered,
+            is_clicked: node.clicked,
+            hover_changed: node.hovered != node.prev_hovered,
+            click_changed: node.clicked != node.prev_clicked,
+            has_children_hit: self.children_hit[index],
         }
     }
 }
@@ -10,6 +10,7 @@
 // ╚═════════════════════════════════╝
 pub mod detector;
 pub mod container_data;
+pub mod spatial_grid;
 
 pub use detector::HitDetector;
 pub use container_data::ContainerProcessor;
@@ -0,0 +1,179 @@
+// Created by XWZ
+// ◕‿◕ Distributed for free at:
+// https://github.com/nicolaiprodromov/puree
+// ╔═════════════════════════════════╗
+// ║  ██   ██  ██      ██  ████████  ║
+// ║   ██ ██   ██  ██  ██       ██   ║
+// ║    ███    ██  ██  ██     ██     ║
+// ║   ██ ██   ██  ██  ██   ██       ║
+// ║  ██   ██   ████████   ████████  ║
+// ╚═════════════════════════════════╝
+
+const MAX_CELLS_PER_AXIS: usize = 1024;
+const MAX_CELLS: usize = 1 << 16;
+
+#[derive(Debug, Clone, Copy, PartialEq)]
+enum Placement {
+    Absent,
+    Large,
+    Cells { x0: u32, y0: u32, x1: u32, y1: u32 },
+}
+
+/// Uniform grid over the absolute boxes of the hit-testable containers.
+///
+/// The grid is sized to the bounds of the boxes it was built from (the root
+/// container spans the viewport, so in practice the viewport). Boxes that
+/// cover more than a quarter of the grid are kept in a separate list that
+/// every query returns, so big panels do not fill every cell. Boxes or points
+/// outside the bounds clamp to the edge cells; callers always run an exact
+/// containment test on the candidates, so clamping only costs precision.
+pub struct SpatialGrid {
+    origin: [f32; 2],
+    cell_size: [f32; 2],
+    cols: usize,
+    rows: usize,
+    cells: Vec<Vec<u32>>,
+    large: Vec<u32>,
+    placements: Vec<Placement>,
+}
+
+impl SpatialGrid {
+    pub fn new() -> Self {
+        SpatialGrid {
+            origin: [0.0, 0.0],
+            cell_size: [1.0, 1.0],
+            cols: 1,
+            rows: 1,
+            cells: vec![Vec::new()],
+            large: Vec::new(),
+            placements: Vec::new(),
+        }
+    }
+
+    /// Rebuild from scratch. `boxes` are (x, y, width, height); entries with
+    /// `skip[i]` set are never returned by queries.
+    pub fn rebuild(&mut self, boxes: &[[f32; 4]], skip: &[bool]) {
+        let mut min = [f32::MAX, f32::MAX];
+        let mut max = [f32::MIN, f32::MIN];
+        let mut count = 0usize;
+        for (i, b) in boxes.iter().enumerate() {
+            if skip[i] {
+                continue;
+            }
+            min[0] = min[0].min(b[0].min(b[0] + b[2]));
+            min[1] = min[1].min(b[1].min(b[1] + b[3]));
+            max[0] = max[0].max(b[0].max(b[0] + b[2]));
+            max[1] = max[1].max(b[1].max(b[1] + b[3]));
+            count += 1;
+        }
+        if count == 0 || !(min[0].is_finite() && min[1].is_finite() && max[0].is_finite() && max[1].is_finite()) {
+            min = [0.0, 0.0];
+            max = [1.0, 1.0];
+        }
+
+        let width = (max[0] - min[0]).max(1.0);
+        let height = (max[1] - min[1]).max(1.0);
+        let target = count.clamp(1, MAX_CELLS) as f32;
+        let cols = ((target * width / height).sqrt().round() as usize).clamp(1, MAX_CELLS_PER_AXIS);
+        let rows = ((target / cols as f32).ceil() as usize).clamp(1, MAX_CELLS_PER_AXIS);
+
+        self.origin = min;
+        self.cell_size = [width / cols as f32, height / rows as f32];
+        self.cols = cols;
+        self.rows = rows;
+        self.cells.iter_mut().for_each(|cell| cell.clear());
+        self.cells.resize_with(cols * rows, Vec::new);
+        self.large.clear();
+        self.placements.clear();
+        self.placements.resize(boxes.len(), Placement::Absent);
+
+        for (i, b) in boxes.iter().enumerate() {
+            if !skip[i] {
+                let placement = self.placement_for(b);
+                self.insert(i as u32, placement);
+                self.placements[i] = placement;
+            }
+        }
+    }
+
+    /// Move one entry to a new box, touching only the cells it leaves and
+    /// enters. Returns false when the entry did not change cells.
+    pub fn update(&mut self, index: usize, b: &[f32; 4]) -> bool {
+        let old = self.placements[index];
+        if old == Placement::Absent {
+            return false;
+        }
+        let new = self.placement_for(b);
+        if new == old {
+            return false;
+        }
+        self.remove(index as u32, old);
+        self.insert(index as u32, new);
+        self.placements[index] = new;
+        true
+    }
+
+    /// Candidates whose box may contain (x, y), in no particular order.
+    pub fn query(&self, x: f32, y: f32, out: &mut Vec<u32>) {
+        out.clear();
+        out.extend_from_slice(&self.large);
+        let cell = self.cell_y(y) * self.cols + self.cell_x(x);
+        out.extend_from_slice(&self.cells[cell]);
+    }
+
+    fn cell_x(&self, x: f32) -> usize {
+        (((x - self.origin[0]) / self.cell_size[0]).floor().max(0.0) as usize).min(self.cols - 1)
+    }
+
+    fn cell_y(&self, y: f32) -> usize {
+        (((y - self.origin[1]) / self.cell_size[1]).floor().max(0.0) as usize).min(self.rows - 1)
+    }
+
+    fn placement_for(&self, b: &[f32; 4]) -> Placement {
+        let x0 = self.cell_x(b[0].min(b[0] + b[2]));
+        let x1 = self.cell_x(b[0].max(b[0] + b[2]));
+        let y0 = self.cell_y(b[1].min(b[1] + b[3]));
+        let y1 = self.cell_y(b[1].max(b[1] + b[3]));
+        let covered = (x1 - x0 + 1) * (y1 - y0 + 1);
+        if covered > 1 && covered * 4 > self.cols * self.rows {
+            Placement::Large
+        } else {
+            Placement::Cells { x0: x0 as u32, y0: y0 as u32, x1: x1 as u32, y1: y1 as u32 }
+        }
+    }
+
+    fn insert(&mut self, index: u32, placement: Placement) {
+        match placement {
+            Placement::Absent => {}
+            Placement::Large => self.large.push(index),
+            Placement::Cells { x0, y0, x1, y1 } => {
+                for cy in y0..=y1 {
+                    for cx in x0..=x1 {
+                        self.cells[cy as usize * self.cols + cx as usize].push(index);
+                    }
+                }
+            }
+        }
+    }
+
+    fn remove(&mut self, index: u32, placement: Placement) {
+        match placement {
+            Placement::Absent => {}
+            Placement::Large => {
+                if let Some(pos) = self.large.iter().position(|&i| i == index) {
+                    self.large.swap_remove(pos);
+                }
+            }
+            Placement::Cells { x0, y0, x1, y1 } => {
+                for cy in y0..=y1 {
+                    for cx in x0..=x1 {
+                        let cell = &mut self.cells[cy as usize * self.cols + cx as usize];
+                        if let Some(pos) = cell.iter().position(|&i| i == index) {
+                            cell.swap_remove(pos);
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
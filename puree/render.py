@@ -20,8 +20,9 @@ import traceback
 from gpu_extras.batch import batch_for_shader
 from bpy.types import Operator, Panel
 
-from .scroll_op import scroll_state, XWZ_OT_scroll, XWZ_OT_scroll_launch
-from .mouse_op import mouse_state, XWZ_OT_mouse, XWZ_OT_mouse_launch
+from .scroll_op import scroll_state
+from .mouse_op import mouse_state
+from .input_op import stop_input_dispatch
 from .parser_op import XWZ_OT_ui_parser
 from . import parser_op
 
@@ -30,6 +31,8 @@ _modal_timer = None
 _hot_reload_enabled = False
 _debug_outlined_containers = set()
 
+CONTAINER_STRIDE = 54
+
 class RenderPipeline:
     def __init__(self):
         self.mgl_context     = None
@@ -38,6 +41,7 @@ class RenderPipeline:
         self.mouse_buffer    = None
         self.container_buffer = None
         self.viewport_buffer = None
+        self.scroll_buffer   = None
         self.output_texture  = None
         self.outline_texture = None
         self.debug_outline_buffer = None
@@ -49,6 +53,8 @@ class RenderPipeline:
         self.running         = False
         self.debug_outlined_containers = set()
         self.mouse_pos       = [0.5, 0.5]
+        self.mouse_data      = np.zeros(6, dtype=np.float32)
+        self.mouse_dirty     = True
         self.start_time      = time.time()
         self.texture_size    = (1920, 1080)
         self.click_value     = 0.0
@@ -123,56 +129,53 @@ class RenderPipeline:
             return True
         except Exception:
             return False
+    def pack_container_data(self, container_data):
+        count  = len(container_data)
+        packed = np.zeros((count, CONTAINER_STRIDE), dtype=np.float32)
+        for i, container in enumerate(container_data):
+            packed[i] = (
+                int(container.get('display', False)),
+                *container.get('position', [0, 0]),
+                *container.get('size', [100, 100]),
+                *container.get('color', [1, 1, 1, 1]),
+                *container.get('color_1', [1, 1, 1, 1]),
+                container.get('color_gradient_rot', 0.0),
+                *container.get('hover_color', container_default.hover_color),
+                *container.get('hover_color_1', container_default.hover_color_1),
+                container.get('hover_color_gradient_rot', 0.0),
+                *container.get('click_color', container_default.click_color),
+                *container.get('click_color_1', container_default.click_color_1),
+                container.get('click_color_gradient_rot', 0.0),
+                *container.get('border_color', [1, 1, 1, 1]),
+                *container.get('border_color_1', [1, 1, 1, 1]),
+                container.get('border_color_gradient_rot', 0.0),
+                container.get('border_radius', 0.0),
+                container.get('border_width', 0.0),
+                container.get('parent', -1),
+                int(container.get('overflow', False)),
+                *container.get('box_shadow_offset', [0, 0, 0]),
+                container.get('box_shadow_blur', 0.0),
+                *container.get('box_shadow_color', [0, 0, 0, 0]),
+                int(container.get('passive', False))
+            )
+        
+        ui = parser_op.XWZ_UI
+        if ui is not None and len(ui.box_store) == count:
+            packed[:, 1:5] = ui.box_store.absolute
+        return packed
     def create_buffers_and_textures(self):
         try:
             mouse_data = np.array([0.5, 0.5, 0.0, 0.0, 0.0, 0.0], dtype=np.float32)
             self.mouse_buffer = self.mgl_context.buffer(mouse_data.tobytes())
             
-            container_array = []
-            for i, container in enumerate(self.container_data):
-                container_struct = [
-                    int(container.get('display', False)),
-                    container.get('position', [0, 0])[0], container.get('position', [0, 0])[1],
-                    container.get('size', [100, 100])[0], container.get('size', [100, 100])[1],
-                    container.get('color', [1, 1, 1, 1])[0], container.get('color', [1, 1, 1, 1])[1], 
-                    container.get('color', [1, 1, 1, 1])[2], container.get('color', [1, 1, 1, 1])[3],
-                    container.get('color_1', [1, 1, 1, 1])[0], container.get('color_1', [1, 1, 1, 1])[1], 
-                    container.get('color_1', [1, 1, 1, 1])[2], container.get('color_1', [1, 1, 1, 1])[3],
-                    container.get('color_gradient_rot', 0.0),
-                    container.get('hover_color', container_default.hover_color)[0], container.get('hover_color', container_default.hover_color)[1], 
-                    container.get('hover_color', container_default.hover_color)[2], container.get('hover_color', container_default.hover_color)[3],
-                    container.get('hover_color_1', container_default.hover_color_1)[0], container.get('hover_color_1', container_default.hover_color_1)[1], 
-                    container.get('hover_color_1', container_default.hover_color_1)[2], container.get('hover_color_1', container_default.hover_color_1)[3],
-                    container.get('hover_color_gradient_rot', 0.0),
-                    container.get('click_color', container_default.click_color)[0], container.get('click_color', container_default.click_color)[1], 
-                    container.get('click_color', container_default.click_color)[2], container.get('click_color', container_default.click_color)[3],
-                    container.get('click_color_1', container_default.click_color_1)[0], container.get('click_color_1', container_default.click_color_1)[1], 
-                    container.get('click_color_1', container_default.click_color_1)[2], container.get('click_color_1', container_default.click_color_1)[3],
-                    container.get('click_color_gradient_rot', 0.0),
-                    container.get('border_color', [1, 1, 1, 1])[0], container.get('border_color', [1, 1, 1, 1])[1], 
-                    container.get('border_color', [1, 1, 1, 1])[2], container.get('border_color', [1, 1, 1, 1])[3],
-                    container.get('border_color_1', [1, 1, 1, 1])[0], container.get('border_color_1', [1, 1, 1, 1])[1], 
-                    container.get('border_color_1', [1, 1, 1, 1])[2], container.get('border_color_1', [1, 1, 1, 1])[3],
-                    container.get('border_color_gradient_rot', 0.0),
-                    container.get('border_radius', 0.0),
-                    container.get('border_width', 0.0),
-                    container.get('parent', -1),
-                    int(container.get('overflow', False)),
-                    container.get('box_shadow_offset', [0, 0, 0])[0], container.get('box_shadow_offset', [0, 0, 0])[1], 
-                    container.get('box_shadow_offset', [0, 0, 0])[2],
-                    container.get('box_shadow_blur', 0.0),
-                    container.get('box_shadow_color', [0, 0, 0, 0])[0], container.get('box_shadow_color', [0, 0, 0, 0])[1], 
-                    container.get('box_shadow_color', [0, 0, 0, 0])[2], container.get('box_shadow_color', [0, 0, 0, 0])[3],
-                    int(container.get('passive', False))
-                ]
-                container_array.extend(container_struct)
-            
-            container_data_np = np.array(container_array, dtype=np.float32)
-            self.container_buffer = self.mgl_context.buffer(container_data_np.tobytes())
+            container_data_np = self.pack_container_data(self.container_data)
+            self.container_buffer = self.mgl_context.buffer(container_data_np)
             
             viewport_data = np.array([self.region_size[0], self.region_size[1], len(self.container_data)], dtype=np.float32)
             self.viewport_buffer = self.mgl_context.buffer(viewport_data.tobytes())
             
+            self.scroll_buffer = self.mgl_context.buffer(self.scroll_offsets().tobytes())
+            
             self.texture_size = self.region_size
             
             self.output_texture = self.mgl_context.texture(
@@ -267,7 +270,7 @@ class RenderPipeline:
     def update_mouse_position(self, mouse_x, mouse_y):
         self.mouse_pos[0] = max(0.0, min(1.0, mouse_x))
         self.mouse_pos[1] = max(0.0, min(1.0, 1.0 - mouse_y))
-        self.write_mouse_buffer()
+        self.mouse_dirty = True
     def update_region_size(self, width, height):
         w = max(1, int(width))
         h = max(1, int(height))
@@ -282,48 +285,8 @@ class RenderPipeline:
             if updated_container_data:
                 self.container_data = updated_container_data
                 
-                container_array = []
-                for i, container in enumerate(self.container_data):
-                    container_struct = [
-                        int(container.get('display', False)),
-                        container.get('position', [0, 0])[0], container.get('position', [0, 0])[1],
-                        container.get('size', [100, 100])[0], container.get('size', [100, 100])[1],
-                        container.get('color', [1, 1, 1, 1])[0], container.get('color', [1, 1, 1, 1])[1], 
-                        container.get('color', [1, 1, 1, 1])[2], container.get('color', [1, 1, 1, 1])[3],
-                        container.get('color_1', [1, 1, 1, 1])[0], container.get('color_1', [1, 1, 1, 1])[1], 
-                        container.get('color_1', [1, 1, 1, 1])[2], container.get('color_1', [1, 1, 1, 1])[3],
-                        container.get('color_gradient_rot', 0.0),
-                        container.get('hover_color', container_default.hover_color)[0], container.get('hover_color', container_default.hover_color)[1], 
-                        container.get('hover_color', container_default.hover_color)[2], container.get('hover_color', container_default.hover_color)[3],
-                        container.get('hover_color_1', container_default.hover_color_1)[0], container.get('hover_color_1', container_default.hover_color_1)[1], 
-                        container.get('hover_color_1', container_default.hover_color_1)[2], container.get('hover_color_1', container_default.hover_color_1)[3],
-                        container.get('hover_color_gradient_rot', 0.0),
-                        container.get('click_color', container_default.click_color)[0], container.get('click_color', container_default.click_color)[1], 
-                        container.get('click_color', container_default.click_color)[2], container.get('click_color', container_default.click_color)[3],
-                        container.get('click_color_1', container_default.click_color_1)[0], container.get('click_color_1', container_default.click_color_1)[1], 
-                        container.get('click_color_1', container_default.click_color_1)[2], container.get('click_color_1', container_default.click_color_1)[3],
-                        container.get('click_color_gradient_rot', 0.0),
-                        container.get('border_color', [1, 1, 1, 1])[0], container.get('border_color', [1, 1, 1, 1])[1], 
-                        container.get('border_color', [1, 1, 1, 1])[2], container.get('border_color', [1, 1, 1, 1])[3],
-                        container.get('border_color_1', [1, 1, 1, 1])[0], container.get('border_color_1', [1, 1, 1, 1])[1], 
-                        container.get('border_color_1', [1, 1, 1, 1])[2], container.get('border_color_1', [1, 1, 1, 1])[3],
-                        container.get('border_color_gradient_rot', 0.0),
-                        container.get('border_radius', 0.0),
-                        container.get('border_width', 0.0),
-                        container.get('parent', -1),
-                        int(container.get('overflow', False)),
-                        container.get('box_shadow_offset', [0, 0, 0])[0], container.get('box_shadow_offset', [0, 0, 0])[1], 
-                        container.get('box_shadow_offset', [0, 0, 0])[2],
-                        container.get('box_shadow_blur', 0.0),
-                        container.get('box_shadow_color', [0, 0, 0, 0])[0], container.get('box_shadow_color', [0, 0, 0, 0])[1], 
-                        container.get('box_shadow_color', [0, 0, 0, 0])[2], container.get('box_shadow_color', [0, 0, 0, 0])[3],
-                        int(container.get('passive', False))
-                    ]
-                    container_array.extend(container_struct)
-                
                 if self.container_buffer:
-                    container_data_np = np.array(container_array, dtype=np.float32)
-                    self.container_buffer.write(container_data_np.tobytes())
+                    self.container_buffer.write(self.pack_container_data(self.container_data))
         
         if self.viewport_buffer:
             viewport_data = np.array([w, h, len(self.container_data)], dtype=np.float32)
@@ -355,30 +318,54 @@ class RenderPipeline:
         return size_changed
     def update_click_value(self, value):
         self.click_value = value
-        self.write_mouse_buffer()
+        self.mouse_dirty = True
     def on_scroll(self, delta, absolute_value):
-        self.write_mouse_buffer()
+        self.mouse_dirty = True
     def on_mouse_event(self, event_type, data):
+        # Input callbacks only latch values; the buffer is written once per
+        # rendered frame by write_mouse_buffer.
         if event_type == 'mouse':
             self.mouse_pos[0] = max(0.0, min(1.0, (data[0] + 1.0) / 2.0))
             self.mouse_pos[1] = max(0.0, min(1.0, (data[1] + 1.0) / 2.0))
         elif event_type == 'click':
             self.click_value = 1.0 if data else 0.0
-        self.write_mouse_buffer()
+        self.mouse_dirty = True
     def write_mouse_buffer(self):
-        if not self.mouse_buffer:
+        if not (self.mouse_buffer and self.mouse_dirty):
+            return
+        mouse_data = self.mouse_data
+        mouse_data[0] = self.mouse_pos[0]
+        mouse_data[1] = self.mouse_pos[1]
+        mouse_data[2] = time.time() - self.start_time
+        mouse_data[3] = scroll_state.scroll_value
+        mouse_data[4] = self.click_value
+        self.mouse_buffer.write(mouse_data)
+        self.mouse_dirty = False
+    
+    def scroll_offsets(self):
+        ui = parser_op.XWZ_UI
+        if ui is None or not len(ui.box_store):
+            return np.zeros((1, 2), dtype=np.float32)
+        ui.box_store.take_scroll_dirty()
+        return ui.box_store.offset
+    
+    def write_scroll_offsets(self):
+        # Scrolling only translates the rows of the scrolled subtree, so a
+        # tick uploads that slice instead of repacking the containers.
+        ui = parser_op.XWZ_UI
+        if not (self.scroll_buffer and ui is not None):
             return
-        current_time = time.time() - self.start_time
-        scroll_value = float(scroll_state.scroll_value)
-        mouse_data = np.array([
-            self.mouse_pos[0],
-            self.mouse_pos[1],
-            current_time,
-            scroll_value,
-            self.click_value,
-            0.0
-        ], dtype=np.float32)
-        self.mouse_buffer.write(mouse_data.tobytes())
+        box_store = ui.box_store
+        dirty = box_store.take_scroll_dirty()
+        if dirty is None:
+            return
+        offsets = box_store.offset
+        if self.scroll_buffer.size != max(offsets.nbytes, 8):
+            self.scroll_buffer.orphan(max(offsets.nbytes, 8))
+            dirty = (0, len(offsets))
+        start, end = dirty
+        if end > start:
+            self.scroll_buffer.write(offsets[start:end].tobytes(), offset=start * offsets.itemsize * 2)
     
     def update_fps(self):
         current_time = time.perf_counter()
@@ -425,6 +412,10 @@ class RenderPipeline:
             self.needs_texture_update = False
             changed = True
         
+        ui = parser_op.XWZ_UI
+        if ui is not None and ui.box_store.scroll_dirty is not None:
+            changed = True
+        
         self.texture_needs_readback = changed
         
         return changed
@@ -447,13 +438,16 @@ class RenderPipeline:
     
     def run_compute_shader(self):
         if not (self.compute_shader and self.mouse_buffer and self.container_buffer and 
-                self.viewport_buffer and self.output_texture):
+                self.viewport_buffer and self.scroll_buffer and self.output_texture):
             return False
             
         try:
+            self.write_mouse_buffer()
+            self.write_scroll_offsets()
             self.mouse_buffer.bind_to_storage_buffer(0)
             self.container_buffer.bind_to_storage_buffer(1)
             self.viewport_buffer.bind_to_storage_buffer(2)
+            self.scroll_buffer.bind_to_storage_buffer(5)
             self.output_texture.bind_to_image(4, read=False, write=True)
             
             groups_x = (self.texture_size[0] + 15) // 16
@@ -470,6 +464,7 @@ class RenderPipeline:
                 self.viewport_buffer.bind_to_storage_buffer(3)
                 self.debug_outline_buffer.bind_to_storage_buffer(4)
                 self.debug_outline_count_buffer.bind_to_storage_buffer(5)
+                self.scroll_buffer.bind_to_storage_buffer(6)
                 
                 self.outline_shader.run(groups_x, groups_y, 1)
                 
@@ -649,6 +644,8 @@ class RenderPipeline:
             self.container_buffer = None
         if self._safe_release_moderngl_object(self.viewport_buffer):
             self.viewport_buffer = None
+        if self._safe_release_moderngl_object(self.scroll_buffer):
+            self.scroll_buffer = None
         if self._safe_release_moderngl_object(self.output_texture):
             self.output_texture = None
         if self._safe_release_moderngl_object(self.outline_texture):
@@ -696,10 +693,9 @@ class RenderPipeline:
             return False
         
         try:
-            container_array = []
             updates_made = 0
             
-            for i, container in enumerate(hit_container_data):
+            for container in hit_container_data:
                 state_changed = (
                     container.get('_hovered', False) != container.get('_prev_hovered', False) or
                     container.get('_clicked', False) != container.get('_prev_clicked', False)
@@ -707,48 +703,8 @@ class RenderPipeline:
                 
                 if state_changed:
                     updates_made += 1
-                
-                current_color = container.get('color', [1, 1, 1, 1]).copy()
-                current_color_1 = container.get('color_1', [1, 1, 1, 1]).copy()
-                
-                container_struct = [
-                    int(container.get('display', False)),
-                    container.get('position', [0, 0])[0], container.get('position', [0, 0])[1],
-                    container.get('size', [100, 100])[0], container.get('size', [100, 100])[1],
-                    current_color[0], current_color[1], current_color[2], current_color[3],
-                    current_color_1[0], current_color_1[1], current_color_1[2], current_color_1[3],
-                    container.get('color_gradient_rot', 0.0),
-                    container.get('hover_color', container_default.hover_color)[0], container.get('hover_color', container_default.hover_color)[1], 
-                    container.get('hover_color', container_default.hover_color)[2], container.get('hover_color', container_default.hover_color)[3],
-                    container.get('hover_color_1', container_default.hover_color_1)[0], container.get('hover_color_1', container_default.hover_color_1)[1], 
-                    container.get('hover_color_1', container_default.hover_color_1)[2], container.get('hover_color_1', container_default.hover_color_1)[3],
-                    container.get('hover_color_gradient_rot', 0.0),
-                    container.get('click_color', container_default.click_color)[0], container.get('click_color', container_default.click_color)[1], 
-                    container.get('click_color', container_default.click_color)[2], container.get('click_color', container_default.click_color)[3],
-                    container.get('click_color_1', container_default.click_color_1)[0], container.get('click_color_1', container_default.click_color_1)[1], 
-                    container.get('click_color_1', container_default.click_color_1)[2], container.get('click_color_1', container_default.click_color_1)[3],
-                    container.get('click_color_gradient_rot', 0.0),
-                    container.get('border_color', [1, 1, 1, 1])[0], container.get('border_color', [1, 1, 1, 1])[1], 
-                    container.get('border_color', [1, 1, 1, 1])[2], container.get('border_color', [1, 1, 1, 1])[3],
-                    container.get('border_color_1', [1, 1, 1, 1])[0], container.get('border_color_1', [1, 1, 1, 1])[1], 
-                    container.get('border_color_1', [1, 1, 1, 1])[2], container.get('border_color_1', [1, 1, 1, 1])[3],
-                    container.get('border_color_gradient_rot', 0.0),
-                    container.get('border_radius', 0.0),
-                    container.get('border_width', 0.0),
-                    container.get('parent', -1),
-                    int(container.get('overflow', False)),
-                    container.get('box_shadow_offset', [0, 0, 0])[0], container.get('box_shadow_offset', [0, 0, 0])[1], 
-                    container.get('box_shadow_offset', [0, 0, 0])[2],
-                    container.get('box_shadow_blur', 0.0),
-                    container.get('box_shadow_color', [0, 0, 0, 0])[0], container.get('box_shadow_color', [0, 0, 0, 0])[1], 
-                    container.get('box_shadow_color', [0, 0, 0, 0])[2], container.get('box_shadow_color', [0, 0, 0, 0])[3],
-                    int(container.get('passive', False))
-                ]
-                container_array.extend(container_struct)
             
-            # Update entire buffer
-            container_data_np = np.array(container_array, dtype=np.float32)
-            self.container_buffer.write(container_data_np.tobytes())
+            self.container_buffer.write(self.pack_container_data(hit_container_data))
             
             if updates_made > 0:
                 self.needs_texture_update = True
@@ -776,24 +732,15 @@ class XWZ_OT_start_ui(Operator):
             _render_data = None
             return {'CANCELLED'}
 
-        # Start native-optimized hit detection
-        try:
-            bpy.ops.xwz.hit_detect('INVOKE_DEFAULT')
-        except Exception as e:
-            self.report({'WARNING'}, f"Failed to start hit detect modal: {e}")
-
-        try:
-            bpy.ops.xwz.scroll_modal_launch('INVOKE_DEFAULT')
-        except Exception as e:
-            self.report({'WARNING'}, f"Failed to start scroll modal: {e}")
+        context.window_manager.modal_handler_add(self)
+        _modal_timer = context.window_manager.event_timer_add(0.016, window=context.window)
         
+        # Added after this modal so it sees each TIMER tick first and the
+        # frame renders with the coalesced pointer position.
         try:
-            bpy.ops.xwz.mouse_modal_launch('INVOKE_DEFAULT')
+            bpy.ops.xwz.input_dispatch_launch('INVOKE_DEFAULT')
         except Exception as e:
-            self.report({'WARNING'}, f"Failed to start mouse modal: {e}")
-        
-        context.window_manager.modal_handler_add(self)
-        _modal_timer = context.window_manager.event_timer_add(0.016, window=context.window)
+            self.report({'WARNING'}, f"Failed to start input dispatcher: {e}")
         
         for _container_id in parser_op.image_blocks:
             block = parser_op.image_blocks[_container_id]
@@ -880,13 +827,8 @@ class XWZ_OT_start_ui(Operator):
             print(f"Failed to update debug panel space: {e}")
         
         # Force initial redraw to ensure UI appears immediately
-        from .space_config import get_target_space
-        target_space = get_target_space()
-        if target_space:
-            for area in context.screen.areas:
-                if area.type == target_space:
-                    area.tag_redraw()
-                    break
+        from .space_config import tag_target_redraw
+        tag_target_redraw()
         
         return {'RUNNING_MODAL'}
     
@@ -910,12 +852,8 @@ class XWZ_OT_start_ui(Operator):
                     
                     _render_data.run_compute_shader()
                     
-                    from .space_config import get_target_space
-                    target_space = get_target_space()
-                    
-                    for area in context.screen.areas:
-                        if area.type == target_space:
-                            area.tag_redraw()
+                    from .space_config import tag_target_redraw
+                    tag_target_redraw()
         
         if event.type == 'TIMER':
             from .space_config import find_target_area_and_region
@@ -942,18 +880,7 @@ class XWZ_OT_start_ui(Operator):
                 if state_synced:
                     from . import hit_op
                     from . import text_op
-                    new_data = parser_op._container_json_data
-                    old_data = hit_op._container_data
-                    
-                    if old_data and len(old_data) == len(new_data):
-                        for i in range(len(new_data)):
-                            runtime_keys = ['_hovered', '_prev_hovered', '_clicked', '_prev_clicked', 
-                                          '_toggled', '_prev_toggled', '_toggle_value', '_scroll_value']
-                            for key in runtime_keys:
-                                if key in old_data[i]:
-                                    new_data[i][key] = old_data[i][key]
-                    
-                    hit_op._container_data = new_data
+                    hit_op.reload_containers(parser_op._container_json_data)
                     
                     for text_instance in text_op._text_instances:
                         container_id = text_instance.container_id
@@ -1012,18 +939,7 @@ class XWZ_OT_start_ui(Operator):
                 if texture_changed or size_changed:
                     if size_changed:
                         from . import hit_op
-                        new_data = parser_op._container_json_data
-                        old_data = hit_op._container_data
-                        
-                        if old_data and len(old_data) == len(new_data):
-                            for i in range(len(new_data)):
-                                runtime_keys = ['_hovered', '_prev_hovered', '_clicked', '_prev_clicked', 
-                                              '_toggled', '_prev_toggled', '_toggle_value', '_scroll_value']
-                                for key in runtime_keys:
-                                    if key in old_data[i]:
-                                        new_data[i][key] = old_data[i][key]
-                        
-                        hit_op._container_data = new_data
+                        hit_op.reload_containers(parser_op._container_json_data, layout_only=True)
                     
                     from .hit_op import _container_data
                     if _container_data:
@@ -1031,12 +947,10 @@ class XWZ_OT_start_ui(Operator):
                     
                     _render_data.run_compute_shader()
             
-            from .space_config import get_target_space
-            target_space = get_target_space()
-            
-            for area in context.screen.areas:
-                if area.type == target_space:
-                    area.tag_redraw()
+            # The tick always redraws; this also covers every request the
+            # instance updates above made
+            from .space_config import flush_redraw
+            flush_redraw(force=True)
 
         elif event.type in {'ESC'}:
             self.cancel(context)
@@ -1055,9 +969,7 @@ class XWZ_OT_start_ui(Operator):
             _render_data.cleanup()
             _render_data = None
         
-        bpy.ops.xwz.hit_stop()
-        scroll_state.stop_scrolling()
-        mouse_state.stop_mouse_tracking()
+        stop_input_dispatch()
 
 class XWZ_OT_stop_ui(Operator):
     bl_idname      = "xwz.stop_ui"
@@ -1083,9 +995,7 @@ class XWZ_OT_stop_ui(Operator):
             except Exception as e:
                 print(f"Hot reload cleanup error: {e}")
 
-        bpy.ops.xwz.hit_stop()
-        scroll_state.stop_scrolling()
-        mouse_state.stop_mouse_tracking()
+        stop_input_dispatch()
         
         try:
             bpy.ops.xwz.clear_text()
@@ -1094,12 +1004,8 @@ class XWZ_OT_stop_ui(Operator):
         except Exception:
             pass
 
-        from .space_config import get_target_space
-        target_space = get_target_space()
-        
-        for area in context.screen.areas:
-            if area.type == target_space:
-                area.tag_redraw()
+        from .space_config import tag_target_redraw
+        tag_target_redraw()
             
         self.report({'INFO'}, "Compute shader demo stopped")
         return {'FINISHED'}
@@ -1107,10 +1013,6 @@ class XWZ_OT_stop_ui(Operator):
 classes = [
     XWZ_OT_start_ui,
     XWZ_OT_stop_ui, 
-    XWZ_OT_scroll,
-    XWZ_OT_scroll_launch,
-    XWZ_OT_mouse,
-    XWZ_OT_mouse_launch,
     XWZ_OT_ui_parser
 ]
 
@@ -1133,8 +1035,7 @@ def unregister():
         _render_data.cleanup()
         _render_data = None
     
-    scroll_state.stop_scrolling()
-    mouse_state.stop_mouse_tracking()
+    stop_input_dispatch()
     
     try:
         import gc
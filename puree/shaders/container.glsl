@@ -24,6 +24,11 @@ layout(std430, binding = 1) restrict readonly buffer ContainerBuffer {
     float container_data[];
 };
 
+// Translation each container picks up from its scrolled ancestors, in pixels
+layout(std430, binding = 5) restrict readonly buffer ScrollBuffer {
+    vec2 scroll_offsets[];
+};
+
 struct Container {
     int display;
     vec2 position;
@@ -54,7 +59,7 @@ Container getContainer(int index) {
     int offset = index * 54;
     Container c;
     c.display = int(container_data[offset + 0]);
-    c.position = vec2(container_data[offset + 1], container_data[offset + 2]);
+    c.position = vec2(container_data[offset + 1], container_data[offset + 2]) - scroll_offsets[index];
     c.size = vec2(container_data[offset + 3], container_data[offset + 4]);
     c.color = vec4(container_data[offset + 5], container_data[offset + 6], container_data[offset + 7], container_data[offset + 8]);
     c.color_1 = vec4(container_data[offset + 9], container_data[offset + 10], container_data[offset + 11], container_data[offset + 12]);
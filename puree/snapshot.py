@@ -0,0 +1,134 @@
+# Created by XWZ
+# ◕‿◕ Distributed for free at:
+# https://github.com/nicolaiprodromov/puree
+# ╔═════════════════════════════════╗
+# ║  ██   ██  ██      ██  ████████  ║
+# ║   ██ ██   ██  ██  ██       ██   ║
+# ║    ███    ██  ██  ██     ██     ║
+# ║   ██ ██   ██  ██  ██   ██       ║
+# ║  ██   ██   ████████   ████████  ║
+# ╚═════════════════════════════════╝
+import os
+import pickle
+import hashlib
+import yaml
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIR     = ".puree_cache"
+
+_package_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Modules whose classes end up inside the pickled tree; editing any of them
+# must invalidate existing snapshots.
+_model_sources = [
+    os.path.join(_package_dir, "parser.py"),
+    os.path.join(_package_dir, "components", "container.py"),
+    os.path.join(_package_dir, "components", "style.py"),
+    os.path.join(_package_dir, "components", "registry.py"),
+]
+
+_snapshot_fields = ('selected_theme', 'default_theme', 'theme_index', 'theme')
+
+def _hash_file(digest, path):
+    digest.update(path.encode('utf-8'))
+    try:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    except OSError:
+        digest.update(b'<missing>')
+
+def _hash_native_core(digest):
+    # The core compiles and parses every declaration in the tree; the
+    # binary is hashed by size and mtime so a rebuild invalidates snapshots
+    # without reading it on every start
+    from .native_bindings import puree_rust_core
+    digest.update(str(getattr(puree_rust_core, '__version__', '')).encode('utf-8'))
+    path = getattr(puree_rust_core, '__file__', None)
+    try:
+        stat = os.stat(path)
+        digest.update(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+    except (OSError, TypeError):
+        digest.update(b'<native core>')
+
+def _theme_inputs(conf_path):
+    from .space_config import get_parsed_config
+
+    space_config = get_parsed_config()
+    if space_config and space_config.theme_data:
+        theme_data = space_config.theme_data
+        return list(theme_data.styles), [theme_data.components]
+
+    with open(conf_path, 'r') as f:
+        data = yaml.safe_load(f) or {}
+    styles, components = [], []
+    for theme in data.get('app', {}).get('theme', []):
+        styles.extend(theme.get('styles', []) or [])
+        if theme.get('components'):
+            components.append(theme['components'])
+    return styles, components
+
+def compute_snapshot_key(conf_path, base_dir):
+    digest = hashlib.sha256()
+    digest.update(f"puree-snapshot-{SNAPSHOT_VERSION}".encode('utf-8'))
+
+    for source in _model_sources:
+        _hash_file(digest, source)
+    _hash_native_core(digest)
+    _hash_file(digest, conf_path)
+
+    styles, components = _theme_inputs(conf_path)
+    for style_file in styles:
+        _hash_file(digest, os.path.join(base_dir, style_file))
+
+    for component_dir in components:
+        component_path = os.path.join(base_dir, component_dir)
+        for root, dirs, files in os.walk(component_path):
+            dirs.sort()
+            for filename in sorted(files):
+                if filename.endswith(('.yaml', '.scss', '.css')):
+                    _hash_file(digest, os.path.join(root, filename))
+
+    fonts_path = os.path.join(base_dir, "fonts")
+    if os.path.isdir(fonts_path):
+        for font_file in sorted(os.listdir(fonts_path)):
+            digest.update(font_file.encode('utf-8'))
+
+    return digest.hexdigest()
+
+def _snapshot_path(conf_path, base_dir):
+    name = hashlib.sha1(os.path.abspath(conf_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(base_dir, SNAPSHOT_DIR, f"ui_{name}.bin")
+
+def load_snapshot(ui, conf_path, base_dir, key):
+    path = _snapshot_path(conf_path, base_dir)
+    if not os.path.exists(path):
+        return False
+    try:
+        with open(path, 'rb') as f:
+            stored_key = f.read(64).decode('ascii')
+            if stored_key != key:
+                return False
+            state = pickle.load(f)
+    except Exception as e:
+        print(f"Ignoring unreadable UI snapshot {path}: {e}")
+        return False
+
+    for field in _snapshot_fields:
+        if field in state:
+            setattr(ui, field, state[field])
+    return True
+
+def save_snapshot(ui, conf_path, base_dir, key):
+    path = _snapshot_path(conf_path, base_dir)
+    state = {field: getattr(ui, field) for field in _snapshot_fields if hasattr(ui, field)}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(key.encode('ascii'))
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return True
+    except Exception as e:
+        print(f"Failed to write UI snapshot {path}: {e}")
+        return False
@@ -18,6 +18,59 @@ from . import get_addon_root
 _parsed_config = None
 _target_space = None
 _space_handler_name = None
+_redraw_requested = False
+
+class RegionCache:
+    """Target area and WINDOW region of the current screen, resolved once.
+
+    Only the `as_pointer()` addresses are kept: Blender frees areas and
+    regions on joins and splits without invalidating their Python wrappers,
+    so a held wrapper is never read again. A lookup walks `screen.areas`
+    comparing addresses, which touches only live areas, and falls back to a
+    full search when the cached area is gone or switched editor type. The
+    size is read from the live region, so resizes never leave it out of
+    date.
+    """
+    _instance = None
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance.invalidate()
+        return cls._instance
+    
+    def invalidate(self):
+        self.screen = 0
+        self.area   = 0
+        self.region = 0
+    
+    def lookup(self):
+        screen = bpy.context.screen
+        if not (_target_space and screen):
+            return None, None
+        
+        if self.area and self.screen == screen.as_pointer():
+            for area in screen.areas:
+                if area.as_pointer() == self.area:
+                    if area.type != _target_space:
+                        break
+                    for region in area.regions:
+                        if region.as_pointer() == self.region:
+                            return area, region
+                    break
+        
+        self.invalidate()
+        for area in screen.areas:
+            if area.type == _target_space:
+                for region in area.regions:
+                    if region.type == 'WINDOW':
+                        self.screen = screen.as_pointer()
+                        self.area   = area.as_pointer()
+                        self.region = region.as_pointer()
+                        return area, region
+        return None, None
+
+region_cache = RegionCache()
 
 class SpaceAwareConfig:
     def __init__(self):
@@ -96,6 +149,8 @@ def parse_space_config(conf_path: str) -> bool:
     _parsed_config = SpaceAwareConfig()
     success = _parsed_config.parse_config(conf_path)
     
+    region_cache.invalidate()
+    
     if success:
         _target_space, _space_handler_name = _parsed_config.get_space_info()
         
@@ -131,15 +186,59 @@ def is_target_space_available() -> bool:
     return False
 
 def find_target_area_and_region():
-    if not _target_space:
-        return None, None
-    
-    for area in bpy.context.screen.areas:
-        if area.type == _target_space:
-            for region in area.regions:
-                if region.type == 'WINDOW':
-                    return area, region
-    return None, None
+    return region_cache.lookup()
+
+def get_target_region_size(default=(0, 0)) -> Tuple[int, int]:
+    area, region = region_cache.lookup()
+    if region is None:
+        return default
+    return region.width, region.height
+
+def tag_target_redraw():
+    area, region = region_cache.lookup()
+    if area is not None:
+        area.tag_redraw()
+
+def request_redraw():
+    """Ask for a redraw of the target region.
+
+    Requests only set a flag, so updating any number of instances in one
+    pass tags the region once. The render loop flushes on its TIMER tick;
+    outside of it a one-shot app timer flushes on the next event loop turn.
+    """
+    global _redraw_requested
+    if _redraw_requested:
+        return
+    _redraw_requested = True
+    if not bpy.app.timers.is_registered(flush_redraw):
+        bpy.app.timers.register(flush_redraw, first_interval=0.0)
+
+def flush_redraw(force=False):
+    """Tag the target region if a redraw was requested since the last flush."""
+    global _redraw_requested
+    if _redraw_requested or force:
+        _redraw_requested = False
+        tag_target_redraw()
+    return None
+
+def cancel_redraw():
+    global _redraw_requested
+    _redraw_requested = False
+    if bpy.app.timers.is_registered(flush_redraw):
+        bpy.app.timers.unregister(flush_redraw)
+
+def add_draw_handler(callback):
+    """Add a POST_PIXEL draw callback to the target space.
+
+    Returns a handle for `remove_draw_handler`, which needs the space class
+    the callback was added to even if the target space changed since.
+    """
+    space_class = get_space_class() or bpy.types.SpaceView3D
+    return space_class, space_class.draw_handler_add(callback, (), 'WINDOW', 'POST_PIXEL')
+
+def remove_draw_handler(handle):
+    space_class, draw_handler = handle
+    space_class.draw_handler_remove(draw_handler, 'WINDOW')
 
 def get_space_class():
     if not _space_handler_name:
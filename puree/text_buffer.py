@@ -0,0 +1,162 @@
+# Created by XWZ
+# ◕‿◕ Distributed for free at:
+# https://github.com/nicolaiprodromov/puree
+# ╔═════════════════════════════════╗
+# ║  ██   ██  ██      ██  ████████  ║
+# ║   ██ ██   ██  ██  ██       ██   ║
+# ║    ███    ██  ██  ██     ██     ║
+# ║   ██ ██   ██  ██  ██   ██       ║
+# ║  ██   ██   ████████   ████████  ║
+# ╚═════════════════════════════════╝
+# Chunks are split once they grow past twice this many chars
+CHUNK_SIZE = 1024
+
+class Fenwick():
+    """Prefix sums over a list of non-negative ints with O(log n) updates."""
+    def __init__(self, values=()):
+        self.build(values)
+
+    def __len__(self):
+        return self._size
+
+    def build(self, values):
+        tree = [0]
+        tree.extend(values)
+        size = len(tree) - 1
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._size = size
+        self._top  = 1 << size.bit_length() if size else 0
+
+    def add(self, index, delta):
+        tree = self._tree
+        i = index + 1
+        while i <= self._size:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index):
+        """Sum of the first `index` values."""
+        tree = self._tree
+        total = 0
+        i = index
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, value):
+        """(index, remainder): how many leading values sum to at most
+        `value`, and what is left of it after them."""
+        tree = self._tree
+        index = 0
+        step = self._top
+        while step:
+            nxt = index + step
+            if nxt <= self._size and tree[nxt] <= value:
+                index = nxt
+                value -= tree[nxt]
+            step >>= 1
+        return index, value
+
+class TextBuffer():
+    """Text of a text input stored as a rope of short chunks.
+
+    A Fenwick tree over the chunk lengths maps an offset to its chunk in
+    O(log n), so an edit only rebuilds one chunk string instead of the
+    whole text; the tree is rebuilt when chunks are split or dropped, once
+    every `CHUNK_SIZE` chars or so. `version` changes on every edit.
+    """
+    def __init__(self, text=""):
+        self.version = 0
+        self.set(text)
+
+    def __len__(self):
+        return self._length
+
+    def __str__(self):
+        if self._text is None:
+            self._text = ''.join(self._chunks)
+        return self._text
+
+    def set(self, text):
+        self._chunks = [text[i:i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE)] or ['']
+        self._rebuild()
+
+    def insert(self, offset, text):
+        if not text:
+            return
+        index, inner = self._locate(offset)
+        chunk = self._chunks[index]
+        chunk = chunk[:inner] + text + chunk[inner:]
+        if len(chunk) > 2 * CHUNK_SIZE:
+            self._chunks[index:index + 1] = [chunk[i:i + CHUNK_SIZE] for i in range(0, len(chunk), CHUNK_SIZE)]
+            self._rebuild()
+            return
+        self._chunks[index] = chunk
+        self._sizes.add(index, len(text))
+        self._edited(len(text))
+
+    def delete(self, start, end):
+        end = min(end, self._length)
+        emptied = False
+        while end > start:
+            index, inner = self._locate(start)
+            chunk = self._chunks[index]
+            count = min(end - start, len(chunk) - inner)
+            self._chunks[index] = chunk[:inner] + chunk[inner + count:]
+            self._sizes.add(index, -count)
+            self._edited(-count)
+            emptied = emptied or not self._chunks[index]
+            end -= count
+        if emptied and len(self._chunks) > 1:
+            self._chunks = [chunk for chunk in self._chunks if chunk] or ['']
+            self._rebuild()
+
+    def char(self, offset):
+        index, inner = self._locate(offset)
+        return self._chunks[index][inner]
+
+    def slice(self, start, end):
+        if self._text is not None:
+            return self._text[start:end]
+        pieces = []
+        index, inner = self._locate(start)
+        remaining = end - start
+        chunks = self._chunks
+        while remaining > 0 and index < len(chunks):
+            piece = chunks[index][inner:inner + remaining]
+            pieces.append(piece)
+            remaining -= len(piece)
+            index += 1
+            inner = 0
+        return ''.join(pieces)
+
+    def chars(self, start=0):
+        """Iterate the chars from `start` to the end."""
+        index, inner = self._locate(start)
+        chunks = self._chunks
+        yield from chunks[index][inner:]
+        for chunk in chunks[index + 1:]:
+            yield from chunk
+
+    def _locate(self, offset):
+        index, inner = self._sizes.find(offset)
+        if index >= len(self._chunks):
+            index = len(self._chunks) - 1
+            inner = len(self._chunks[index])
+        return index, inner
+
+    def _edited(self, delta):
+        self._length += delta
+        self._text = None
+        self.version += 1
+
+    def _rebuild(self):
+        self._sizes  = Fenwick(len(chunk) for chunk in self._chunks)
+        self._length = self._sizes.prefix(len(self._chunks))
+        self._text   = None
+        self.version += 1
@@ -10,16 +10,179 @@
 # ╚═════════════════════════════════╝
 import bpy
 import blf
+import gpu
 import time
+from gpu_extras.batch import batch_for_shader
 
-from .text_op import FontManager, font_manager
-from .mouse_op import mouse_state
+from .text_op import FontManager, font_manager, text_metrics
+from .text_buffer import Fenwick, TextBuffer
+from .draw_list import DrawList, culled
+from .space_config import get_target_region_size, request_redraw, add_draw_handler, remove_draw_handler
 
 _text_input_instances = []
 _draw_handle = None
 _active_input_id = None
-_keyboard_handler_running = False
 _next_input_id = 0
+_overlay_shader = None
+_overlay_batch = None
+_draw_list = DrawList()
+
+class LineLayout():
+    """Wrapped line table of a text input, rebuilt from the edited line on.
+
+    Each line is stored as its span, the chars up to the next line, and
+    whether it ends on a newline, which is skipped when the line is drawn.
+    A Fenwick tree over the spans turns line numbers into offsets and back
+    in O(log n), and keeps the lines after an edit valid without shifting
+    them. Lines break after the last space that fits and inside words wider
+    than the line; widths are sums of cached glyph advances. After an edit
+    only the lines from the one above the edited word are wrapped again,
+    and wrapping stops as soon as a line starts where an old line did.
+    """
+    def __init__(self):
+        self.version = None
+        self.key     = None
+        self.spans   = [0]
+        self.hard    = [False]
+        self._lines  = [""]
+        self._tree   = Fenwick(self.spans)
+        self._edit   = None
+
+    def __len__(self):
+        return len(self.spans)
+
+    def edit(self, position, removed, inserted):
+        """Note that `removed` chars at `position` were replaced by
+        `inserted`; `removed=None` re-wraps everything after `position`."""
+        if self.key is None:
+            return
+        if self._edit is None:
+            self._edit = (position, removed, inserted)
+        else:
+            # Several edits before a relayout: wrap from the earliest one on
+            self._edit = (min(position, self._edit[0]), None, None)
+
+    def update(self, buffer, font_id, size, width):
+        key = (font_id, size, width)
+        edit, self._edit = self._edit, None
+        if key != self.key:
+            self._wrap(buffer, 0, key)
+        elif buffer.version == self.version:
+            return self
+        elif edit is None:
+            self._wrap(buffer, 0, key)
+        else:
+            self._rewrap(buffer, edit, key)
+        return self
+
+    def lines(self):
+        return self._lines
+
+    def start(self, line):
+        return self._tree.prefix(line)
+
+    def end(self, line):
+        return self._tree.prefix(line) + self.spans[line] - self.hard[line]
+
+    def locate(self, offset):
+        """(line, column) of a text offset."""
+        line, _ = self._tree.find(offset)
+        line = min(line, len(self.spans) - 1)
+        start = self._tree.prefix(line)
+        return line, min(offset - start, self.spans[line] - self.hard[line])
+
+    def offset(self, line, column):
+        """Text offset of a column on a line, clamped to its end."""
+        return self._tree.prefix(line) + min(column, self.spans[line] - self.hard[line])
+
+    def _wrap(self, buffer, line, key, sync=None):
+        if line == 0:
+            # A full wrap slices every line, so join the chunks once
+            str(buffer)
+        start = self._tree.prefix(line) if line else 0
+        spans = []
+        hard  = []
+        lines = []
+        tail  = len(self.spans)
+        shift = 0
+        for line_start, line_end, next_start in _break_lines(buffer, start, key):
+            spans.append(next_start - line_start)
+            hard.append(next_start != line_end)
+            lines.append(buffer.slice(line_start, line_end))
+            if sync is None or next_start == len(buffer):
+                continue
+            old_end, shift = sync
+            old_start = next_start - shift
+            if old_start < old_end:
+                continue
+            old, rest = self._tree.find(old_start)
+            if rest == 0 and old < tail:
+                tail = old
+                break
+
+        old_spans = self.spans[line:tail]
+        self.spans[line:tail]  = spans
+        self.hard[line:tail]   = hard
+        self._lines[line:tail] = lines
+        if len(spans) == len(old_spans):
+            for i, (span, old_span) in enumerate(zip(spans, old_spans), line):
+                if span != old_span:
+                    self._tree.add(i, span - old_span)
+        else:
+            # Lines were added or removed, which moves every later entry
+            self._tree.build(self.spans)
+        self.version = buffer.version
+        self.key     = key
+
+    def _rewrap(self, buffer, edit, key):
+        position, removed, inserted = edit
+        # Shortening a word can pull it back onto the line above, so
+        # wrapping restarts one line above the one the word begins on
+        word_start = position
+        while word_start > 0 and buffer.char(word_start - 1) not in ' \n':
+            word_start -= 1
+        line, _ = self._tree.find(word_start)
+        line = max(0, min(line, len(self.spans) - 1) - 1)
+        sync = None
+        if removed is not None:
+            sync = (position + removed, inserted - removed)
+        self._wrap(buffer, line, key, sync)
+
+def _break_lines(buffer, start, key):
+    """Yield (start, end, next start) for every line from `start` on."""
+    font_id, size, width = key
+    advance    = text_metrics.advance
+    line_start = start
+    line_width = 0.0
+    break_at   = -1
+    tail_width = 0.0
+    i = start
+    for char in buffer.chars(start):
+        if char == '\n':
+            yield line_start, i, i + 1
+            line_start = i + 1
+            line_width = 0.0
+            break_at   = -1
+            i += 1
+            continue
+        glyph = advance(font_id, size, char)
+        while char != ' ' and line_width + glyph > width and i > line_start:
+            if break_at > line_start:
+                yield line_start, break_at, break_at
+                line_start = break_at
+                line_width = tail_width
+            else:
+                yield line_start, i, i
+                line_start = i
+                line_width = 0.0
+            break_at = -1
+        line_width += glyph
+        tail_width += glyph
+        if char == ' ':
+            break_at   = i + 1
+            tail_width = 0.0
+        i += 1
+    yield line_start, i, i
 
 class TextInputInstance:
     def __init__(self, container_id, placeholder="", font_name=None, size=20, pos=[50, 50], 
@@ -29,7 +192,8 @@ class TextInputInstance:
         self.container_id = container_id
         self.id = _next_input_id
         _next_input_id += 1
-        self.text = ""
+        self.buffer = TextBuffer()
+        self._layout = LineLayout()
         self.placeholder = placeholder
         self.font_name = font_name
         self.font_id = self._get_font_id()
@@ -53,6 +217,8 @@ class TextInputInstance:
         
         self._last_refresh = 0.0
         self._refresh_delay = 0.016
+        
+        _draw_list.touch()
     
     def _get_font_id(self):
         if self.font_name and font_manager:
@@ -67,63 +233,40 @@ class TextInputInstance:
     def refresh_font_id(self):
         self.font_id = self._get_font_id()
     
-    def get_wrapped_lines(self):
+    @property
+    def text(self):
+        return str(self.buffer)
+    
+    @text.setter
+    def text(self, value):
+        self.buffer.set(value)
+        self._layout.edit(0, None, None)
+    
+    def get_line_layout(self):
         if not self.mask or self.mask[2] <= 0:
-            return [self.text] if self.text else []
-        
-        container_width = self.mask[2]
-        padding_total = 20
-        available_width = max(container_width - padding_total, 50)
-        
-        blf.size(self.font_id, self.size)
-        
-        lines = []
-        current_line = ""
-        
-        for char in self.text:
-            if char == '\n':
-                lines.append(current_line)
-                current_line = ""
-                continue
-            
-            test_line = current_line + char
-            text_width, _ = blf.dimensions(self.font_id, test_line)
-            
-            if text_width > available_width:
-                if current_line:
-                    lines.append(current_line)
-                    current_line = char
-                else:
-                    lines.append(char)
-                    current_line = ""
-            else:
-                current_line = test_line
-        
-        if current_line:
-            lines.append(current_line)
-        
-        return lines if lines else [""]
+            width = float('inf')
+        else:
+            container_width = self.mask[2]
+            padding_total = 20
+            width = max(container_width - padding_total, 50)
+        return self._layout.update(self.buffer, self.font_id, self.size, width)
+    
+    def get_wrapped_lines(self):
+        return self.get_line_layout().lines()
     
     def get_cursor_position_2d(self):
-        lines = self.get_wrapped_lines()
-        char_count = 0
-        
-        for line_idx, line in enumerate(lines):
-            line_len = len(line)
-            if char_count + line_len >= self.cursor_pos:
-                col = self.cursor_pos - char_count
-                return line_idx, col
-            char_count += line_len
-            if line_idx < len(lines) - 1:
-                char_count += 1
-        
-        return len(lines) - 1, len(lines[-1]) if lines else 0
+        return self.get_line_layout().locate(self.cursor_pos)
+    
+    def _replace(self, start, end, text):
+        self.buffer.delete(start, end)
+        self.buffer.insert(start, text)
+        self._layout.edit(start, end - start, len(text))
     
     def insert_text(self, text):
         if self.selection_start is not None:
             self.delete_selection()
         
-        self.text = self.text[:self.cursor_pos] + text + self.text[self.cursor_pos:]
+        self._replace(self.cursor_pos, self.cursor_pos, text)
         self.cursor_pos += len(text)
         self._request_refresh()
     
@@ -133,7 +276,7 @@ class TextInputInstance:
         
         start = min(self.cursor_pos, self.selection_start)
         end = max(self.cursor_pos, self.selection_start)
-        self.text = self.text[:start] + self.text[end:]
+        self._replace(start, end, "")
         self.cursor_pos = start
         self.selection_start = None
         self._request_refresh()
@@ -142,15 +285,15 @@ class TextInputInstance:
         if self.selection_start is not None:
             self.delete_selection()
         elif self.cursor_pos > 0:
-            self.text = self.text[:self.cursor_pos-1] + self.text[self.cursor_pos:]
+            self._replace(self.cursor_pos - 1, self.cursor_pos, "")
             self.cursor_pos -= 1
             self._request_refresh()
     
     def delete(self):
         if self.selection_start is not None:
             self.delete_selection()
-        elif self.cursor_pos < len(self.text):
-            self.text = self.text[:self.cursor_pos] + self.text[self.cursor_pos+1:]
+        elif self.cursor_pos < len(self.buffer):
+            self._replace(self.cursor_pos, self.cursor_pos + 1, "")
             self._request_refresh()
     
     def move_cursor_left(self, shift=False):
@@ -179,7 +322,7 @@ class TextInputInstance:
                 self.selection_start = None
                 return
         
-        if self.cursor_pos < len(self.text):
+        if self.cursor_pos < len(self.buffer):
             self.cursor_pos += 1
         
         if not shift:
@@ -189,15 +332,11 @@ class TextInputInstance:
         if shift and self.selection_start is None:
             self.selection_start = self.cursor_pos
         
-        lines = self.get_wrapped_lines()
-        line_idx, col = self.get_cursor_position_2d()
+        layout = self.get_line_layout()
+        line_idx, col = layout.locate(self.cursor_pos)
         
         if line_idx > 0:
-            prev_line = lines[line_idx - 1]
-            new_col = min(col, len(prev_line))
-            
-            char_count = sum(len(lines[i]) + (1 if i < len(lines) - 1 else 0) for i in range(line_idx - 1))
-            self.cursor_pos = char_count + new_col
+            self.cursor_pos = layout.offset(line_idx - 1, col)
         
         if not shift:
             self.selection_start = None
@@ -206,15 +345,11 @@ class TextInputInstance:
         if shift and self.selection_start is None:
             self.selection_start = self.cursor_pos
         
-        lines = self.get_wrapped_lines()
-        line_idx, col = self.get_cursor_position_2d()
+        layout = self.get_line_layout()
+        line_idx, col = layout.locate(self.cursor_pos)
         
-        if line_idx < len(lines) - 1:
-            next_line = lines[line_idx + 1]
-            new_col = min(col, len(next_line))
-            
-            char_count = sum(len(lines[i]) + (1 if i < len(lines) - 1 else 0) for i in range(line_idx + 1))
-            self.cursor_pos = char_count + new_col
+        if line_idx < len(layout) - 1:
+            self.cursor_pos = layout.offset(line_idx + 1, col)
         
         if not shift:
             self.selection_start = None
@@ -233,24 +368,81 @@ class TextInputInstance:
             _active_input_id = None
         self.selection_start = None
     
+    def draw_record(self, region_size):
+        """(x, top, clip) in region coordinates, or None when nothing shows."""
+        from .parser_op import content_placement
+        offset_x, offset_y, mask, clip = content_placement(self.container_id, self.mask)
+        if clip is not None and (clip[0] >= clip[2] or clip[1] >= clip[3]):
+            return None
+        
+        line_count = len(self.get_line_layout())
+        line_height = self.size * 1.2
+        x_pos = self.position[0] - offset_x
+        y_pos = self.position[1] - offset_y
+        
+        if mask and mask[2] > 0 and mask[3] > 0:
+            container_width = mask[2]
+            container_height = mask[3]
+            
+            if self.align_h == 'LEFT':
+                x_pos = mask[0] + 5
+            elif self.align_h == 'CENTER':
+                x_pos = mask[0] + container_width / 2
+            elif self.align_h == 'RIGHT':
+                x_pos = mask[0] + container_width - 5
+            
+            if self.align_v == 'TOP':
+                y_pos = mask[1] + 5
+            elif self.align_v == 'CENTER':
+                total_text_height = line_count * line_height
+                y_pos = mask[1] + (container_height - total_text_height) / 2
+            elif self.align_v == 'BOTTOM':
+                total_text_height = line_count * line_height
+                y_pos = mask[1] + container_height - total_text_height - 5
+        
+        if mask and mask[2] > 0 and mask[3] > 0:
+            bounds = (mask[0], mask[1], mask[0] + mask[2], mask[1] + mask[3])
+        else:
+            # Unmasked inputs draw from their position and do not wrap
+            bounds = (x_pos, y_pos, float('inf'), y_pos + line_count * line_height)
+        if culled(bounds, clip, region_size):
+            return None
+        
+        viewport_height = region_size[1]
+        if clip is not None:
+            clip = (clip[0], viewport_height - clip[3], clip[2], viewport_height - clip[1])
+        
+        return x_pos, viewport_height - y_pos, clip
+    
     def _request_refresh(self):
         self._last_refresh = time.time()
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        _draw_list.touch()
+        request_redraw()
     
     def should_refresh(self):
         return time.time() - self._last_refresh < self._refresh_delay
 
+def _draw_rect(x, y, width, height, color):
+    # Selections and cursors all draw one unit quad scaled into place, so
+    # redraws create no shaders, buffers or batches
+    global _overlay_shader, _overlay_batch
+    if _overlay_batch is None:
+        _overlay_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+        _overlay_batch  = batch_for_shader(
+            _overlay_shader, 'TRIS',
+            {"pos": ((0, 0), (1, 0), (0, 1), (1, 1))},
+            indices=((0, 1, 2), (1, 2, 3))
+        )
+    gpu.matrix.push()
+    gpu.matrix.translate((x, y))
+    gpu.matrix.scale((width, height))
+    _overlay_shader.bind()
+    _overlay_shader.uniform_float("color", color)
+    _overlay_batch.draw(_overlay_shader)
+    gpu.matrix.pop()
+
 def draw_all_text_inputs():
-    viewport_height = 0
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            for region in area.regions:
-                if region.type == 'WINDOW':
-                    viewport_height = region.height
-                    break
-            break
+    region_size = get_target_region_size()
     
     current_time = time.time()
     
@@ -259,59 +451,34 @@ def draw_all_text_inputs():
             if current_time - instance.cursor_blink_time > 0.5:
                 instance.show_cursor = not instance.show_cursor
                 instance.cursor_blink_time = current_time
+    
+    for instance, record in _draw_list.get(_text_input_instances, region_size, TextInputInstance.draw_record):
+        x_pos, top, clip = record
+        layout = instance.get_line_layout()
+        lines = layout.lines()
+        line_height = instance.size * 1.2
         
-        if instance.mask and instance.mask[2] > 0 and instance.mask[3] > 0:
-            xmin = instance.mask[0]
-            ymin = viewport_height - instance.mask[1] - instance.mask[3]
-            xmax = instance.mask[0] + instance.mask[2]
-            ymax = viewport_height - instance.mask[1]
-            blf.clipping(instance.font_id, xmin, ymin, xmax, ymax)
+        if clip is not None:
+            blf.clipping(instance.font_id, *clip)
             blf.enable(instance.font_id, blf.CLIPPING)
         
         blf.size(instance.font_id, instance.size)
         
-        lines = instance.get_wrapped_lines()
-        line_height = instance.size * 1.2
-        
-        display_text = instance.text if instance.text else instance.placeholder
-        display_color = instance.color if instance.text else [c * 0.5 for c in instance.color]
-        
-        x_pos = instance.position[0]
-        y_pos = instance.position[1]
-        
-        if instance.mask and instance.mask[2] > 0 and instance.mask[3] > 0:
-            container_width = instance.mask[2]
-            container_height = instance.mask[3]
-            
-            if instance.align_h == 'LEFT':
-                x_pos = instance.mask[0] + 5
-            elif instance.align_h == 'CENTER':
-                x_pos = instance.mask[0] + container_width / 2
-            elif instance.align_h == 'RIGHT':
-                x_pos = instance.mask[0] + container_width - 5
-            
-            if instance.align_v == 'TOP':
-                y_pos = instance.mask[1] + 5
-            elif instance.align_v == 'CENTER':
-                total_text_height = len(lines) * line_height
-                y_pos = instance.mask[1] + (container_height - total_text_height) / 2
-            elif instance.align_v == 'BOTTOM':
-                total_text_height = len(lines) * line_height
-                y_pos = instance.mask[1] + container_height - total_text_height - 5
+        has_text = len(instance.buffer) > 0
+        display_color = instance.color if has_text else [c * 0.5 for c in instance.color]
+        text_baseline_offset = (line_height - instance.size) / 2
         
         for line_idx, line in enumerate(lines):
-            line_y = y_pos + line_idx * line_height
-            text_baseline_offset = (line_height - instance.size) / 2
-            flipped_y = viewport_height - line_y - instance.size - text_baseline_offset
-            selection_y = viewport_height - line_y - line_height
+            line_top = top - line_idx * line_height
+            flipped_y = line_top - instance.size - text_baseline_offset
+            selection_y = line_top - line_height
             
-            if instance.selection_start is not None and instance.text:
+            if instance.selection_start is not None and has_text:
                 start = min(instance.cursor_pos, instance.selection_start)
                 end = max(instance.cursor_pos, instance.selection_start)
                 
-                char_count = sum(len(lines[i]) + (1 if i < len(lines) - 1 else 0) for i in range(line_idx))
-                line_start = char_count
-                line_end = char_count + len(line)
+                line_start = layout.start(line_idx)
+                line_end = layout.end(line_idx)
                 
                 if start < line_end and end > line_start:
                     sel_start_in_line = max(0, start - line_start)
@@ -320,198 +487,147 @@ def draw_all_text_inputs():
                     before_sel = line[:sel_start_in_line]
                     selected = line[sel_start_in_line:sel_end_in_line]
                     
-                    before_width, _ = blf.dimensions(instance.font_id, before_sel)
-                    sel_width, _ = blf.dimensions(instance.font_id, selected)
-                    
-                    import gpu
-                    from gpu_extras.batch import batch_for_shader
-                    
-                    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+                    before_width = text_metrics.width(instance.font_id, instance.size, before_sel)
+                    sel_width = text_metrics.width(instance.font_id, instance.size, selected)
                     
                     sel_x = x_pos + before_width
-                    sel_height = line_height
-                    
-                    vertices = (
-                        (sel_x, selection_y),
-                        (sel_x + sel_width, selection_y),
-                        (sel_x, selection_y + sel_height),
-                        (sel_x + sel_width, selection_y + sel_height),
-                    )
-                    
-                    indices = ((0, 1, 2), (1, 2, 3))
-                    
-                    batch = batch_for_shader(shader, 'TRIS', {"pos": vertices}, indices=indices)
-                    shader.bind()
-                    shader.uniform_float("color", instance.selection_color)
-                    batch.draw(shader)
+                    _draw_rect(sel_x, selection_y, sel_width, line_height, instance.selection_color)
             
             blf.position(instance.font_id, x_pos, flipped_y, 0)
             blf.color(instance.font_id, *display_color)
             blf.draw(instance.font_id, line)
         
         if instance.is_focused and instance.show_cursor:
-            line_idx, col = instance.get_cursor_position_2d()
+            line_idx, col = layout.locate(instance.cursor_pos)
             
             if line_idx < len(lines):
                 line = lines[line_idx]
                 text_before_cursor = line[:col]
-                cursor_x_offset, _ = blf.dimensions(instance.font_id, text_before_cursor)
+                cursor_x_offset = text_metrics.width(instance.font_id, instance.size, text_before_cursor)
                 
                 cursor_x = x_pos + cursor_x_offset
-                cursor_y_line = y_pos + line_idx * line_height
-                cursor_y_flipped = viewport_height - cursor_y_line - line_height
-                
-                import gpu
-                from gpu_extras.batch import batch_for_shader
-                
-                shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+                cursor_y_flipped = top - (line_idx + 1) * line_height
                 
-                cursor_height = line_height
                 cursor_width = 2
-                vertices = (
-                    (cursor_x, cursor_y_flipped),
-                    (cursor_x + cursor_width, cursor_y_flipped),
-                    (cursor_x, cursor_y_flipped + cursor_height),
-                    (cursor_x + cursor_width, cursor_y_flipped + cursor_height),
-                )
-                
-                indices = ((0, 1, 2), (1, 2, 3))
-                
-                batch = batch_for_shader(shader, 'TRIS', {"pos": vertices}, indices=indices)
-                shader.bind()
-                shader.uniform_float("color", instance.cursor_color)
-                batch.draw(shader)
+                _draw_rect(cursor_x, cursor_y_flipped, cursor_width, line_height, instance.cursor_color)
         
-        if instance.mask and instance.mask[2] > 0 and instance.mask[3] > 0:
+        if clip is not None:
             blf.disable(instance.font_id, blf.CLIPPING)
 
-class KeyboardHandler(bpy.types.Operator):
-    bl_idname = "xwz.text_input_keyboard"
-    bl_label  = "Text Input Keyboard Handler"
-    
-    def invoke(self, context, event):
-        global _keyboard_handler_running
-        _keyboard_handler_running = True
-        context.window_manager.modal_handler_add(self)
+def handle_keyboard_event(context, event):
+    """Apply a key event to the focused text input.
+
+    Called by the input dispatcher for every non-pointer event; returns
+    {'RUNNING_MODAL'} when the event was consumed.
+    """
+    if _active_input_id is None:
+        return {'PASS_THROUGH'}
+    
+    active_input = None
+    for instance in _text_input_instances:
+        if instance.id == _active_input_id:
+            active_input = instance
+            break
+    
+    if not active_input:
+        return {'PASS_THROUGH'}
+    
+    if event.type in {'LEFTMOUSE', 'RIGHTMOUSE'} and event.value == 'PRESS':
+        return {'PASS_THROUGH'}
+    
+    if event.type == 'ESC' and event.value == 'PRESS':
+        active_input.blur()
         return {'RUNNING_MODAL'}
     
-    def modal(self, context, event):
-        global _active_input_id, _text_input_instances, _keyboard_handler_running
-        
-        if not _text_input_instances:
-            _keyboard_handler_running = False
-            return {'CANCELLED'}
-        
-        if _active_input_id is None:
-            return {'PASS_THROUGH'}
-        
-        active_input = None
-        for instance in _text_input_instances:
-            if instance.id == _active_input_id:
-                active_input = instance
-                break
-        
-        if not active_input:
-            return {'PASS_THROUGH'}
-        
-        if event.type in {'LEFTMOUSE', 'RIGHTMOUSE'} and event.value == 'PRESS':
-            return {'PASS_THROUGH'}
-        
-        if event.type == 'ESC' and event.value == 'PRESS':
+    if event.type == 'RET' and event.value == 'PRESS':
+        if event.shift:
+            active_input.insert_text('\n')
+        else:
             active_input.blur()
-            return {'RUNNING_MODAL'}
-        
-        if event.type == 'RET' and event.value == 'PRESS':
-            if event.shift:
-                active_input.insert_text('\n')
-            else:
-                active_input.blur()
-            return {'RUNNING_MODAL'}
-        
-        if event.type == 'BACK_SPACE' and event.value == 'PRESS':
-            active_input.backspace()
-            return {'RUNNING_MODAL'}
-        
-        if event.type == 'DEL' and event.value == 'PRESS':
-            active_input.delete()
-            return {'RUNNING_MODAL'}
-        
-        if event.type == 'LEFT_ARROW' and event.value == 'PRESS':
-            active_input.move_cursor_left(event.shift)
-            return {'RUNNING_MODAL'}
-        
-        if event.type == 'RIGHT_ARROW' and event.value == 'PRESS':
-            active_input.move_cursor_right(event.shift)
-            return {'RUNNING_MODAL'}
-        
-        if event.type == 'UP_ARROW' and event.value == 'PRESS':
-            active_input.move_cursor_up(event.shift)
-            return {'RUNNING_MODAL'}
-        
-        if event.type == 'DOWN_ARROW' and event.value == 'PRESS':
-            active_input.move_cursor_down(event.shift)
-            return {'RUNNING_MODAL'}
-        
-        if event.type == 'HOME' and event.value == 'PRESS':
-            if event.ctrl:
-                active_input.cursor_pos = 0
-            else:
-                lines = active_input.get_wrapped_lines()
-                line_idx, col = active_input.get_cursor_position_2d()
-                char_count = sum(len(lines[i]) + (1 if i < len(lines) - 1 else 0) for i in range(line_idx))
-                active_input.cursor_pos = char_count
-            
-            if not event.shift:
-                active_input.selection_start = None
-            return {'RUNNING_MODAL'}
-        
-        if event.type == 'END' and event.value == 'PRESS':
-            if event.ctrl:
-                active_input.cursor_pos = len(active_input.text)
-            else:
-                lines = active_input.get_wrapped_lines()
-                line_idx, col = active_input.get_cursor_position_2d()
-                char_count = sum(len(lines[i]) + (1 if i < len(lines) - 1 else 0) for i in range(line_idx))
-                active_input.cursor_pos = char_count + len(lines[line_idx])
-            
-            if not event.shift:
-                active_input.selection_start = None
-            return {'RUNNING_MODAL'}
-        
-        if event.type == 'A' and event.value == 'PRESS' and event.ctrl:
-            active_input.selection_start = 0
-            active_input.cursor_pos = len(active_input.text)
-            return {'RUNNING_MODAL'}
-        
-        if event.type == 'C' and event.value == 'PRESS' and event.ctrl:
-            if active_input.selection_start is not None:
-                start = min(active_input.cursor_pos, active_input.selection_start)
-                end = max(active_input.cursor_pos, active_input.selection_start)
-                selected_text = active_input.text[start:end]
-                context.window_manager.clipboard = selected_text
-            return {'RUNNING_MODAL'}
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'BACK_SPACE' and event.value == 'PRESS':
+        active_input.backspace()
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'DEL' and event.value == 'PRESS':
+        active_input.delete()
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'LEFT_ARROW' and event.value == 'PRESS':
+        active_input.move_cursor_left(event.shift)
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'RIGHT_ARROW' and event.value == 'PRESS':
+        active_input.move_cursor_right(event.shift)
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'UP_ARROW' and event.value == 'PRESS':
+        active_input.move_cursor_up(event.shift)
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'DOWN_ARROW' and event.value == 'PRESS':
+        active_input.move_cursor_down(event.shift)
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'HOME' and event.value == 'PRESS':
+        if event.ctrl:
+            active_input.cursor_pos = 0
+        else:
+            layout = active_input.get_line_layout()
+            line_idx, col = layout.locate(active_input.cursor_pos)
+            active_input.cursor_pos = layout.start(line_idx)
         
-        if event.type == 'X' and event.value == 'PRESS' and event.ctrl:
-            if active_input.selection_start is not None:
-                start = min(active_input.cursor_pos, active_input.selection_start)
-                end = max(active_input.cursor_pos, active_input.selection_start)
-                selected_text = active_input.text[start:end]
-                context.window_manager.clipboard = selected_text
-                active_input.delete_selection()
-            return {'RUNNING_MODAL'}
+        if not event.shift:
+            active_input.selection_start = None
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'END' and event.value == 'PRESS':
+        if event.ctrl:
+            active_input.cursor_pos = len(active_input.buffer)
+        else:
+            layout = active_input.get_line_layout()
+            line_idx, col = layout.locate(active_input.cursor_pos)
+            active_input.cursor_pos = layout.end(line_idx)
         
-        if event.type == 'V' and event.value == 'PRESS' and event.ctrl:
-            clipboard_text = context.window_manager.clipboard
-            if clipboard_text:
-                active_input.insert_text(clipboard_text)
+        if not event.shift:
+            active_input.selection_start = None
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'A' and event.value == 'PRESS' and event.ctrl:
+        active_input.selection_start = 0
+        active_input.cursor_pos = len(active_input.buffer)
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'C' and event.value == 'PRESS' and event.ctrl:
+        if active_input.selection_start is not None:
+            start = min(active_input.cursor_pos, active_input.selection_start)
+            end = max(active_input.cursor_pos, active_input.selection_start)
+            selected_text = active_input.buffer.slice(start, end)
+            context.window_manager.clipboard = selected_text
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'X' and event.value == 'PRESS' and event.ctrl:
+        if active_input.selection_start is not None:
+            start = min(active_input.cursor_pos, active_input.selection_start)
+            end = max(active_input.cursor_pos, active_input.selection_start)
+            selected_text = active_input.buffer.slice(start, end)
+            context.window_manager.clipboard = selected_text
+            active_input.delete_selection()
+        return {'RUNNING_MODAL'}
+    
+    if event.type == 'V' and event.value == 'PRESS' and event.ctrl:
+        clipboard_text = context.window_manager.clipboard
+        if clipboard_text:
+            active_input.insert_text(clipboard_text)
+        return {'RUNNING_MODAL'}
+    
+    if event.value == 'PRESS' and event.ascii:
+        if not event.ctrl and not event.alt:
+            active_input.insert_text(event.ascii)
             return {'RUNNING_MODAL'}
-        
-        if event.value == 'PRESS' and event.ascii:
-            if not event.ctrl and not event.alt:
-                active_input.insert_text(event.ascii)
-                return {'RUNNING_MODAL'}
-        
-        return {'PASS_THROUGH'}
+    
+    return {'PASS_THROUGH'}
 
 class CreateTextInputOP(bpy.types.Operator):
     bl_idname = "xwz.create_text_input"
@@ -542,7 +658,7 @@ class CreateTextInputOP(bpy.types.Operator):
     )
     
     def execute(self, context):
-        global _draw_handle, _text_input_instances, _keyboard_handler_running
+        global _draw_handle, _text_input_instances
         
         mask = None
         if self.mask_width > 0 and self.mask_height > 0:
@@ -572,11 +688,7 @@ class CreateTextInputOP(bpy.types.Operator):
         _text_input_instances.append(new_instance)
         
         if _draw_handle is None:
-            _draw_handle = bpy.types.SpaceView3D.draw_handler_add(
-                draw_all_text_inputs, (), 'WINDOW', 'POST_PIXEL')
-        
-        if not _keyboard_handler_running:
-            bpy.ops.xwz.text_input_keyboard('INVOKE_DEFAULT')
+            _draw_handle = add_draw_handler(draw_all_text_inputs)
         
         context.area.tag_redraw()
         self.report({'INFO'}, f"Created text input instance #{new_instance.id}")
@@ -603,7 +715,7 @@ class RemoveTextInputOP(bpy.types.Operator):
             return {'CANCELLED'}
         
         if not _text_input_instances and _draw_handle is not None:
-            bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
+            remove_draw_handler(_draw_handle)
             _draw_handle = None
         
         context.area.tag_redraw()
@@ -614,15 +726,14 @@ class ClearTextInputsOP(bpy.types.Operator):
     bl_label = "Clear All Text Inputs"
     
     def execute(self, context):
-        global _draw_handle, _text_input_instances, _active_input_id, _keyboard_handler_running, _next_input_id
+        global _draw_handle, _text_input_instances, _active_input_id, _next_input_id
         
         _text_input_instances.clear()
         _active_input_id = None
-        _keyboard_handler_running = False
         _next_input_id = 0
         
         if _draw_handle is not None:
-            bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
+            remove_draw_handler(_draw_handle)
             _draw_handle = None
         
         context.area.tag_redraw()
@@ -809,7 +920,6 @@ class UpdateTextInputOP(bpy.types.Operator):
         return {'CANCELLED'}
 
 def register():
-    bpy.utils.register_class(KeyboardHandler)
     bpy.utils.register_class(CreateTextInputOP)
     bpy.utils.register_class(RemoveTextInputOP)
     bpy.utils.register_class(ClearTextInputsOP)
@@ -820,18 +930,18 @@ def register():
     bpy.utils.register_class(UpdateTextInputOP)
 
 def unregister():
-    global _draw_handle, _text_input_instances, _active_input_id, _keyboard_handler_running, _next_input_id
+    global _draw_handle, _text_input_instances, _active_input_id, _next_input_id, _overlay_shader, _overlay_batch
     
     _text_input_instances.clear()
     _active_input_id = None
-    _keyboard_handler_running = False
     _next_input_id = 0
+    _overlay_shader = None
+    _overlay_batch = None
     
     if _draw_handle is not None:
-        bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
+        remove_draw_handler(_draw_handle)
         _draw_handle = None
     
-    bpy.utils.unregister_class(KeyboardHandler)
     bpy.utils.unregister_class(CreateTextInputOP)
     bpy.utils.unregister_class(RemoveTextInputOP)
     bpy.utils.unregister_class(ClearTextInputsOP)
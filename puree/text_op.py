@@ -11,11 +11,27 @@
 import bpy
 import blf
 import os
+import time
+from collections import OrderedDict
+
+from .draw_list import DrawList, culled
+from .space_config import get_target_region_size, request_redraw, add_draw_handler, remove_draw_handler
 
 _text_instances = []
 _draw_handle = None
+_draw_list = DrawList()
+
+TEXT_CACHE_SIZE = 4096
 
 class FontManager:
+    """Fonts from the addon's `fonts/` directory, loaded on first use.
+
+    Registering only lists the font files; `get_font_id` calls `blf.load`
+    the first time a font is asked for and caches the id after that.
+    `preload` schedules the theme's default font on a timer so the first
+    draw does not pay for it, and `release_unused` unloads the fonts the
+    current UI no longer references.
+    """
     _instance = None
     
     def __new__(cls):
@@ -28,43 +44,91 @@ class FontManager:
         if not self._initialized:
             self.fonts = {}
             self.font_ids = {}
-            self._load_fonts()
+            self._scan_fonts()
             self._initialized = True
     
-    def _load_fonts(self):
+    def _scan_fonts(self):
         from . import get_addon_root
         addon_fonts_path = os.path.join(get_addon_root(), "fonts")
         if os.path.exists(addon_fonts_path):
             for font_file in os.listdir(addon_fonts_path):
                 if font_file.lower().endswith(('.otf', '.ttf')):
-                    font_path = os.path.join(addon_fonts_path, font_file)
-                    try:
-                        font_id = blf.load(font_path)
-                        font_name = os.path.splitext(font_file)[0]
-                        self.fonts[font_name] = font_path
-                        self.font_ids[font_name] = font_id
-                    except Exception as e:
-                        print(f"Failed to load font {font_file}: {e}")
+                    font_name = os.path.splitext(font_file)[0]
+                    self.fonts[font_name] = os.path.join(addon_fonts_path, font_file)
+    
+    def _load_font(self, font_name):
+        font_path = self.fonts.get(font_name)
+        if font_path is None:
+            return 0
+        try:
+            font_id = blf.load(font_path)
+        except Exception as e:
+            print(f"Failed to load font {font_name}: {e}")
+            font_id = -1
+        if font_id < 0:
+            # Remembered as Blender's default font so it is not retried every draw
+            font_id = 0
+        self.font_ids[font_name] = font_id
+        return font_id
     
     def get_font_id(self, font_name):
-        return self.font_ids.get(font_name, 0)
+        font_id = self.font_ids.get(font_name)
+        if font_id is None:
+            font_id = self._load_font(font_name)
+        return font_id
     
     def get_available_fonts(self):
         return list(self.fonts.keys())
     
+    def get_loaded_fonts(self):
+        return list(self.font_ids.keys())
+    
+    def preload(self, font_name):
+        """Load `font_name` from a timer instead of on its first draw."""
+        if not font_name or font_name in self.font_ids or font_name not in self.fonts:
+            return
+        def load():
+            # Skip if the addon was unregistered before the timer fired
+            if FontManager._instance is self:
+                self.get_font_id(font_name)
+            return None
+        bpy.app.timers.register(load, first_interval=0.0)
+    
+    def release_unused(self, font_names):
+        """Unload every loaded font not in `font_names`."""
+        released = False
+        for font_name in list(self.font_ids):
+            if font_name in font_names:
+                continue
+            font_id = self.font_ids.pop(font_name)
+            released = True
+            if font_id <= 0:
+                continue
+            try:
+                blf.unload(self.fonts[font_name])
+            except Exception as e:
+                print(f"Failed to unload font {font_name} (path: {self.fonts[font_name]}): {e}")
+        if released:
+            # Ids of unloaded fonts get reused, so cached sizes would be stale.
+            text_metrics.clear()
+    
     def unload_fonts(self):
-        for font_name, font_path in self.fonts.items():
+        for font_name, font_id in self.font_ids.items():
+            if font_id <= 0:
+                continue
+            font_path = self.fonts[font_name]
             try:
                 blf.unload(font_path)
             except Exception as e:
                 print(f"Failed to unload font {font_name} (path: {font_path}): {e}")
         self.fonts.clear()
         self.font_ids.clear()
+        text_metrics.clear()
     
     def reload_fonts(self):
         """Reload all fonts - used when addon is re-enabled without Blender restart"""
         self.unload_fonts()
-        self._load_fonts()
+        self._scan_fonts()
     
     @classmethod
     def reset_instance(cls):
@@ -76,6 +140,101 @@ class FontManager:
 
 font_manager = FontManager()
 
+class TextMetrics:
+    """Shared text measurement for drawing, alignment and wrapping.
+
+    `measure` keeps a bounded LRU of (font_id, size, text) -> (width,
+    height, ascent), so a label that does not change is measured once
+    instead of on every redraw. `advance` keeps a per-glyph advance table
+    per (font_id, size) for code that grows a line one character at a
+    time. Both go through blf only on a miss; the counters feed the debug
+    panel.
+    """
+    _instance = None
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self._entries    = OrderedDict()
+            self._advances   = {}
+            self._ascents    = {}
+            self.hits        = 0
+            self.misses      = 0
+            self.miss_time   = 0.0
+            self.draw_time   = 0.0
+            self.draw_calls  = 0
+            self._initialized = True
+    
+    def measure(self, font_id, size, text):
+        key = (font_id, size, text)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        
+        start = time.perf_counter()
+        blf.size(font_id, size)
+        width, height = blf.dimensions(font_id, text)
+        entry = (width, height, self.ascent(font_id, size))
+        self.miss_time += time.perf_counter() - start
+        self.misses += 1
+        
+        self._entries[key] = entry
+        if len(self._entries) > TEXT_CACHE_SIZE:
+            self._entries.popitem(last=False)
+        return entry
+    
+    def width(self, font_id, size, text):
+        return self.measure(font_id, size, text)[0]
+    
+    def ascent(self, font_id, size):
+        key = (font_id, size)
+        ascent = self._ascents.get(key)
+        if ascent is None:
+            blf.size(font_id, size)
+            ascent = self._ascents[key] = blf.dimensions(font_id, "H")[1]
+        return ascent
+    
+    def advance(self, font_id, size, char):
+        table = self._advances.get((font_id, size))
+        if table is None:
+            table = self._advances[(font_id, size)] = {}
+        advance = table.get(char)
+        if advance is None:
+            blf.size(font_id, size)
+            advance = table[char] = blf.dimensions(font_id, char)[0]
+        return advance
+    
+    def record_draw(self, elapsed):
+        self.draw_time += elapsed
+        self.draw_calls += 1
+    
+    def stats(self):
+        lookups = self.hits + self.misses
+        miss_cost = self.miss_time / self.misses if self.misses else 0.0
+        return {
+            'entries'     : len(self._entries),
+            'hit_rate'    : self.hits / lookups if lookups else 0.0,
+            'saved_ms'    : self.hits * miss_cost * 1000.0,
+            'draw_ms'     : self.draw_time / self.draw_calls * 1000.0 if self.draw_calls else 0.0,
+        }
+    
+    def clear(self):
+        # Font ids are reused after a reload, so cached sizes would be stale.
+        self._entries.clear()
+        self._advances.clear()
+        self._ascents.clear()
+        self.hits = self.misses = self.draw_calls = 0
+        self.miss_time = self.draw_time = 0.0
+
+text_metrics = TextMetrics()
+
 class TextInstance:
     def __init__(self, container_id, text="Hello", font_name=None, size=20, pos=[50, 50], color=[1,1,1,1], mask=None, align_h='LEFT', align_v='CENTER'):
         self.container_id = container_id
@@ -89,6 +248,7 @@ class TextInstance:
         self.mask      = mask
         self.align_h   = align_h
         self.align_v   = align_v
+        _draw_list.touch()
     def update_text(self, new_text):
         self.text = new_text
         self._trigger_redraw()
@@ -129,62 +289,69 @@ class TextInstance:
             self.align_v = align_v
         self._trigger_redraw()
     def _trigger_redraw(self):
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
-
-def draw_all_text():
-    viewport_height = 0
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            for region in area.regions:
-                if region.type == 'WINDOW':
-                    viewport_height = region.height
-                    break
-            break
-    
-    for instance in _text_instances:
-        # Set up clipping if mask exists
-        if instance.mask and instance.mask[2] > 0 and instance.mask[3] > 0:
-            xmin = instance.mask[0]
-            ymin = viewport_height - instance.mask[1] - instance.mask[3]
-            xmax = instance.mask[0] + instance.mask[2]
-            ymax = viewport_height - instance.mask[1]
-            blf.clipping(instance.font_id, xmin, ymin, xmax, ymax)
-            blf.enable(instance.font_id, blf.CLIPPING)
+        _draw_list.touch()
+        request_redraw()
+    def draw_record(self, region_size):
+        """(x, y, clip) in region coordinates, or None when nothing shows."""
+        from .parser_op import content_placement
+        offset_x, offset_y, mask, clip = content_placement(self.container_id, self.mask)
+        if clip is not None and (clip[0] >= clip[2] or clip[1] >= clip[3]):
+            return None
         
-        blf.size(instance.font_id, instance.size)
-        text_width, text_height = blf.dimensions(instance.font_id, instance.text)
+        text_width, text_height, _ = text_metrics.measure(self.font_id, self.size, self.text)
         
-        x_pos = instance.position[0]
-        y_pos = instance.position[1]
+        x_pos = self.position[0] - offset_x
+        y_pos = self.position[1] - offset_y
         
-        if instance.mask and instance.mask[2] > 0 and instance.mask[3] > 0:
-            container_width = instance.mask[2]
-            container_height = instance.mask[3]
+        if mask and mask[2] > 0 and mask[3] > 0:
+            container_width = mask[2]
+            container_height = mask[3]
             
-            if instance.align_h == 'LEFT':
-                x_pos = instance.mask[0]
-            elif instance.align_h == 'CENTER':
-                x_pos = instance.mask[0] + (container_width - text_width) / 2
-            elif instance.align_h == 'RIGHT':
-                x_pos = instance.mask[0] + container_width - text_width
+            if self.align_h == 'LEFT':
+                x_pos = mask[0]
+            elif self.align_h == 'CENTER':
+                x_pos = mask[0] + (container_width - text_width) / 2
+            elif self.align_h == 'RIGHT':
+                x_pos = mask[0] + container_width - text_width
             
-            if instance.align_v == 'TOP':
-                y_pos = instance.mask[1]
-            elif instance.align_v == 'CENTER':
-                y_pos = instance.mask[1] + (container_height - text_height) / 2
-            elif instance.align_v == 'BOTTOM':
-                y_pos = instance.mask[1] + container_height - text_height
+            if self.align_v == 'TOP':
+                y_pos = mask[1]
+            elif self.align_v == 'CENTER':
+                y_pos = mask[1] + (container_height - text_height) / 2
+            elif self.align_v == 'BOTTOM':
+                y_pos = mask[1] + container_height - text_height
+        
+        if culled((x_pos, y_pos, x_pos + text_width, y_pos + text_height), clip, region_size):
+            return None
+        
+        # Clip to the mask and whatever the clipping ancestors leave visible
+        viewport_height = region_size[1]
+        if clip is not None:
+            clip = (clip[0], viewport_height - clip[3], clip[2], viewport_height - clip[1])
         
-        flipped_y = viewport_height - y_pos - text_height
+        return x_pos, viewport_height - y_pos - text_height, clip
+
+def draw_all_text():
+    start_time  = time.perf_counter()
+    region_size = get_target_region_size()
+    
+    for instance, record in _draw_list.get(_text_instances, region_size, TextInstance.draw_record):
+        x_pos, y_pos, clip = record
+        font_id = instance.font_id
         
-        blf.position(instance.font_id, x_pos, flipped_y, 0)
-        blf.color(instance.font_id, *instance.color)
-        blf.draw(instance.font_id, instance.text)
+        if clip is not None:
+            blf.clipping(font_id, *clip)
+            blf.enable(font_id, blf.CLIPPING)
         
-        if instance.mask and instance.mask[2] > 0 and instance.mask[3] > 0:
-            blf.disable(instance.font_id, blf.CLIPPING)
+        blf.size(font_id, instance.size)
+        blf.position(font_id, x_pos, y_pos, 0)
+        blf.color(font_id, *instance.color)
+        blf.draw(font_id, instance.text)
+        
+        if clip is not None:
+            blf.disable(font_id, blf.CLIPPING)
+    
+    text_metrics.record_draw(time.perf_counter() - start_time)
 
 class DrawTextOP(bpy.types.Operator):
     bl_idname = "xwz.draw_text"
@@ -237,8 +404,7 @@ class DrawTextOP(bpy.types.Operator):
         _text_instances.append(new_instance)
         
         if _draw_handle is None:
-            _draw_handle = bpy.types.SpaceView3D.draw_handler_add(
-                draw_all_text, (), 'WINDOW', 'POST_PIXEL')
+            _draw_handle = add_draw_handler(draw_all_text)
         
         context.area.tag_redraw()
         self.report({'INFO'}, f"Added text instance #{new_instance.id} with font {self.font_name}")
@@ -263,7 +429,7 @@ class RemoveTextOP(bpy.types.Operator):
             return {'CANCELLED'}
         
         if not _text_instances and _draw_handle is not None:
-            bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
+            remove_draw_handler(_draw_handle)
             _draw_handle = None
         
         context.area.tag_redraw()
@@ -279,7 +445,7 @@ class ClearTextOP(bpy.types.Operator):
         _text_instances.clear()
         
         if _draw_handle is not None:
-            bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
+            remove_draw_handler(_draw_handle)
             _draw_handle = None
         
         context.area.tag_redraw()
@@ -394,7 +560,7 @@ def unregister():
     _text_instances.clear()
     
     if _draw_handle is not None:
-        bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
+        remove_draw_handler(_draw_handle)
         _draw_handle = None
     
     FontManager.reset_instance()
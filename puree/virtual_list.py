@@ -0,0 +1,234 @@
+# Created by XWZ
+# ◕‿◕ Distributed for free at:
+# https://github.com/nicolaiprodromov/puree
+# ╔═════════════════════════════════╗
+# ║  ██   ██  ██      ██  ████████  ║
+# ║   ██ ██   ██  ██  ██       ██   ║
+# ║    ███    ██  ██  ██     ██     ║
+# ║   ██ ██   ██  ██  ██   ██       ║
+# ║  ██   ██   ████████   ████████  ║
+# ╚═════════════════════════════════╝
+import math
+
+from .components.container import Container
+from .box_store import SCROLLING_OVERFLOW
+
+# Rows kept bound above and below the visible ones
+OVERSCAN = 4
+
+class VirtualList():
+    """A scroll container showing a data source through a fixed pool of rows.
+
+    The pool holds enough copies of the row component to cover the canvas
+    plus `OVERSCAN` rows on each side, whatever the size of the data. Rows
+    are laid out once at the top of the list; scrolling within the bound
+    window only translates them, and when the window moves past a row the
+    pool is rebound to the next items and shifted by a whole number of rows
+    through the box store, so layout, flattening and text extraction only
+    ever see the pool.
+
+    A rebind runs no layout pass: row boxes stay where they are, the new
+    labels go straight to the rows' text instances and rows past the end
+    of the data are hidden through the box store flags. Only a row that
+    comes back into view, or text appearing where there was none, marks
+    the rows dirty for a full sync.
+    """
+    def __init__(self, container, rows, row_height, overscan=OVERSCAN):
+        self.container  = container
+        self.rows       = rows
+        self.row_height = row_height
+        self.overscan   = overscan
+        self.source     = None
+        self.bind       = None
+        self.items      = []
+        self.first      = -1
+        self.box_store  = None
+        self._display   = [row._style.display for row in rows]
+        self._slots     = {}
+        self._nodes     = {}
+        self._labels    = []
+        for slot, row in enumerate(rows):
+            label = None
+            for node in _walk(row):
+                self._slots[node.id] = slot
+                self._nodes[node.id] = node
+                if label is None and node.text != '':
+                    label = node
+            self._labels.append(label or row)
+        container.scroll.append(self._on_scroll)
+        self._update(0.0, force=True)
+
+    @classmethod
+    def materialize(cls, container, canvas_height):
+        """Fill `container` with a pool cloned from its template row."""
+        if not container.children:
+            return None
+        template   = container.children[0]
+        row_height = _px(template._style.height)
+        if row_height <= 0.0:
+            print(f"Virtual list '{container.id}' needs a fixed px height on its row component")
+            return None
+
+        overflow = getattr(container._style.overflow, 'name', container._style.overflow)
+        if overflow not in SCROLLING_OVERFLOW:
+            container.style.overflow = 'SCROLL'
+
+        pool_size = math.ceil(canvas_height / row_height) + 1 + 2 * OVERSCAN
+        rows = [template]
+        for slot in range(1, pool_size):
+            row_id = f"{container.id}_row{slot}"
+            rows.append(clone_subtree(template, template.id, row_id, container))
+        container.children = rows
+        return cls(container, rows, row_height)
+
+    def set_source(self, source, bind=None):
+        """Show `source`, a sequence or a callable returning one.
+
+        `bind(row, item, index)` fills a row container for an item; by
+        default the first row container with text shows `str(item)`.
+        """
+        self.source = source
+        if bind is not None:
+            self.bind = bind
+        self.refresh()
+
+    def refresh(self):
+        """Re-read the source and rebind the visible rows."""
+        source = self.source
+        items = source() if callable(source) else source
+        self.items = items if items is not None else []
+        self._update(self.container._scroll_value, force=True)
+
+    def item_for(self, container_id):
+        """(index, item) shown by the row a container belongs to, or None."""
+        slot = self._slots.get(container_id)
+        if slot is None:
+            return None
+        index = self.first + slot
+        if index >= len(self.items):
+            return None
+        return index, self.items[index]
+
+    def attach(self, box_store):
+        self.box_store = box_store
+        self._write_content()
+
+    def _on_scroll(self, container):
+        self._update(container['_scroll_value'])
+
+    def _update(self, scroll_value, force=False):
+        count = len(self.items)
+        first = int(scroll_value // self.row_height) - self.overscan
+        first = max(0, min(first, count - len(self.rows)))
+        if first == self.first and not force:
+            return
+        self.first = first
+
+        hidden = []
+        relayout = False
+        for slot, row in enumerate(self.rows):
+            index = first + slot
+            if index < count:
+                if self.bind is None:
+                    self._labels[slot].text = str(self.items[index])
+                else:
+                    self.bind(row, self.items[index], index)
+                display = self._display[slot]
+            else:
+                display = 'NONE'
+            if row._style.display != display:
+                row.style.display = display
+                # A row laid out hidden has no box to show it in
+                if display == 'NONE':
+                    hidden.append(row)
+                else:
+                    row.mark_dirty()
+                    relayout = True
+        if self._write_content() and not relayout:
+            self._apply(hidden)
+
+    def _write_content(self):
+        box_store = self.box_store
+        index = self.container._index
+        if box_store is None or not 0 <= index < len(box_store):
+            return False
+        box_store.set_content(index, self.first * self.row_height, len(self.items) * self.row_height)
+        return True
+
+    def _apply(self, hidden):
+        from . import parser_op, hit_op, text_op
+        from .space_config import request_redraw
+
+        box_store = self.box_store
+        if hidden:
+            box_store.update_attributes()
+            # The container buffer is repacked from the flattened rows
+            flat = parser_op._container_json_data
+            for row in hidden:
+                if row._index < len(flat):
+                    flat[row._index]['display'] = False
+        box_store.apply_content(self.container._index)
+        hit_op.sync_box_store(box_store, attributes=bool(hidden))
+
+        shown = set()
+        for instance in text_op._text_instances:
+            node = self._nodes.get(instance.container_id)
+            if node is None:
+                continue
+            shown.add(node.id)
+            if instance.text != node.text:
+                instance.update_text(node.text)
+        for node_id, node in self._nodes.items():
+            if node.text != '' and node_id not in shown:
+                # Text instances are only made by the extractors
+                self.rows[self._slots[node_id]].mark_dirty()
+        request_redraw()
+
+def clone_subtree(container, old_prefix, new_prefix, parent):
+    copy = Container()
+    copy.id       = new_prefix + container.id[len(old_prefix):]
+    copy.parent   = parent
+    copy.data     = container.data
+    copy.img      = container.img
+    copy.text     = container.text
+    copy.font     = container.font
+    copy.virtual  = container.virtual
+    copy.layer    = container.layer
+    copy.passive  = container.passive
+    copy.click    = list(container.click)
+    copy.toggle   = list(container.toggle)
+    copy.scroll   = list(container.scroll)
+    copy.hover    = list(container.hover)
+    copy.hoverout = list(container.hoverout)
+    style = container._style
+    copy.style = style if getattr(style, '_shared', False) else style.copy()
+    copy.children = [clone_subtree(child, old_prefix, new_prefix, copy) for child in container.children]
+    return copy
+
+def find_virtual_containers(container):
+    found = []
+    stack = [container]
+    while stack:
+        node = stack.pop()
+        if node.virtual:
+            found.append(node)
+        stack.extend(reversed(node.children))
+    return found
+
+def _walk(container):
+    stack = [container]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.children))
+
+def _px(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    value = str(value).strip().lower()
+    if not value.endswith('px'):
+        return 0.0
+    try:
+        return float(value[:-2])
+    except ValueError:
+        return 0.0